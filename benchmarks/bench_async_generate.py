@@ -0,0 +1,103 @@
+"""동기 vs 비동기 SQL 생성 경로의 동시성 벤치마크.
+
+실제 LLM 대신 고정 지연을 가지는 가짜 LLM을 사용합니다. 동기 경로는 Starlette의
+기본 스레드풀(40 슬롯)에서 ``execute``가 실행되는 상황을, 비동기 경로는
+``async def`` 라우트에서 ``aexecute``를 await하는 상황을 재현합니다.
+
+    PYTHONPATH=src python benchmarks/bench_async_generate.py --requests 400 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from uuid import UUID
+
+from agent.application.use_cases.generate_sql import GenerateSQLRequest, GenerateSQLUseCase
+from agent.domain.entities.query_log import QueryLog
+from agent.domain.repositories.query_log_repository import QueryLogRepository
+from agent.domain.services.sql_generator import SQLGenerator
+
+STARLETTE_THREADPOOL_SIZE = 40
+
+
+class FakeLLMGenerator(SQLGenerator):
+    """고정 지연 후 SQL을 반환하는 가짜 LLM."""
+
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        time.sleep(self._latency)
+        return "SELECT 1"
+
+    async def agenerate(self, user_query: str, schema_context: str) -> str:
+        await asyncio.sleep(self._latency)
+        return "SELECT 1"
+
+
+class InMemoryQueryLogRepository(QueryLogRepository):
+    def __init__(self):
+        self._logs: dict[UUID, QueryLog] = {}
+
+    def save(self, query_log: QueryLog) -> QueryLog:
+        self._logs[query_log.id] = query_log
+        return query_log
+
+    async def asave(self, query_log: QueryLog) -> QueryLog:
+        return self.save(query_log)
+
+    def find_by_id(self, id: UUID) -> Optional[QueryLog]:
+        return self._logs.get(id)
+
+    def find_page(self, limit, after=None, status=None, created_from=None, created_to=None) -> list[QueryLog]:
+        logs = sorted(self._logs.values(), key=lambda q: (q.created_at, str(q.id)), reverse=True)
+        if after is not None:
+            logs = [q for q in logs if (q.created_at, str(q.id)) < (after[0], str(after[1]))]
+        return logs[:limit]
+
+    def delete(self, id: UUID) -> bool:
+        return self._logs.pop(id, None) is not None
+
+
+def _use_case(latency: float) -> GenerateSQLUseCase:
+    return GenerateSQLUseCase(
+        query_log_repository=InMemoryQueryLogRepository(),
+        sql_generator=FakeLLMGenerator(latency),
+    )
+
+
+def bench_sync(requests: int, latency: float) -> float:
+    use_case = _use_case(latency)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=STARLETTE_THREADPOOL_SIZE) as pool:
+        list(pool.map(lambda i: use_case.execute(GenerateSQLRequest(user_query=f"q{i}")), range(requests)))
+    return time.perf_counter() - start
+
+
+async def bench_async(requests: int, latency: float) -> float:
+    use_case = _use_case(latency)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(use_case.aexecute(GenerateSQLRequest(user_query=f"q{i}")) for i in range(requests))
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 지연 (초)")
+    args = parser.parse_args()
+
+    sync_elapsed = bench_sync(args.requests, args.latency)
+    async_elapsed = asyncio.run(bench_async(args.requests, args.latency))
+
+    print(f"requests={args.requests} llm_latency={args.latency}s")
+    print(f"sync  (threadpool={STARLETTE_THREADPOOL_SIZE}): {sync_elapsed:.2f}s  {args.requests / sync_elapsed:.1f} req/s")
+    print(f"async (event loop):     {async_elapsed:.2f}s  {args.requests / async_elapsed:.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
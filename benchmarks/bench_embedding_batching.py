@@ -0,0 +1,102 @@
+"""단건 인코딩 vs 마이크로 배치 인코딩의 동시성 벤치마크.
+
+동시 클라이언트 수(기본 1, 16, 64)별로 질의 임베딩 지연(p50/p99)과 처리량을
+측정합니다. 기본값은 배치 크기와 무관한 고정 오버헤드 + 항목당 비용을 가지는
+시뮬레이션 모델이며, ``--real``을 주면 ``EmbeddingService``의 실제 모델을 사용합니다.
+모델 호출은 한 번에 하나씩만 실행됩니다 (CPU를 모두 쓰는 추론을 재현).
+
+    PYTHONPATH=src python benchmarks/bench_embedding_batching.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+from agent.infrastructure.vectorstore.batching_embedder import BatchingEmbedder
+
+
+class SimulatedModel:
+    """호출당 고정 비용 + 항목당 비용을 가지는 가짜 임베딩 모델."""
+
+    def __init__(self, overhead_ms: float, per_item_ms: float, dim: int = 384):
+        self._overhead = overhead_ms / 1000
+        self._per_item = per_item_ms / 1000
+        self._dim = dim
+        self._lock = threading.Lock()
+
+    def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            time.sleep(self._overhead + self._per_item * len(texts))
+        return [[float(len(t))] * self._dim for t in texts]
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run(embed_one, clients: int, requests: int) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    counter = iter(range(requests))
+
+    async def client() -> None:
+        for i in counter:
+            start = time.perf_counter()
+            await embed_one(f"question number {i}")
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return latencies, time.perf_counter() - start
+
+
+def _report(label: str, clients: int, latencies: list[float], elapsed: float) -> None:
+    print(
+        f"{label:9s} clients={clients:3d}  p50={statistics.median(latencies) * 1000:7.2f}ms  "
+        f"p99={_percentile(latencies, 0.99) * 1000:7.2f}ms  {len(latencies) / elapsed:8.0f} emb/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--overhead-ms", type=float, default=4.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.15)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--real", action="store_true", help="sentence-transformers 모델 사용")
+    args = parser.parse_args()
+
+    if args.real:
+        from agent.infrastructure.vectorstore.embedding_service import get_embedding_service
+
+        service = get_embedding_service()
+        service.warmup()
+        model_lock = threading.Lock()
+
+        def encode_batch(texts: list[str]) -> list[list[float]]:
+            with model_lock:
+                return service.embed_batch(texts)
+    else:
+        encode_batch = SimulatedModel(args.overhead_ms, args.per_item_ms).encode_batch
+
+    batcher = BatchingEmbedder(encode_batch, max_batch_size=args.max_batch, max_wait_ms=args.max_wait_ms)
+
+    async def unbatched(text: str) -> list[float]:
+        return (await asyncio.to_thread(encode_batch, [text]))[0]
+
+    for clients in args.clients:
+        latencies, elapsed = await _run(unbatched, clients, args.requests)
+        _report("single", clients, latencies, elapsed)
+        latencies, elapsed = await _run(batcher.aembed, clients, args.requests)
+        _report("batched", clients, latencies, elapsed)
+
+    print(f"batcher stats: {batcher.stats()}")
+    batcher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""임베딩 모델 통합 전/후의 메모리(RSS)와 질의 임베딩 캐시 적중률 비교.
+
+- legacy: Chroma 기본 임베딩 모델(ONNX)로 ``query_texts`` 검색 + 시맨틱 캐시용
+  ``SentenceTransformer``가 별도로 로드되는 이전 구성 (프로세스당 모델 2개)
+- unified: ``EmbeddingService`` 하나로 문서/질의를 모두 임베딩하고
+  질의 임베딩을 LRU 캐시로 재사용하는 현재 구성
+
+각 모드는 별도 프로세스에서 실행되어 RSS가 서로 섞이지 않습니다.
+
+    PYTHONPATH=src python benchmarks/bench_embedding_memory.py --tables 200 --queries 2000
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+QUESTIONS = [
+    "how many users signed up last month",
+    "total revenue per product category",
+    "top 10 customers by order count",
+    "average order value by country",
+    "list orders that have not shipped",
+    "which products are out of stock",
+    "monthly active users this year",
+    "refunds issued in the last week",
+]
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _documents(n: int) -> tuple[list[str], list[str]]:
+    ids = [f"table_{i:05d}" for i in range(n)]
+    docs = [
+        f"Table: {name}. Columns: id (INTEGER PK), name (VARCHAR), amount (FLOAT), created_at (DATETIME)"
+        for name in ids
+    ]
+    return ids, docs
+
+
+def _workload(n: int) -> list[str]:
+    # 같은 질문의 대소문자/공백/문장부호 변형이 섞인 트래픽
+    rng = random.Random(0)
+    variants = []
+    for _ in range(n):
+        q = rng.choice(QUESTIONS)
+        variants.append(rng.choice([q, q.upper(), f"  {q}?", q.replace(" ", "  ")]))
+    return variants
+
+
+def _run_legacy(tables: int, queries: int) -> dict:
+    import chromadb
+    from sentence_transformers import SentenceTransformer
+
+    baseline = _rss_mb()
+    client = chromadb.PersistentClient(path=tempfile.mkdtemp())
+    collection = client.get_or_create_collection("bench_legacy")
+    ids, docs = _documents(tables)
+    collection.upsert(ids=ids, documents=docs)
+    # 시맨틱 캐시가 임포트하던 두 번째 모델
+    model = SentenceTransformer("all-MiniLM-L6-v2")
+    model.encode("warmup")
+    loaded = _rss_mb()
+
+    start = time.perf_counter()
+    for q in _workload(queries):
+        collection.query(query_texts=[q], n_results=5)
+        model.encode(q)
+    elapsed = time.perf_counter() - start
+
+    return {"baseline_mb": baseline, "loaded_mb": loaded, "final_mb": _rss_mb(), "elapsed_s": elapsed}
+
+
+def _run_unified(tables: int, queries: int) -> dict:
+    import chromadb
+
+    from agent.infrastructure.vectorstore.embedding_cache import get_query_embedding_cache
+    from agent.infrastructure.vectorstore.embedding_service import get_embedding_service
+
+    baseline = _rss_mb()
+    client = chromadb.PersistentClient(path=tempfile.mkdtemp())
+    collection = client.get_or_create_collection("bench_unified", embedding_function=None)
+    embedder = get_embedding_service()
+    embedder.warmup()
+    ids, docs = _documents(tables)
+    collection.upsert(ids=ids, documents=docs, embeddings=embedder.embed_batch(docs))
+    loaded = _rss_mb()
+
+    start = time.perf_counter()
+    for q in _workload(queries):
+        # 검색과 시맨틱 캐시가 같은 캐시된 질의 임베딩을 공유
+        collection.query(query_embeddings=[embedder.embed_query(q)], n_results=5)
+        embedder.embed_query(q)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "baseline_mb": baseline,
+        "loaded_mb": loaded,
+        "final_mb": _rss_mb(),
+        "elapsed_s": elapsed,
+        "query_cache": get_query_embedding_cache().stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--mode", choices=["legacy", "unified"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        runner = _run_legacy if args.mode == "legacy" else _run_unified
+        print(json.dumps(runner(args.tables, args.queries)))
+        return
+
+    for mode in ("legacy", "unified"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--tables", str(args.tables), "--queries", str(args.queries)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:8s} rss baseline={result['baseline_mb']:.0f}MB loaded={result['loaded_mb']:.0f}MB "
+            f"final={result['final_mb']:.0f}MB  {args.queries} queries in {result['elapsed_s']:.2f}s"
+        )
+        if "query_cache" in result:
+            stats = result["query_cache"]
+            print(f"{'':8s} query embedding cache hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']}")
+
+
+if __name__ == "__main__":
+    main()
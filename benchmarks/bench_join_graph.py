@@ -0,0 +1,113 @@
+"""FK 조인 그래프 구축/증분 갱신/조인 경로 조회 지연 측정.
+
+DB 없이 ``TableInfoDTO``로 ``--tables``개 테이블과 ``--fks``개 FK를 가진 합성 스키마를
+만듭니다. FK의 ``--hub-share`` 비율은 소수의 허브 테이블(users, accounts 같은)을 참조해
+실제 스키마처럼 차수가 한쪽으로 쏠리게 합니다. 조회는 검색 결과를 흉내 낸 ``--retrieved``개
+테이블 묶음으로 측정합니다.
+
+- near: 한 테이블의 ``max_hops`` 이내 이웃에서 고른 묶음 (대부분 연결됨)
+- random: 전체에서 무작위로 고른 묶음 (경로가 없어 탐색 한도까지 확장하는 최악에 가까운 경우)
+
+    PYTHONPATH=src python benchmarks/bench_join_graph.py --tables 10000 --fks 50000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from agent.infrastructure.database.join_graph import JoinGraph
+from agent.presentation.api.schemas import ColumnInfoDTO, TableInfoDTO
+
+
+def _table(name: str, targets: list[str]) -> TableInfoDTO:
+    columns = [ColumnInfoDTO(name="id", type="INTEGER", nullable=False, primary_key=True)]
+    columns += [
+        ColumnInfoDTO(name=f"{target}_id_{i}", type="INTEGER", nullable=True, primary_key=False,
+                      foreign_key=f"{target}.id")
+        for i, target in enumerate(targets)
+    ]
+    return TableInfoDTO(name=name, columns=columns)
+
+
+def _schema(tables: int, fks: int, hubs: int, hub_share: float, rng: random.Random) -> list[TableInfoDTO]:
+    names = [f"t{i}" for i in range(tables)]
+    targets: dict[str, list[str]] = {name: [] for name in names}
+    for _ in range(fks):
+        source = rng.choice(names)
+        target = rng.choice(names[:hubs]) if rng.random() < hub_share else rng.choice(names)
+        targets[source].append(target)
+    return [_table(name, targets[name]) for name in names]
+
+
+def _near(graph: JoinGraph, size: int, hops: int, rng: random.Random) -> list[str]:
+    start = rng.choice(graph.table_names())
+    picked, frontier = [start], [start]
+    for _ in range(hops):
+        frontier = [n for node in frontier for n in graph.neighbors(node)][:200]
+        if not frontier:
+            break
+        picked.append(rng.choice(frontier))
+    return list(dict.fromkeys(picked))[:size]
+
+
+def _measure(graph: JoinGraph, samples: list[list[str]]) -> tuple[list[float], float, float]:
+    timings, bridges, connected = [], 0, 0
+    for tables in samples:
+        start = time.perf_counter()
+        plan = graph.plan(tables)
+        timings.append((time.perf_counter() - start) * 1000)
+        bridges += len(plan.bridges)
+        connected += not plan.unreachable
+    return timings, bridges / len(samples), connected / len(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=10_000)
+    parser.add_argument("--fks", type=int, default=50_000)
+    parser.add_argument("--hubs", type=int, default=50)
+    parser.add_argument("--hub-share", type=float, default=0.3)
+    parser.add_argument("--retrieved", type=int, default=5)
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    infos = _schema(args.tables, args.fks, args.hubs, args.hub_share, rng)
+    graph = JoinGraph()
+
+    start = time.perf_counter()
+    for info in infos:
+        graph.upsert(info)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # DDL 한 번에 해당하는 증분 갱신 (FK가 있는 테이블 재등록)
+    updates = rng.sample(infos, min(1000, len(infos)))
+    start = time.perf_counter()
+    for info in updates:
+        graph.upsert(info)
+    upsert_us = (time.perf_counter() - start) * 1_000_000 / len(updates)
+
+    stats = graph.stats()
+    print(
+        f"tables={stats['tables']} fks={stats['foreign_keys']} build={build_ms:.0f} ms "
+        f"upsert={upsert_us:.1f} us/table max_hops={graph._max_hops}"
+    )
+    print(f"{'lookup':<8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'bridges':>9}{'joined':>8}")
+
+    cases = {
+        "near": [_near(graph, args.retrieved, graph._max_hops, rng) for _ in range(args.samples)],
+        "random": [rng.sample(graph.table_names(), args.retrieved) for _ in range(args.samples)],
+    }
+    for label, samples in cases.items():
+        timings, bridges, connected = _measure(graph, samples)
+        percentiles = statistics.quantiles(timings, n=100)
+        print(
+            f"{label:<8}{statistics.median(timings):9.3f}{percentiles[94]:9.3f}{percentiles[98]:9.3f}"
+            f"{max(timings):9.3f}{bridges:9.2f}{connected:8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""스키마 검색 방식별 recall@k와 지연 비교: 렉시컬(BM25) / 벡터 / 하이브리드(RRF).
+
+핵심 업무 테이블 12개와 ``--filler``개의 잡음 테이블로 합성 스키마를 만들고, 정답 테이블이
+표시된 질문 세트로 recall@k(정답 테이블 중 상위 k에 든 비율)와 질문당 검색 지연을 잽니다.
+질문 세트에는 식별자를 그대로 쓰는 질문과, 동의어/한국어처럼 식별자와 겹치지 않는 질문이
+섞여 있습니다. "skip"은 렉시컬 결과만으로 충분해 질의 임베딩을 생략한 질문 비율입니다.
+
+벡터/하이브리드는 임시 ChromaDB에 실제 임베딩이 필요하므로 sentence-transformers가 있을
+때만 측정합니다.
+
+    PYTHONPATH=src python benchmarks/bench_lexical_retrieval.py --filler 500 --top-k 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.config import settings
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.vectorstore.lexical_index import SchemaLexicalIndex
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache
+
+_CORE_TABLES = [
+    "customers (id INTEGER PRIMARY KEY, name TEXT, email TEXT, city TEXT, country TEXT, signup_date DATE)",
+    "products (id INTEGER PRIMARY KEY, name TEXT, category_id INTEGER REFERENCES categories(id), "
+    "unit_price NUMERIC, discontinued INTEGER)",
+    "categories (id INTEGER PRIMARY KEY, name TEXT, parent_id INTEGER)",
+    "orders (id INTEGER PRIMARY KEY, customer_id INTEGER REFERENCES customers(id), "
+    "employee_id INTEGER REFERENCES employees(id), ordered_at DATETIME, status TEXT, shipping_city TEXT)",
+    "order_items (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), "
+    "product_id INTEGER REFERENCES products(id), quantity INTEGER, unit_price NUMERIC, discount NUMERIC)",
+    "employees (id INTEGER PRIMARY KEY, first_name TEXT, last_name TEXT, title TEXT, hire_date DATE, "
+    "manager_id INTEGER)",
+    "suppliers (id INTEGER PRIMARY KEY, company_name TEXT, contact_name TEXT, country TEXT)",
+    "inventory (id INTEGER PRIMARY KEY, product_id INTEGER REFERENCES products(id), "
+    "warehouse_id INTEGER REFERENCES warehouses(id), on_hand INTEGER, reorder_level INTEGER)",
+    "warehouses (id INTEGER PRIMARY KEY, name TEXT, city TEXT, capacity INTEGER)",
+    "shipments (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), carrier TEXT, "
+    "shipped_at DATETIME, delivered_at DATETIME, freight_cost NUMERIC)",
+    "refunds (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), amount NUMERIC, "
+    "reason TEXT, refunded_at DATETIME)",
+    "payments (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), method TEXT, "
+    "amount NUMERIC, paid_at DATETIME)",
+]
+
+# (질문, 정답 테이블)
+QUESTIONS = [
+    # 식별자를 그대로 사용
+    ("How many orders did each customer place?", {"orders", "customers"}),
+    ("Total quantity of order_items per product", {"order_items", "products"}),
+    ("List suppliers in each country", {"suppliers"}),
+    ("Products whose inventory on_hand is below the reorder_level", {"inventory", "products"}),
+    ("Average freight_cost of shipments by carrier", {"shipments"}),
+    ("Sum of refunds amount by reason", {"refunds"}),
+    ("Warehouses with capacity over 1000 in each city", {"warehouses"}),
+    ("Payments by method last month", {"payments"}),
+    ("Employees hired after 2020 with their title", {"employees"}),
+    ("Number of products in each category", {"products", "categories"}),
+    # 동의어/설명형 (식별자와 겹치는 단어가 적음)
+    ("Which clients spent the most money?", {"customers", "orders", "payments"}),
+    ("Stock levels per storage site", {"inventory", "warehouses"}),
+    ("Who are our vendors?", {"suppliers"}),
+    ("How long does delivery take on average?", {"shipments"}),
+    ("Staff who processed the most purchases", {"employees", "orders"}),
+    ("Money returned to buyers this year", {"refunds"}),
+    # 한국어
+    ("고객별 주문 수", {"customers", "orders"}),
+    ("창고별 재고 수량", {"inventory", "warehouses"}),
+]
+
+_FILLER_ENTITIES = [
+    "audit_log", "session", "feature_flag", "notification", "api_key", "webhook", "job_run",
+    "metric", "experiment", "campaign", "ticket", "survey", "tag", "attachment", "invoice_draft",
+]
+_FILLER_COLUMNS = ["id INTEGER PRIMARY KEY", "label TEXT", "payload TEXT", "created_at DATETIME", "state TEXT"]
+
+
+def _create_schema(filler: int) -> SchemaService:
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        for ddl in _CORE_TABLES:
+            conn.exec_driver_sql(f"CREATE TABLE {ddl}")
+        for i in range(filler):
+            name = f"{_FILLER_ENTITIES[i % len(_FILLER_ENTITIES)]}_{i}"
+            conn.exec_driver_sql(f"CREATE TABLE {name} ({', '.join(_FILLER_COLUMNS)})")
+    return SchemaService(engine)
+
+
+def _build_lexical(service: SchemaService) -> tuple[SchemaLexicalIndex, float]:
+    index = SchemaLexicalIndex()
+    documents = [(info, *SchemaIndexer._build_document(info)) for info in service.get_all_table_infos().values()]
+    start = time.perf_counter()
+    for info, document, metadata in documents:
+        index.upsert(info, document, metadata, {})
+    return index, (time.perf_counter() - start) * 1000
+
+
+def _evaluate(label: str, search, top_k: int, repeat: int, skipped=None, before=None) -> None:
+    recalls, timings = [], []
+    for question, expected in QUESTIONS:
+        found = search(question, top_k)
+        recalls.append(len(expected & set(found)) / len(expected))
+        for _ in range(repeat):
+            if before is not None:
+                before()
+            start = time.perf_counter()
+            search(question, top_k)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    identifier = statistics.mean(recalls[:10])
+    paraphrase = statistics.mean(recalls[10:])
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    skip = f"{skipped():7.0%}" if skipped else f"{'-':>7}"
+    print(
+        f"{label:<10}{statistics.mean(recalls):9.2f}{identifier:12.2f}{paraphrase:12.2f}"
+        f"{statistics.median(timings):10.3f}{p95:10.3f}{skip}"
+    )
+
+
+def _vector_retrievers(service: SchemaService, lexical: SchemaLexicalIndex):
+    from agent.infrastructure.vectorstore.chroma_client import ChromaDBClient
+    from agent.infrastructure.vectorstore.schema_retriever import ChromaSchemaRetriever
+
+    settings.chroma_persist_dir = tempfile.mkdtemp(prefix="bench_lexical_")
+    chroma = ChromaDBClient()
+    SchemaIndexer(
+        service, chroma_client=chroma, retrieval_cache=RetrievalCache(), lexical_index=lexical
+    ).index_all_tables()
+    return ChromaSchemaRetriever(chroma), ChromaSchemaRetriever(chroma, lexical_index=lexical)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filler", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    service = _create_schema(args.filler)
+    lexical, build_ms = _build_lexical(service)
+    stats = lexical.stats()
+    print(
+        f"tables={stats['tables']} terms={stats['terms']} index build={build_ms:.1f} ms "
+        f"questions={len(QUESTIONS)} top_k={args.top_k}"
+    )
+    print(f"{'method':<10}{'recall':>9}{'identifier':>12}{'paraphrase':>12}{'p50 ms':>10}{'p95 ms':>10}{'skip':>7}")
+
+    _evaluate(
+        "lexical",
+        lambda q, k: [h.table_name for h in lexical.search(q, top_k=k).hits],
+        args.top_k,
+        args.repeat,
+        skipped=lambda: sum(lexical.search(q).confident for q, _ in QUESTIONS) / len(QUESTIONS),
+    )
+
+    try:
+        import sentence_transformers  # noqa: F401
+    except ImportError:
+        print("vector/hybrid: skipped (sentence-transformers not installed)")
+        return
+
+    from agent.infrastructure.vectorstore.embedding_cache import get_query_embedding_cache
+
+    vector, hybrid = _vector_retrievers(service, lexical)
+    # 검색 캐시를 거치지 않고(_search), 질의 임베딩 캐시는 매번 비워 임베딩 비용까지 포함
+    clear = get_query_embedding_cache().clear
+    _evaluate(
+        "vector", lambda q, k: [s.table_name for s in vector._search(q, k)], args.top_k, args.repeat, before=clear
+    )
+    _evaluate(
+        "hybrid",
+        lambda q, k: [s.table_name for s in hybrid._search(q, k)],
+        args.top_k,
+        args.repeat,
+        skipped=lambda: sum(lexical.search(q).confident for q, _ in QUESTIONS) / len(QUESTIONS),
+        before=clear,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""넓은 테이블에서 스키마 컨텍스트 압축 전/후의 프롬프트 크기와 지연 비교.
+
+- full: UI가 보내던 전체 스키마 (``SchemaService.get_schema_context``)
+- rag: 검색된 테이블 문서를 그대로 이어 붙인 컨텍스트 (``format_context``)
+- columns: 컬럼 인덱스로 줄인 문서 (PK/FK + 검색된 컬럼)
+- budget: ``TokenBudgetContextBuilder`` (``--budgets``별, 컬럼 검색 결과 반영)
+
+검색 결과는 질문마다 고정된 상위 ``--top-k``개 테이블로, 컬럼 검색 결과는 질문과 단어가
+겹치는 컬럼(최대 ``--column-top-k``개)으로 대신합니다. 지연은 컨텍스트 구성 시간과,
+프롬프트 토큰 수에 비례하는 LLM 입력 처리 시간(``--prefill-ms-per-1k``)을 더한
+추정치입니다. ``--llm``이면 설정된 모델을 실제로 호출해 측정합니다.
+
+    PYTHONPATH=src python benchmarks/bench_schema_context.py --tables 30 --columns 120
+    PYTHONPATH=src python benchmarks/bench_schema_context.py --budgets 600 1200 --llm
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine
+
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.config import settings
+from agent.domain.services.schema_retriever import RetrievedSchema
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.llm.context_builder import TokenBudgetContextBuilder, _terms
+from agent.infrastructure.llm.tokenizer import TokenCounter
+from agent.infrastructure.vectorstore.schema_retriever import ChromaSchemaRetriever
+
+QUERIES = [
+    "How many orders did each customer place last month?",
+    "Top 10 products by total revenue",
+    "Average shipping cost per city in 2025",
+    "Which employees handled the most refunds this year?",
+    "List suppliers with inventory below the reorder level",
+]
+_ENTITIES = [
+    "customers", "orders", "products", "order_items", "employees", "suppliers",
+    "inventory", "refunds", "shipments", "payments",
+]
+_ATTRIBUTES = [
+    "name", "status", "city", "country", "revenue", "cost", "price", "quantity", "level",
+    "created_at", "updated_at", "shipped_at", "total", "discount", "category", "email",
+]
+
+
+def _create_schema(tables: int, columns: int) -> SchemaService:
+    engine = create_engine("sqlite://")
+    names = [
+        _ENTITIES[i] if i < len(_ENTITIES) else f"{_ENTITIES[i % len(_ENTITIES)]}_{i}"
+        for i in range(tables)
+    ]
+    with engine.begin() as conn:
+        for i, name in enumerate(names):
+            cols = ["id INTEGER PRIMARY KEY"]
+            if i > 0:
+                parent = names[(i - 1) // 2]
+                cols.append(f"{parent}_id INTEGER REFERENCES {parent}(id)")
+            for j in range(columns - len(cols)):
+                attribute = _ATTRIBUTES[j % len(_ATTRIBUTES)]
+                type_ = "DATETIME" if attribute.endswith("_at") else "NUMERIC" if j % 3 else "TEXT"
+                cols.append(f"{attribute}_{j} {type_}" if j >= len(_ATTRIBUTES) else f"{attribute} {type_}")
+            conn.exec_driver_sql(f"CREATE TABLE {name} ({', '.join(cols)})")
+    return SchemaService(engine)
+
+
+def _retrieved(service: SchemaService, top_k: int) -> list[RetrievedSchema]:
+    schemas = []
+    for name, info in list(service.get_all_table_infos().items())[:top_k]:
+        document, metadata = SchemaIndexer._build_document(info)
+        schemas.append(RetrievedSchema(name, document, 1.0, metadata))
+    return schemas
+
+
+def _with_column_matches(
+    service: SchemaService, schemas: list[RetrievedSchema], query: str, column_top_k: int
+) -> list[RetrievedSchema]:
+    """컬럼 검색 대신 질문과 단어가 겹치는 컬럼을 골라 검색 결과를 줄입니다."""
+    query_terms = _terms(query)
+    matched: dict[str, list[dict]] = {}
+    found = 0
+    for schema in schemas:
+        info = service.get_table_info(schema.table_name)
+        for _, _, metadata in SchemaIndexer._build_column_documents(info):
+            if found < column_top_k and _terms(metadata["column_name"]) & query_terms:
+                matched.setdefault(schema.table_name, []).append(
+                    {"column_name": metadata["column_name"], "metadata": metadata}
+                )
+                found += 1
+
+    narrowed = []
+    for schema in schemas:
+        columns = matched.get(schema.table_name, [])
+        table = {"table_name": schema.table_name, "document": schema.document, "metadata": schema.metadata}
+        narrowed.append(
+            RetrievedSchema(
+                schema.table_name,
+                ChromaSchemaRetriever._narrow(table, columns),
+                schema.relevance_score,
+                schema.metadata,
+                matched_columns=[c["column_name"] for c in columns],
+            )
+        )
+    return narrowed
+
+
+def _rag_context(schemas: list[RetrievedSchema]) -> str:
+    return "Relevant tables for your query:\n" + "\n".join(f"\n- {s.document}" for s in schemas)
+
+
+def _timed(build, repeat: int) -> tuple[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = build()
+        timings.append((time.perf_counter() - start) * 1000)
+    return text, statistics.median(timings)
+
+
+def _call_llm(generator, query: str, context: str) -> float:
+    start = time.perf_counter()
+    generator.generate(user_query=query, schema_context=context)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=30)
+    parser.add_argument("--columns", type=int, default=120)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--column-top-k", type=int, default=settings.column_index_top_k)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[600, 1200, 2400])
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=150.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--llm", action="store_true", help="설정된 LLM을 실제로 호출")
+    args = parser.parse_args()
+
+    service = _create_schema(args.tables, args.columns)
+    schemas = _retrieved(service, args.top_k)
+    counter = TokenCounter()
+    counter.count("warm up")
+    generator = None
+    if args.llm:
+        from agent.infrastructure.llm.langchain_client import LangChainSQLGenerator
+
+        generator = LangChainSQLGenerator()
+
+    print(
+        f"tables={args.tables} columns={args.columns} top_k={args.top_k} "
+        f"tokenizer={'tiktoken' if counter.exact else 'approximate'}"
+    )
+    print(f"{'context':<14}{'tokens':>9}{'build ms':>10}{'est. ms':>10}{'llm ms':>10}  columns")
+
+    matched = {q: _with_column_matches(service, schemas, q, args.column_top_k) for q in QUERIES}
+    variants = [
+        ("full", lambda q: service.get_schema_context(), None),
+        ("rag", lambda q: _rag_context(schemas), None),
+        ("columns", lambda q: _rag_context(matched[q]), None),
+    ]
+    for budget in args.budgets:
+        builder = TokenBudgetContextBuilder(service, max_tokens=budget, token_counter=counter)
+        variants.append((f"budget {budget}", lambda q, b=builder: b.build(q, matched[q]).text, builder))
+
+    for label, build, builder in variants:
+        tokens, build_ms, llm_ms, included = [], [], [], []
+        for query in QUERIES:
+            text, elapsed = _timed(lambda: build(query), args.repeat)
+            tokens.append(counter.count(text) + counter.count(query))
+            build_ms.append(elapsed)
+            if builder is not None:
+                context = builder.build(query, matched[query])
+                included.append(f"{context.columns_included}/{context.columns_total}")
+            if generator is not None:
+                llm_ms.append(_call_llm(generator, query, text))
+
+        mean_tokens = statistics.mean(tokens)
+        mean_build = statistics.mean(build_ms)
+        estimated = mean_build + mean_tokens / 1000 * args.prefill_ms_per_1k
+        llm = f"{statistics.mean(llm_ms):10.0f}" if llm_ms else f"{'-':>10}"
+        print(
+            f"{label:<14}{mean_tokens:9.0f}{mean_build:10.2f}{estimated:10.1f}{llm}  "
+            f"{included[0] if included else 'all'}"
+        )
+
+    # add_column 한 번에 임베딩할 입력: 테이블 문서 전체 vs 새 컬럼 문서 하나
+    info = next(iter(service.get_all_table_infos().values()))
+    table_document, _ = SchemaIndexer._build_document(info)
+    _, column_document, _ = SchemaIndexer._build_column_documents(info)[-1]
+    print(
+        f"\nadd_column embedding input: table document {counter.count(table_document)} tokens, "
+        f"column document {counter.count(column_document)} tokens"
+    )
+
+
+if __name__ == "__main__":
+    main()
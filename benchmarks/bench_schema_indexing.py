@@ -0,0 +1,100 @@
+"""전체 스키마 인덱싱 벤치마크: 테이블별 리플렉션 vs 일괄 리플렉션 + 배치 업서트.
+
+합성 SQLite 스키마(테이블당 12컬럼)를 만들어 ``index_all_tables``의 리플렉션/문서 생성
+단계를 비교합니다. ``--chroma``를 주면 임시 ChromaDB에 실제 임베딩/업서트까지 측정합니다.
+
+    PYTHONPATH=src python benchmarks/bench_schema_indexing.py --tables 100 1000 10000
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.infrastructure.database.schema_service import SchemaService
+
+COLUMNS_PER_TABLE = 12
+
+
+def _create_schema(engine, tables: int) -> None:
+    with engine.begin() as conn:
+        for t in range(tables):
+            cols = ", ".join(f"col_{c} TEXT" for c in range(COLUMNS_PER_TABLE - 1))
+            conn.execute(text(f"CREATE TABLE table_{t} (id INTEGER PRIMARY KEY, {cols})"))
+
+
+def _legacy_reflect(engine) -> int:
+    """기존 구현: 테이블마다 새 inspector로 목록 조회 + PK + 컬럼 리플렉션."""
+    count = 0
+    for table_name in inspect(engine).get_table_names():
+        inspector = inspect(engine)
+        if table_name not in inspector.get_table_names():
+            continue
+        inspector.get_pk_constraint(table_name)
+        inspector.get_columns(table_name)
+        count += 1
+    return count
+
+
+def _bulk_reflect(engine) -> int:
+    service = SchemaService(engine)
+    infos = service.get_all_table_infos()
+    for info in infos.values():
+        SchemaIndexer._build_document(info)
+    return len(infos)
+
+
+def _chroma_upsert(engine, persist_dir: Path, batch_size: int) -> float:
+    import chromadb
+
+    client = chromadb.PersistentClient(path=str(persist_dir))
+    collection = client.get_or_create_collection("bench")
+    infos = SchemaService(engine).get_all_table_infos()
+    docs = [SchemaIndexer._build_document(info) for info in infos.values()]
+
+    start = time.perf_counter()
+    for i in range(0, len(docs), batch_size):
+        chunk = docs[i:i + batch_size]
+        collection.upsert(
+            ids=[m["table_name"] for _, m in chunk],
+            documents=[d for d, _ in chunk],
+            metadatas=[m for _, m in chunk],
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--chroma", action="store_true", help="ChromaDB 업서트까지 측정")
+    args = parser.parse_args()
+
+    print(f"{'tables':>7} {'legacy reflect':>15} {'bulk reflect':>13} {'upserts legacy/bulk':>20}")
+    for tables in args.tables:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            _create_schema(engine, tables)
+
+            start = time.perf_counter()
+            _legacy_reflect(engine)
+            legacy = time.perf_counter() - start
+
+            start = time.perf_counter()
+            _bulk_reflect(engine)
+            bulk = time.perf_counter() - start
+
+            batches = math.ceil(tables / args.batch_size)
+            line = f"{tables:>7} {legacy:>14.2f}s {bulk:>12.2f}s {tables:>11}/{batches:<8}"
+            if args.chroma:
+                line += f" chroma upsert {_chroma_upsert(engine, Path(tmp) / 'chroma', args.batch_size):.2f}s"
+            print(line)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""서버 기동 시간 벤치마크: 첫 연결 수락까지의 시간과 /api/ready까지의 시간.
+
+임시 작업 디렉터리(빈 SQLite/Chroma)에서 uvicorn을 띄우고 측정합니다.
+``--background``는 빠른 기동 모드(WARMUP_IN_BACKGROUND=true)입니다.
+
+    PYTHONPATH=src python benchmarks/bench_startup.py --runs 3
+    PYTHONPATH=src python benchmarks/bench_startup.py --runs 3 --background
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_startup(background: bool, timeout: float = 120.0) -> dict:
+    """uvicorn을 한 번 기동해 첫 연결/준비 완료까지의 시간을 측정합니다."""
+    port = _free_port()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env["WARMUP_IN_BACKGROUND"] = "true" if background else "false"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "agent.main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            first_connection = None
+            while first_connection is None:
+                if proc.poll() is not None:
+                    raise RuntimeError(f"server exited with code {proc.returncode}")
+                if time.perf_counter() - start > timeout:
+                    raise TimeoutError("server did not accept connections")
+                try:
+                    with socket.create_connection(("127.0.0.1", port), timeout=0.05):
+                        first_connection = time.perf_counter() - start
+                except OSError:
+                    time.sleep(0.01)
+
+            readiness = None
+            while time.perf_counter() - start < timeout:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/ready") as resp:
+                        readiness = json.load(resp)
+                except urllib.error.HTTPError as e:
+                    readiness = json.load(e)
+                if readiness["warmup_finished"]:
+                    break
+                time.sleep(0.02)
+            time_to_ready = time.perf_counter() - start
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    return {
+        "first_connection_s": first_connection,
+        "ready_s": time_to_ready,
+        "ready": readiness["ready"] if readiness else False,
+        "components": readiness["components"] if readiness else {},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--background", action="store_true", help="빠른 기동 모드")
+    args = parser.parse_args()
+
+    results = [measure_startup(args.background) for _ in range(args.runs)]
+    mode = "background warmup" if args.background else "blocking warmup"
+    print(f"{mode}: {args.runs} runs")
+    print(f"  time to first accepted connection: median {statistics.median(r['first_connection_s'] for r in results):.2f}s")
+    print(f"  time to ready:                     median {statistics.median(r['ready_s'] for r in results):.2f}s")
+    last = results[-1]
+    for name, component in last["components"].items():
+        state = "ready" if component["ready"] else f"failed ({component['error']})"
+        print(f"    {name:16s} {component['duration_ms']}ms {state}")
+
+
+if __name__ == "__main__":
+    main()
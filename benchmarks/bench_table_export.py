@@ -0,0 +1,130 @@
+"""테이블 내보내기 처리량(MB/s)과 최대 메모리(peak RSS) 측정.
+
+- materialize: 기존 ``get_table_data``처럼 모든 행을 dict 리스트로 만든 뒤 JSON 직렬화
+- csv / ndjson / arrow: ``TableExporter`` 스트리밍 (``--gzip``이면 압축 포함)
+
+각 모드는 별도 프로세스에서 실행되어 peak RSS가 서로 섞이지 않습니다.
+materialize는 메모리를 많이 쓰므로 ``--materialize-rows`` 이하 행만 읽습니다.
+
+    PYTHONPATH=src python benchmarks/bench_table_export.py --rows 10000000
+    PYTHONPATH=src python benchmarks/bench_table_export.py --rows 10000000 --gzip
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+
+TABLE = "export_bench"
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _create_table(path: str, rows: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY, name TEXT NOT NULL, amount NUMERIC, "
+            "category TEXT, created_at DATETIME)"
+        )
+        conn.exec_driver_sql(
+            f"WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s WHERE i < {rows}) "
+            f"INSERT INTO {TABLE} SELECT i, 'customer_' || i, (i % 10000) / 100.0, "
+            "'category_' || (i % 37), datetime('2026-01-01', '+' || (i % 86400) || ' seconds') || '.000000' "
+            "FROM s"
+        )
+    engine.dispose()
+
+
+def _run(path: str, mode: str, compress: bool, materialize_rows: int) -> dict:
+    from agent.infrastructure.database.table_exporter import TableExporter
+
+    engine = create_engine(f"sqlite:///{path}")
+    baseline = _rss_mb()
+    start = time.perf_counter()
+    written = 0
+
+    if mode == "materialize":
+        from sqlalchemy import text
+
+        with engine.connect() as conn:
+            result = conn.execute(text(f"SELECT * FROM {TABLE} LIMIT :limit"), {"limit": materialize_rows})
+            rows = [dict(row._mapping) for row in result]
+        written = len(json.dumps(rows, default=str).encode())
+    else:
+        exporter = TableExporter(engine)
+        for chunk in exporter.stream(exporter.prepare(TABLE, mode, compress=compress)):
+            written += len(chunk)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "baseline_mb": baseline,
+        "peak_mb": _peak_rss_mb(),
+        "elapsed_s": elapsed,
+        "bytes": written,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--materialize-rows", type=int, default=1_000_000)
+    parser.add_argument("--formats", default="materialize,csv,ndjson,arrow")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(_run(args.db, args.mode, args.gzip, args.materialize_rows)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "export.db")
+        start = time.perf_counter()
+        _create_table(db_path, args.rows)
+        print(
+            f"created {args.rows:,} rows ({os.path.getsize(db_path) / 1e6:.0f}MB) "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+        for mode in args.formats.split(","):
+            if mode == "arrow":
+                try:
+                    import pyarrow  # noqa: F401
+                except ImportError:
+                    print("arrow       skipped (pyarrow not installed)")
+                    continue
+            command = [sys.executable, __file__, "--mode", mode, "--db", db_path]
+            command += ["--materialize-rows", str(args.materialize_rows)]
+            if args.gzip:
+                command.append("--gzip")
+            out = subprocess.run(command, check=True, capture_output=True, text=True)
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            rows = min(args.rows, args.materialize_rows) if mode == "materialize" else args.rows
+            mb = result["bytes"] / 1e6
+            print(
+                f"{mode:11s} {rows:>11,} rows  {mb:8.1f}MB out in {result['elapsed_s']:6.1f}s "
+                f"= {mb / result['elapsed_s']:6.1f}MB/s  "
+                f"rss baseline={result['baseline_mb']:.0f}MB peak={result['peak_mb']:.0f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Background worker that applies schema index updates off the request path."""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from agent.config import settings
+from agent.application.services.schema_indexer import SchemaIndexer
+
+
+@dataclass
+class _PendingChange:
+    action: str  # index | remove
+    seq: int  # 제출 순번
+    due_at: float  # 적용 예정 시각
+    first_seen: float  # 합쳐진 변경 중 첫 제출 시각
+    attempts: int = 0  # 실패한 적용 시도 수 (재시도 중이면 1 이상)
+
+
+class IndexWorker:
+    """스키마 인덱스 갱신을 백그라운드 스레드에서 처리하는 워커.
+
+    ``SchemaService``에는 인덱서 대신 이 워커가 연결되며, DDL 요청은 큐에 작업만
+    넣고 바로 반환합니다. 같은 테이블에 대한 변경은 디바운스 구간 안에서 하나로
+    합쳐지고(마지막 작업만 유효), 기한이 된 작업들은 배치로 한 번에 적용됩니다.
+    디바운스는 첫 변경 후 ``max_delay_seconds``를 넘겨 미뤄지지 않습니다.
+
+    적용에 실패한 테이블은 같은 순번으로 다시 큐에 들어가 지수 백오프로 재시도되며
+    (그 사이 새로 제출된 작업이 있으면 그 작업이 우선), 성공할 때까지 ``wait()``는
+    해당 순번을 반영되지 않은 것으로 봅니다.
+    """
+
+    def __init__(
+        self,
+        indexer: SchemaIndexer,
+        debounce_seconds: float | None = None,
+        batch_size: int | None = None,
+        max_delay_seconds: float | None = None,
+    ):
+        self._indexer = indexer
+        self._debounce = (
+            debounce_seconds if debounce_seconds is not None else settings.index_debounce_seconds
+        )
+        self._batch_size = batch_size or settings.index_batch_size
+        self._max_delay = (
+            max_delay_seconds if max_delay_seconds is not None else settings.index_max_delay_seconds
+        )
+
+        self._pending: dict[str, _PendingChange] = {}
+        self._in_flight: set[int] = set()
+        # 마지막 적용이 실패한 테이블 → 실패한 작업의 순번 (성공하면 제거)
+        self._failed: dict[str, int] = {}
+        self._submitted = 0
+        self._flush_until = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+        self._applied = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._failures = 0
+        self._retries = 0
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="schema-index-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """남은 작업을 모두 적용한 뒤 워커를 종료합니다."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def index_table(self, table_name: str) -> None:
+        """테이블 재인덱싱을 예약합니다."""
+        self._submit(table_name, "index")
+
+    def remove_table(self, table_name: str) -> None:
+        """테이블 인덱스 제거를 예약합니다."""
+        self._submit(table_name, "remove")
+
+    def _submit(self, table_name: str, action: str) -> None:
+        with self._cond:
+            self._submitted += 1
+            if table_name in self._pending:
+                self._coalesced += 1
+            # 새 작업의 결과가 이전 실패를 대신함
+            self._failed.pop(table_name, None)
+            now = time.monotonic()
+            previous = self._pending.get(table_name)
+            first_seen = previous.first_seen if previous is not None and previous.attempts == 0 else now
+            due_at = min(first_seen + self._max_delay, now + self._debounce)
+            self._pending[table_name] = _PendingChange(action, self._submitted, due_at, first_seen)
+            self._cond.notify_all()
+
+    def _completed_through(self) -> int:
+        """이 순번까지 제출된 작업은 모두 적용되었음을 나타내는 값."""
+        outstanding = [change.seq for change in self._pending.values()] + list(self._in_flight)
+        return min(outstanding) - 1 if outstanding else self._submitted
+
+    def _failed_through(self, target: int) -> bool:
+        return any(seq <= target for seq in self._failed.values())
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """호출 시점까지 제출된 변경이 인덱스에 반영될 때까지 기다립니다.
+
+        대기 중인 작업은 디바운스를 건너뛰고 즉시 처리됩니다.
+
+        Returns:
+            제한 시간 안에 반영되었으면 True. 그 사이 제출된 작업 중 적용에 실패한
+            것이 있으면(재시도 대기 중) 바로 False
+        """
+        with self._cond:
+            target = self._submitted
+            self._flush_until = max(self._flush_until, target)
+            self._cond.notify_all()
+            self._cond.wait_for(
+                lambda: self._completed_through() >= target or self._failed_through(target), timeout
+            )
+            return self._completed_through() >= target and not self._failed_through(target)
+
+    def _is_due(self, change: _PendingChange, now: float) -> bool:
+        if self._stopping or change.due_at <= now:
+            return True
+        # 재시도는 wait()가 있어도 백오프를 지킴
+        return change.attempts == 0 and change.seq <= self._flush_until
+
+    def _take_due(self) -> dict[str, _PendingChange] | None:
+        """기한이 된 작업을 꺼냅니다. 종료 요청 후 남은 작업이 없으면 None."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                due = [name for name, change in self._pending.items() if self._is_due(change, now)]
+                if due:
+                    due.sort(key=lambda name: self._pending[name].seq)
+                    batch = {name: self._pending.pop(name) for name in due[: self._batch_size]}
+                    self._in_flight.update(change.seq for change in batch.values())
+                    return batch
+                if self._stopping:
+                    return None
+
+                next_due = min((change.due_at for change in self._pending.values()), default=None)
+                self._cond.wait(None if next_due is None else max(next_due - now, 0))
+
+    def _requeue(self, batch: dict[str, _PendingChange]) -> None:
+        """실패한 작업을 백오프 후 재시도하도록 되돌립니다 (``_cond`` 보유 상태에서 호출)."""
+        now = time.monotonic()
+        for name, change in batch.items():
+            if name in self._pending:
+                # 적용 중에 더 새로운 작업이 제출되었으면 그 작업이 대신함
+                continue
+            self._failed[name] = change.seq
+            if self._stopping:
+                continue
+            backoff = min(
+                settings.index_retry_backoff_seconds * 2 ** change.attempts,
+                settings.index_retry_max_backoff_seconds,
+            )
+            self._pending[name] = _PendingChange(
+                change.action, change.seq, now + backoff, change.first_seen, change.attempts + 1
+            )
+            self._retries += 1
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_due()
+            if batch is None:
+                return
+
+            index_names = [name for name, change in batch.items() if change.action == "index"]
+            remove_names = [name for name, change in batch.items() if change.action == "remove"]
+            try:
+                self._indexer.apply_changes(index_names, remove_names)
+                failed = False
+            except Exception as e:
+                failed = True
+                print(f"[RAG] Background index update failed for {list(batch)}: {e}")
+
+            with self._cond:
+                self._in_flight.difference_update(change.seq for change in batch.values())
+                self._batches += 1
+                if failed:
+                    self._failures += 1
+                    self._requeue(batch)
+                else:
+                    self._applied += len(batch)
+                    for name in batch:
+                        self._failed.pop(name, None)
+                self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """워커 상태를 반환합니다."""
+        with self._cond:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "pending": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "applied": self._applied,
+                "coalesced": self._coalesced,
+                "batches": self._batches,
+                "failures": self._failures,
+                "retries": self._retries,
+                "failed_tables": sorted(self._failed),
+            }
@@ -1,7 +1,55 @@
 """Schema indexer service for RAG-based SQL generation."""
 
+import hashlib
+from dataclasses import dataclass, field
+
+from agent.config import settings
+from agent.infrastructure.database.join_graph import JoinGraph, get_join_graph
 from agent.infrastructure.database.schema_service import SchemaService
 from agent.infrastructure.vectorstore.chroma_client import get_chroma_client, ChromaDBClient
+from agent.infrastructure.vectorstore.embedding_service import EmbeddingService
+from agent.infrastructure.vectorstore.lexical_index import SchemaLexicalIndex, get_lexical_index
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache, get_retrieval_cache
+
+
+# 문서 형식이나 임베딩 방식이 바뀌면 올려서 기존 fingerprint를 모두 무효화
+INDEX_FORMAT_VERSION = 3
+
+_MISSING = object()
+
+
+def column_fragment(column) -> str:
+    """테이블 문서 안의 컬럼 표기: ``name (TYPE PK FK->table.column NOT NULL)``."""
+    flags = column.type
+    if column.primary_key:
+        flags += " PK"
+    if column.foreign_key:
+        flags += f" FK->{column.foreign_key}"
+    if not column.nullable and not column.primary_key:
+        flags += " NOT NULL"
+    return f"{column.name} ({flags})"
+
+
+@dataclass
+class IndexSyncResult:
+    """증분 인덱스 동기화 결과."""
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    columns_embedded: int = 0  # 컬럼 인덱스에 새로 임베딩된 컬럼 수
+    columns_removed: int = 0
+
+    @property
+    def embedded(self) -> int:
+        """새로 임베딩된 테이블 수."""
+        return len(self.added) + len(self.updated)
+
+    @property
+    def total(self) -> int:
+        """동기화 후 인덱스에 있는 테이블 수."""
+        return self.embedded + self.unchanged
 
 
 class SchemaIndexer:
@@ -10,35 +58,170 @@ class SchemaIndexer:
     def __init__(
         self,
         schema_service: SchemaService,
-        chroma_client: ChromaDBClient | None = None
+        chroma_client: ChromaDBClient | None = None,
+        retrieval_cache: RetrievalCache | None = None,
+        lexical_index: SchemaLexicalIndex | None = _MISSING,
+        join_graph: JoinGraph | None = _MISSING,
     ):
         self._schema_service = schema_service
         self._chroma = chroma_client or get_chroma_client()
+        self._retrieval_cache = retrieval_cache or get_retrieval_cache()
+        self._lexical = get_lexical_index() if lexical_index is _MISSING else lexical_index
+        self._join_graph = get_join_graph() if join_graph is _MISSING else join_graph
 
     def index_all_tables(self) -> int:
         """모든 테이블을 벡터 저장소에 인덱싱합니다.
-        
+
+        전체 스키마를 한 번에 리플렉션해 문서를 메모리에서 만든 뒤,
+        ``index_batch_size`` 단위로 임베딩/업서트합니다.
+
         Returns:
             인덱싱된 테이블 수
         """
-        tables = self._schema_service.get_tables()
-        indexed_count = 0
+        table_infos = self._schema_service.get_all_table_infos()
 
-        for table_name in tables:
-            table_info = self._schema_service.get_table_info(table_name)
-            if table_info:
-                self._index_table(table_info)
-                indexed_count += 1
+        table_names, documents, metadatas = [], [], []
+        for table_info in table_infos.values():
+            document, metadata = self._build_document(table_info)
+            table_names.append(table_info.name)
+            documents.append(document)
+            metadatas.append(metadata)
+            self._memory_upsert(table_info, document, metadata)
 
-        return indexed_count
+        if table_names:
+            self._chroma.upsert_tables(
+                table_names,
+                documents,
+                metadatas,
+                batch_size=settings.index_batch_size,
+            )
+        self._sync_columns(table_infos.values(), {})
+        self._memory_retain(table_infos)
 
-    def _index_table(self, table_info) -> None:
-        """단일 테이블을 인덱싱합니다."""
+        self._retrieval_cache.bump_version()
+        return len(table_names)
+
+    def sync_all_tables(self) -> IndexSyncResult:
+        """라이브 스키마와 저장된 fingerprint를 비교해 변경분만 인덱싱합니다.
+
+        새로 생기거나 문서가 바뀐 테이블만 임베딩/업서트하고, 더 이상 존재하지 않는
+        테이블의 벡터는 삭제합니다. 변경이 없으면 임베딩 작업을 하지 않습니다.
+        """
+        stored = self._chroma.get_fingerprints()
+        result = IndexSyncResult()
+
+        table_infos = self._schema_service.get_all_table_infos()
+        table_names, documents, metadatas = [], [], []
+        for table_info in table_infos.values():
+            document, metadata = self._build_document(table_info)
+            # 메모리 인덱스는 프로세스마다 새로 만들어지므로 변경 여부와 무관하게 채움 (임베딩 없음)
+            self._memory_upsert(table_info, document, metadata)
+            previous = stored.pop(table_info.name, _MISSING)
+            if previous == metadata["fingerprint"]:
+                result.unchanged += 1
+                continue
+
+            (result.added if previous is _MISSING else result.updated).append(table_info.name)
+            table_names.append(table_info.name)
+            documents.append(document)
+            metadatas.append(metadata)
+
+        if table_names:
+            self._chroma.upsert_tables(
+                table_names,
+                documents,
+                metadatas,
+                batch_size=settings.index_batch_size,
+            )
+
+        # 남은 항목은 DB에서 사라진 테이블
+        result.removed = list(stored)
+        if result.removed:
+            self._chroma.delete_tables(result.removed)
+
+        result.columns_embedded, result.columns_removed = self._sync_columns(
+            table_infos.values(), self._stored_columns(None)
+        )
+        self._memory_retain(table_infos)
+
+        if table_names or result.removed or result.columns_embedded or result.columns_removed:
+            self._retrieval_cache.bump_version()
+        return result
+
+    def _memory_upsert(self, table_info, document: str, metadata: dict) -> None:
+        """메모리 인덱스(렉시컬 인덱스, FK 조인 그래프)를 갱신합니다."""
+        if self._lexical is not None:
+            self._lexical.upsert(
+                table_info, document, metadata, {c.name: column_fragment(c) for c in table_info.columns}
+            )
+        if self._join_graph is not None:
+            self._join_graph.upsert(table_info)
+
+    def _memory_remove(self, table_names: list[str]) -> None:
+        for index in (self._lexical, self._join_graph):
+            if index is not None:
+                for name in table_names:
+                    index.remove(name)
+
+    def _memory_retain(self, table_infos: dict) -> None:
+        """전체 동기화 후 DB에 없는 테이블을 메모리 인덱스에서 제거합니다."""
+        for index in (self._lexical, self._join_graph):
+            if index is not None:
+                for name in index.table_names():
+                    if name not in table_infos:
+                        index.remove(name)
+
+    def _stored_columns(self, table_names: list[str] | None) -> dict[str, str | None]:
+        if not settings.column_index_enabled:
+            return {}
+        return self._chroma.get_column_fingerprints(table_names)
+
+    def _sync_columns(self, table_infos, stored: dict[str, str | None]) -> tuple[int, int]:
+        """넓은 테이블의 컬럼 문서를 fingerprint로 비교해 바뀐 컬럼만 업서트합니다.
+
+        ``stored``에서 짝이 맞지 않고 남은 컬럼(삭제된 컬럼, 좁아진 테이블)은 제거합니다.
+
+        Returns:
+            (업서트된 컬럼 수, 제거된 컬럼 수)
+        """
+        if not settings.column_index_enabled:
+            return 0, 0
+
+        column_ids, documents, metadatas = [], [], []
+        for table_info in table_infos:
+            if len(table_info.columns) < settings.column_index_min_columns:
+                continue
+            for column_id, document, metadata in self._build_column_documents(table_info):
+                if stored.pop(column_id, _MISSING) == metadata["fingerprint"]:
+                    continue
+                column_ids.append(column_id)
+                documents.append(document)
+                metadatas.append(metadata)
+
+        if column_ids:
+            self._chroma.upsert_columns(
+                column_ids,
+                documents,
+                metadatas,
+                batch_size=settings.index_batch_size,
+            )
+        removed = list(stored)
+        if removed:
+            self._chroma.delete_columns(removed)
+        return len(column_ids), len(removed)
+
+    @staticmethod
+    def _fingerprint(document: str) -> str:
+        """렌더링된 문서와 임베딩 모델의 해시 (모델이 바뀌면 전체 재임베딩)."""
+        model = settings.embedding_model or EmbeddingService.DEFAULT_MODEL
+        payload = f"{INDEX_FORMAT_VERSION}:{model}:{document}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def _build_document(table_info) -> tuple[str, dict]:
+        """테이블 정보로 임베딩할 문서와 메타데이터를 생성합니다."""
         # 문서 생성: 테이블명과 컬럼 정보를 자연어로 표현
-        columns_desc = ", ".join([
-            f"{col.name} ({col.type}{'PK' if col.primary_key else ''}{'' if col.nullable else ' NOT NULL'})"
-            for col in table_info.columns
-        ])
+        columns_desc = ", ".join([column_fragment(col) for col in table_info.columns])
         
         document = f"Table: {table_info.name}. Columns: {columns_desc}"
         
@@ -46,14 +229,48 @@ class SchemaIndexer:
             "table_name": table_info.name,
             "column_count": len(table_info.columns),
             "column_names": ",".join([c.name for c in table_info.columns]),
-            "has_pk": any(c.primary_key for c in table_info.columns)
+            "has_pk": any(c.primary_key for c in table_info.columns),
+            # 컬럼 단위 검색 결과로 문서를 줄일 때 항상 남기는 PK/FK 컬럼
+            "key_columns": ",".join(
+                c.name for c in table_info.columns if c.primary_key or c.foreign_key
+            ),
+            "key_column_fragments": ", ".join(
+                column_fragment(c) for c in table_info.columns if c.primary_key or c.foreign_key
+            ),
+            "fingerprint": SchemaIndexer._fingerprint(document),
         }
 
+        return document, metadata
+
+    @staticmethod
+    def _build_column_documents(table_info) -> list[tuple[str, str, dict]]:
+        """컬럼마다 (id, 임베딩할 문서, 메타데이터)를 생성합니다."""
+        entries = []
+        for col in table_info.columns:
+            document = f"Column {col.name} ({col.type}) of table {table_info.name}"
+            if col.foreign_key:
+                document += f", references {col.foreign_key}"
+            if col.comment:
+                document += f". {col.comment}"
+            metadata = {
+                "table_name": table_info.name,
+                "column_name": col.name,
+                "fragment": column_fragment(col),
+                "fingerprint": SchemaIndexer._fingerprint(document),
+            }
+            entries.append((f"{table_info.name}.{col.name}", document, metadata))
+        return entries
+
+    def _index_table(self, table_info) -> None:
+        """단일 테이블을 인덱싱합니다."""
+        document, metadata = self._build_document(table_info)
+
         self._chroma.upsert_table(
             table_name=table_info.name,
             document=document,
             metadata=metadata
         )
+        self._memory_upsert(table_info, document, metadata)
 
     def index_table(self, table_name: str) -> bool:
         """특정 테이블을 인덱싱합니다.
@@ -67,12 +284,63 @@ class SchemaIndexer:
         table_info = self._schema_service.get_table_info(table_name)
         if table_info:
             self._index_table(table_info)
+            self._sync_columns([table_info], self._stored_columns([table_name]))
+            self._retrieval_cache.bump_version()
             return True
         return False
 
+    def apply_changes(self, index_names: list[str], remove_names: list[str]) -> int:
+        """여러 테이블의 재인덱싱/제거를 한 번에 적용합니다.
+
+        재인덱싱 대상 중 이미 사라진 테이블은 제거 대상으로 처리합니다.
+
+        Returns:
+            업서트된 테이블 수
+        """
+        table_infos = self._schema_service.get_all_table_infos() if index_names else {}
+
+        table_names, documents, metadatas = [], [], []
+        removed = list(remove_names)
+        for name in index_names:
+            table_info = table_infos.get(name)
+            if table_info is None:
+                removed.append(name)
+                continue
+            document, metadata = self._build_document(table_info)
+            table_names.append(name)
+            documents.append(document)
+            metadatas.append(metadata)
+            self._memory_upsert(table_info, document, metadata)
+
+        if table_names:
+            self._chroma.upsert_tables(
+                table_names,
+                documents,
+                metadatas,
+                batch_size=settings.index_batch_size,
+            )
+        if removed:
+            self._chroma.delete_tables(removed)
+
+        # 컬럼 추가/삭제는 해당 컬럼 문서만 임베딩/삭제
+        self._sync_columns(
+            [table_infos[name] for name in table_names], self._stored_columns(table_names)
+        )
+        if removed and settings.column_index_enabled:
+            self._chroma.delete_table_columns(removed)
+        self._memory_remove(removed)
+
+        if table_names or removed:
+            self._retrieval_cache.bump_version()
+        return len(table_names)
+
     def remove_table(self, table_name: str) -> None:
         """테이블을 인덱스에서 제거합니다."""
         self._chroma.delete_table(table_name)
+        if settings.column_index_enabled:
+            self._chroma.delete_table_columns([table_name])
+        self._memory_remove([table_name])
+        self._retrieval_cache.bump_version()
 
     def reindex_all(self) -> int:
         """인덱스를 초기화하고 전체 재인덱싱합니다."""
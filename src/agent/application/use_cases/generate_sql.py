@@ -1,10 +1,16 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from agent.domain.entities.query_log import QueryLog
 from agent.domain.repositories.query_log_repository import QueryLogRepository
 from agent.domain.services.sql_generator import SQLGenerator
-from agent.domain.services.schema_retriever import SchemaRetriever
+from agent.domain.services.schema_context import SchemaContextBuilder
+from agent.domain.services.schema_retriever import RetrievedSchema, SchemaRetriever
+from agent.domain.services.sql_cache import SQLResponseCache
+from agent.domain.services.sql_cost_guard import CostVerdict, SQLCostGuard
+from agent.shared.singleflight import SingleFlight
+from agent.shared.text import normalize_query
 
 
 @dataclass
@@ -25,6 +31,59 @@ class GenerateSQLResponse:
     generated_sql: str
     status: str
     used_tables: list[str] | None = None  # RAG로 검색된 테이블 목록
+    cache_hit: bool = False  # 시맨틱 캐시에서 재사용된 결과인지 여부
+    coalesced: bool = False  # 동일한 진행 중 요청의 결과를 공유했는지 여부
+    cost: dict | None = None  # 실행 계획 비용 검사 결과 (CostVerdict.to_dict)
+    regenerated: bool = False  # 비용 검사에서 차단되어 한 번 재생성했는지 여부
+    prompt_tokens: int | None = None  # 스키마 컨텍스트 + 질문 토큰 수
+
+
+@dataclass
+class GenerateSQLBatchItem:
+    """일괄 SQL 생성의 개별 결과."""
+
+    index: int
+    query_log_id: str
+    user_query: str
+    status: str
+    generated_sql: str | None = None
+    used_tables: list[str] | None = None
+    cache_hit: bool = False
+    cost: dict | None = None
+    prompt_tokens: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class GenerateSQLEvent:
+    """스트리밍 SQL 생성 이벤트."""
+
+    event: str  # tables | delta | retry | done | error
+    data: dict
+
+
+@dataclass
+class _Generation:
+    """검색 → 캐시 → 생성 → 비용 검사를 마친 결과 (요청 병합 시 공유)."""
+
+    sql: str
+    used_tables: list[str] | None
+    cache_hit: bool
+    cost: CostVerdict | None = None
+    regenerated: bool = False
+    prompt_tokens: int | None = None
+    cache_epoch: int | None = None  # 캐시 조회 시점의 무효화 세대
+
+
+_generation_singleflight: SingleFlight | None = None
+
+
+def get_generation_singleflight() -> SingleFlight:
+    """SQL 생성 요청 병합에 사용하는 프로세스 전역 SingleFlight를 반환합니다."""
+    global _generation_singleflight
+    if _generation_singleflight is None:
+        _generation_singleflight = SingleFlight()
+    return _generation_singleflight
 
 
 class GenerateSQLUseCase:
@@ -35,10 +94,20 @@ class GenerateSQLUseCase:
         query_log_repository: QueryLogRepository,
         sql_generator: SQLGenerator,
         schema_retriever: Optional[SchemaRetriever] = None,
+        sql_cache: Optional[SQLResponseCache] = None,
+        singleflight: Optional[SingleFlight] = None,
+        cost_guard: Optional[SQLCostGuard] = None,
+        retry_on_block: bool = False,
+        context_builder: Optional[SchemaContextBuilder] = None,
     ):
         self._query_log_repository = query_log_repository
         self._sql_generator = sql_generator
         self._schema_retriever = schema_retriever
+        self._sql_cache = sql_cache
+        self._singleflight = singleflight
+        self._cost_guard = cost_guard
+        self._retry_on_block = retry_on_block
+        self._context_builder = context_builder
 
     def execute(self, request: GenerateSQLRequest) -> GenerateSQLResponse:
         """유스케이스 실행."""
@@ -47,44 +116,431 @@ class GenerateSQLUseCase:
         query_log.mark_processing()
 
         used_tables = None
+        cache_hit = False
+        cost = None
+        regenerated = False
 
         try:
             # 2. 스키마 컨텍스트 결정
-            schema_context = request.schema_context
+            schemas = None
             
             # RAG 사용 시 검색된 스키마로 컨텍스트 구성
-            if request.use_rag and self._schema_retriever and not schema_context:
+            if self._should_use_rag(request):
                 schemas = self._schema_retriever.retrieve(
                     query=request.user_query,
                     top_k=5
                 )
                 if schemas:
                     used_tables = [s.table_name for s in schemas]
-                    schema_context = self._schema_retriever.build_context(
-                        query=request.user_query,
-                        top_k=5
+            # 같은 검색 결과를 재사용 (두 번째 벡터 검색 방지)
+            schema_context, prompt_tokens = self._build_context(request, schemas)
+
+            # 3. SQL 생성 (RAG로 테이블이 결정된 경우 시맨틱 캐시 우선 조회)
+            generated_sql = None
+            cache_epoch = None
+            if self._sql_cache and used_tables:
+                cache_epoch = self._sql_cache.epoch(used_tables)
+                generated_sql = self._sql_cache.lookup(request.user_query, used_tables)
+                cache_hit = generated_sql is not None
+
+            if generated_sql is None:
+                generated_sql = self._sql_generator.generate(
+                    user_query=request.user_query,
+                    schema_context=schema_context,
+                )
+
+            # 4. 실행 계획 비용 검사 (차단되면 계획을 알려주고 한 번 재생성)
+            if self._cost_guard is not None:
+                cost = self._cost_guard.check(generated_sql)
+                if cost.blocked and self._retry_on_block:
+                    generated_sql = self._sql_generator.generate(
+                        user_query=request.user_query,
+                        schema_context=self._with_cost_feedback(schema_context, generated_sql, cost),
                     )
+                    cost = self._cost_guard.check(generated_sql)
+                    regenerated = True
+
+            if self._sql_cache and used_tables and (regenerated or not cache_hit):
+                if cost is None or not cost.blocked:
+                    self._sql_cache.store(request.user_query, used_tables, generated_sql, cache_epoch)
 
-            # 3. SQL 생성
-            generated_sql = self._sql_generator.generate(
+            query_log.complete(generated_sql)
+
+        except Exception as e:
+            query_log.fail(str(e))
+            raise
+
+        # 5. 저장
+        saved_log = self._query_log_repository.save(query_log)
+
+        # 6. 응답 반환
+        return self._build_response(
+            saved_log,
+            used_tables,
+            cache_hit,
+            cost=cost,
+            regenerated=regenerated,
+            prompt_tokens=prompt_tokens,
+        )
+
+    async def aexecute(self, request: GenerateSQLRequest) -> GenerateSQLResponse:
+        """유스케이스 비동기 실행.
+
+        LLM 호출은 ``agenerate``로 이벤트 루프에서 대기하고, 블로킹 I/O(벡터 검색,
+        임베딩, DB 저장)는 워커 스레드로 넘겨 요청이 스레드풀 슬롯을 점유하지 않습니다.
+        """
+        query_log = QueryLog(user_query=request.user_query)
+        query_log.mark_processing()
+
+        coalesced = False
+
+        try:
+            if self._singleflight is not None:
+                generation, coalesced = await self._singleflight.do(
+                    self._flight_key(request),
+                    lambda: self._agenerate_sql(request),
+                )
+            else:
+                generation = await self._agenerate_sql(request)
+
+            query_log.complete(generation.sql)
+
+        except Exception as e:
+            query_log.fail(str(e))
+            raise
+
+        # 합류한 요청도 각자의 QueryLog를 가짐
+        saved_log = await self._query_log_repository.asave(query_log)
+
+        return self._build_response(
+            saved_log,
+            generation.used_tables,
+            generation.cache_hit,
+            coalesced,
+            cost=generation.cost,
+            regenerated=generation.regenerated,
+            prompt_tokens=generation.prompt_tokens,
+        )
+
+    async def _agenerate_sql(self, request: GenerateSQLRequest) -> _Generation:
+        """검색 → 캐시 조회 → LLM 생성 → 비용 검사를 수행합니다."""
+        schema_context, used_tables, prompt_tokens = await self._aresolve_context(request)
+
+        generated_sql, cache_epoch = await self._alookup_cache(request, used_tables)
+        cache_hit = generated_sql is not None
+        if not cache_hit:
+            generated_sql = await self._sql_generator.agenerate(
                 user_query=request.user_query,
                 schema_context=schema_context,
             )
+
+        generation = await self._aguard(
+            request,
+            schema_context,
+            _Generation(
+                generated_sql, used_tables, cache_hit, prompt_tokens=prompt_tokens, cache_epoch=cache_epoch
+            ),
+        )
+        if generation.regenerated or not cache_hit:
+            await self._astore_cache(request, generation)
+        return generation
+
+    async def _aguard(
+        self,
+        request: GenerateSQLRequest,
+        schema_context: str,
+        generation: _Generation,
+        allow_retry: bool = True,
+    ) -> _Generation:
+        """생성된 SQL의 실행 계획을 검사하고, 차단되면 계획을 피드백으로 한 번 재생성합니다.
+
+        ``generation.cost``가 이미 있으면 그 판정을 그대로 사용합니다 (EXPLAIN 중복 방지).
+        """
+        if self._cost_guard is None:
+            return generation
+
+        if generation.cost is None:
+            generation.cost = await self._cost_guard.acheck(generation.sql)
+        if generation.cost.blocked and allow_retry and self._retry_on_block:
+            generation.sql = await self._sql_generator.agenerate(
+                user_query=request.user_query,
+                schema_context=self._with_cost_feedback(schema_context, generation.sql, generation.cost),
+            )
+            generation.cost = await self._cost_guard.acheck(generation.sql)
+            generation.regenerated = True
+        return generation
+
+    @staticmethod
+    def _with_cost_feedback(schema_context: str, sql: str, cost: CostVerdict) -> str:
+        """차단된 SQL과 실행 계획 요약을 스키마 컨텍스트 뒤에 덧붙입니다."""
+        reasons = "\n".join(f"- {reason}" for reason in cost.reasons)
+        plan = "\n".join(cost.plan)
+        return (
+            f"{schema_context}\n\n"
+            "The previous query was rejected because its execution plan is too expensive.\n"
+            f"Previous query:\n{sql}\n\nReasons:\n{reasons}\n\nPlan:\n{plan}\n\n"
+            "Rewrite it so that filters and joins use indexed columns, every joined table has a "
+            "join condition, and large tables are not scanned in full."
+        )
+
+    def _flight_key(self, request: GenerateSQLRequest) -> tuple:
+        """동일 요청 판별 키: 정규화된 질문 + 스키마 버전 + 명시적 컨텍스트."""
+        schema_version = self._schema_retriever.schema_version if self._schema_retriever else 0
+        return (
+            normalize_query(request.user_query),
+            schema_version,
+            request.use_rag,
+            request.schema_context,
+        )
+
+    async def astream(self, request: GenerateSQLRequest) -> AsyncIterator[GenerateSQLEvent]:
+        """SQL 생성 과정을 이벤트 스트림으로 실행합니다.
+
+        QueryLog는 시작 시점에 PROCESSING 상태로 저장되어 ``query_log_id``가 먼저
+        확정되고, 스트림이 끝나면 COMPLETED/FAILED로 갱신됩니다.
+
+        Yields:
+            ``tables`` → ``delta``(반복) → ``done`` 순서의 이벤트.
+            실패 시 ``error`` 이벤트로 종료됩니다.
+        """
+        query_log = QueryLog(user_query=request.user_query)
+        query_log.mark_processing()
+        await self._query_log_repository.asave(query_log)
+        query_log_id = str(query_log.id)
+
+        try:
+            schema_context, used_tables, prompt_tokens = await self._aresolve_context(request)
+            yield GenerateSQLEvent(
+                "tables",
+                {"query_log_id": query_log_id, "tables": used_tables or [], "prompt_tokens": prompt_tokens},
+            )
+
+            generated_sql, cache_epoch = await self._alookup_cache(request, used_tables)
+            cache_hit = generated_sql is not None
+
+            if cache_hit:
+                yield GenerateSQLEvent("delta", {"text": generated_sql})
+            else:
+                parts = []
+                async for delta in self._sql_generator.astream(
+                    user_query=request.user_query,
+                    schema_context=schema_context,
+                ):
+                    parts.append(delta)
+                    yield GenerateSQLEvent("delta", {"text": delta})
+                generated_sql = "".join(parts)
+
+            generation = _Generation(
+                generated_sql, used_tables, cache_hit, prompt_tokens=prompt_tokens, cache_epoch=cache_epoch
+            )
+            if self._cost_guard is not None:
+                generation.cost = await self._cost_guard.acheck(generated_sql)
+                if generation.cost.blocked and self._retry_on_block:
+                    # 이미 보낸 SQL은 폐기: 클라이언트는 done의 generated_sql로 교체
+                    yield GenerateSQLEvent("retry", {"cost": generation.cost.to_dict()})
+                    generation = await self._aguard(request, schema_context, generation)
+            if generation.regenerated or not cache_hit:
+                await self._astore_cache(request, generation)
+            generated_sql = generation.sql
+
             query_log.complete(generated_sql)
+            await self._query_log_repository.asave(query_log)
 
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 종료: 로그만 마무리하고 더 이상 이벤트를 보내지 않음
+            # 저장 자체는 다시 취소되지 않도록 shield (블로킹 save로 이벤트 루프를 막지 않음)
+            query_log.fail("Stream cancelled by client")
+            await asyncio.shield(self._query_log_repository.asave(query_log))
+            raise
         except Exception as e:
             query_log.fail(str(e))
-            raise
+            await self._query_log_repository.asave(query_log)
+            yield GenerateSQLEvent("error", {"query_log_id": query_log_id, "message": str(e)})
+            return
 
-        # 4. 저장
-        saved_log = self._query_log_repository.save(query_log)
+        yield GenerateSQLEvent(
+            "done",
+            {
+                "query_log_id": query_log_id,
+                "generated_sql": generated_sql,
+                "status": query_log.status.value,
+                "used_tables": used_tables,
+                "cache_hit": cache_hit,
+                "cost": generation.cost.to_dict() if generation.cost else None,
+                "regenerated": generation.regenerated,
+                "prompt_tokens": prompt_tokens,
+            },
+        )
+
+    async def aexecute_batch(
+        self,
+        requests: list[GenerateSQLRequest],
+        max_concurrency: int,
+    ) -> list[GenerateSQLBatchItem]:
+        """여러 질문을 일괄 변환합니다.
+
+        RAG 검색은 한 번의 일괄 검색으로 처리하고, LLM 호출은 ``max_concurrency``개까지만
+        동시에 실행합니다. 개별 실패는 해당 항목의 ``error``로 보고되며, 모든 QueryLog는
+        마지막에 한 번에 저장됩니다.
+        """
+        query_logs = [QueryLog(user_query=r.user_query) for r in requests]
+        for query_log in query_logs:
+            query_log.mark_processing()
+
+        retrieved_by_index: dict[int, list[RetrievedSchema]] = {}
+        rag_indices = [i for i, r in enumerate(requests) if self._should_use_rag(r)]
+        if rag_indices:
+            retrieved = await self._schema_retriever.aretrieve_many(
+                [requests[i].user_query for i in rag_indices],
+                top_k=5,
+            )
+            retrieved_by_index = {i: schemas for i, schemas in zip(rag_indices, retrieved) if schemas}
+
+        def build_contexts() -> list[tuple[str, list[str] | None, int | None]]:
+            contexts = []
+            for i, request in enumerate(requests):
+                schemas = retrieved_by_index.get(i)
+                schema_context, prompt_tokens = self._build_context(request, schemas)
+                used_tables = [s.table_name for s in schemas] if schemas else None
+                contexts.append((schema_context, used_tables, prompt_tokens))
+            return contexts
+
+        contexts = await asyncio.to_thread(build_contexts)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(index: int) -> GenerateSQLBatchItem:
+            request, query_log = requests[index], query_logs[index]
+            schema_context, used_tables, prompt_tokens = contexts[index]
+            cache_hit = False
+            cost = None
+            try:
+                generated_sql, cache_epoch = await self._alookup_cache(request, used_tables)
+                cache_hit = generated_sql is not None
+                if generated_sql is None:
+                    async with semaphore:
+                        generated_sql = await self._sql_generator.agenerate(
+                            user_query=request.user_query,
+                            schema_context=schema_context,
+                        )
+                # 일괄 처리에서는 재생성하지 않고 판정만 기록 (LLM 동시성 한도 유지)
+                generation = await self._aguard(
+                    request,
+                    schema_context,
+                    _Generation(generated_sql, used_tables, cache_hit, cache_epoch=cache_epoch),
+                    allow_retry=False,
+                )
+                cost = generation.cost.to_dict() if generation.cost else None
+                if not cache_hit:
+                    await self._astore_cache(request, generation)
+                query_log.complete(generated_sql)
+            except Exception as e:
+                query_log.fail(str(e))
+
+            return GenerateSQLBatchItem(
+                index=index,
+                query_log_id=str(query_log.id),
+                user_query=query_log.user_query,
+                status=query_log.status.value,
+                generated_sql=query_log.generated_sql,
+                used_tables=used_tables,
+                cache_hit=cache_hit,
+                cost=cost,
+                prompt_tokens=prompt_tokens,
+                error=query_log.error_message,
+            )
+
+        items = await asyncio.gather(*(run(i) for i in range(len(requests))))
+        await self._query_log_repository.asave_all(query_logs)
+        return list(items)
+
+    async def _aresolve_context(
+        self, request: GenerateSQLRequest
+    ) -> tuple[str, list[str] | None, int | None]:
+        """스키마 컨텍스트, RAG로 검색된 테이블 목록, 프롬프트 토큰 수를 결정합니다."""
+        schemas = None
+        if self._should_use_rag(request):
+            schemas = await self._schema_retriever.aretrieve(
+                query=request.user_query,
+                top_k=5
+            )
+
+        used_tables = [s.table_name for s in schemas] if schemas else None
+        if self._context_builder is None:
+            schema_context, prompt_tokens = self._build_context(request, schemas)
+        else:
+            # 테이블 정보 조회와 토큰 계산은 워커 스레드에서
+            schema_context, prompt_tokens = await asyncio.to_thread(self._build_context, request, schemas)
+        return schema_context, used_tables, prompt_tokens
+
+    def _build_context(
+        self, request: GenerateSQLRequest, schemas: list[RetrievedSchema] | None
+    ) -> tuple[str, int | None]:
+        """검색 결과(없으면 요청의 컨텍스트)로 프롬프트용 컨텍스트와 토큰 수를 만듭니다."""
+        if not schemas:
+            if self._context_builder is None:
+                return request.schema_context, None
+            builder = self._context_builder
+            return request.schema_context, (
+                builder.count_tokens(request.schema_context) + builder.count_tokens(request.user_query)
+            )
+
+        if self._context_builder is None:
+            return self._schema_retriever.format_context(schemas), None
+        context = self._context_builder.build(request.user_query, schemas)
+        return context.text, context.prompt_tokens
+
+    async def _alookup_cache(
+        self, request: GenerateSQLRequest, used_tables: list[str] | None
+    ) -> tuple[str | None, int | None]:
+        """캐시된 SQL과 조회 시점의 무효화 세대 (저장 시 생성 중 DDL 여부 판별용)."""
+        if not (self._sql_cache and used_tables):
+            return None, None
+        cache = self._sql_cache
+
+        def lookup() -> tuple[str | None, int]:
+            epoch = cache.epoch(used_tables)
+            return cache.lookup(request.user_query, used_tables), epoch
+
+        return await asyncio.to_thread(lookup)
+
+    async def _astore_cache(self, request: GenerateSQLRequest, generation: _Generation) -> None:
+        # 비용 검사에서 차단된 SQL은 재사용하지 않음
+        if not (self._sql_cache and generation.used_tables):
+            return
+        if generation.cost is not None and generation.cost.blocked:
+            return
+        await asyncio.to_thread(
+            self._sql_cache.store,
+            request.user_query,
+            generation.used_tables,
+            generation.sql,
+            generation.cache_epoch,
+        )
+
+    def _should_use_rag(self, request: GenerateSQLRequest) -> bool:
+        return bool(request.use_rag and self._schema_retriever and not request.schema_context)
 
-        # 5. 응답 반환
+    @staticmethod
+    def _build_response(
+        saved_log: QueryLog,
+        used_tables: list[str] | None,
+        cache_hit: bool,
+        coalesced: bool = False,
+        cost: CostVerdict | None = None,
+        regenerated: bool = False,
+        prompt_tokens: int | None = None,
+    ) -> GenerateSQLResponse:
         return GenerateSQLResponse(
             query_log_id=str(saved_log.id),
             user_query=saved_log.user_query,
             generated_sql=saved_log.generated_sql or "",
             status=saved_log.status.value,
             used_tables=used_tables,
+            cache_hit=cache_hit,
+            coalesced=coalesced,
+            cost=cost.to_dict() if cost else None,
+            regenerated=regenerated,
+            prompt_tokens=prompt_tokens,
         )
 
@@ -0,0 +1,75 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from agent.domain.entities.query_log import QueryLog, QueryLogStatus
+from agent.domain.repositories.query_log_repository import QueryLogKey, QueryLogRepository
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서."""
+
+
+def encode_cursor(key: QueryLogKey) -> str:
+    """(created_at, id) 위치를 불투명한 커서 문자열로 변환합니다."""
+    created_at, id = key
+    payload = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> QueryLogKey:
+    """``encode_cursor``로 만든 커서를 (created_at, id)로 되돌립니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class ListQueryLogsRequest:
+    """질의 로그 목록 조회 요청 DTO."""
+
+    limit: int = 50
+    cursor: Optional[str] = None
+    status: Optional[QueryLogStatus] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+@dataclass
+class ListQueryLogsResponse:
+    """질의 로그 목록 조회 응답 DTO."""
+
+    items: list[QueryLog]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+
+class ListQueryLogsUseCase:
+    """질의 로그를 최신순 키셋 페이지로 조회하는 유스케이스."""
+
+    def __init__(self, query_log_repository: QueryLogRepository):
+        self._query_log_repository = query_log_repository
+
+    def execute(self, request: ListQueryLogsRequest) -> ListQueryLogsResponse:
+        after = decode_cursor(request.cursor) if request.cursor else None
+
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        logs = self._query_log_repository.find_page(
+            request.limit + 1,
+            after=after,
+            status=request.status,
+            created_from=request.created_from,
+            created_to=request.created_to,
+        )
+
+        items = logs[: request.limit]
+        next_cursor = None
+        if len(logs) > request.limit:
+            next_cursor = encode_cursor((items[-1].created_at, items[-1].id))
+
+        return ListQueryLogsResponse(items=items, next_cursor=next_cursor)
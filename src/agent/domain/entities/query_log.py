@@ -22,6 +22,8 @@ class QueryLog:
     status: QueryLogStatus = QueryLogStatus.PENDING
     error_message: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
+    execution_time_ms: Optional[float] = None  # 생성된 SQL을 실행한 경우에만 기록
+    row_count: Optional[int] = None
 
     def mark_processing(self) -> None:
         self.status = QueryLogStatus.PROCESSING
@@ -33,3 +35,7 @@ class QueryLog:
     def fail(self, error: str) -> None:
         self.error_message = error
         self.status = QueryLogStatus.FAILED
+
+    def record_execution(self, execution_time_ms: float, row_count: int) -> None:
+        self.execution_time_ms = execution_time_ms
+        self.row_count = row_count
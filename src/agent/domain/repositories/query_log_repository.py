@@ -1,8 +1,13 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterator, Optional
 from uuid import UUID
 
-from agent.domain.entities.query_log import QueryLog
+from agent.domain.entities.query_log import QueryLog, QueryLogStatus
+
+# 키셋 페이지네이션 위치: (created_at, id)
+QueryLogKey = tuple[datetime, UUID]
 
 
 class QueryLogRepository(ABC):
@@ -13,16 +18,68 @@ class QueryLogRepository(ABC):
         """QueryLog를 저장합니다."""
         pass
 
+    async def asave(self, query_log: QueryLog) -> QueryLog:
+        """``save``의 비동기 버전 (기본 구현은 워커 스레드에서 실행)."""
+        return await asyncio.to_thread(self.save, query_log)
+
+    def save_all(self, query_logs: list[QueryLog]) -> list[QueryLog]:
+        """여러 QueryLog를 저장합니다 (구현체는 단일 트랜잭션으로 처리)."""
+        return [self.save(query_log) for query_log in query_logs]
+
+    async def asave_all(self, query_logs: list[QueryLog]) -> list[QueryLog]:
+        """``save_all``의 비동기 버전 (기본 구현은 워커 스레드에서 실행)."""
+        return await asyncio.to_thread(self.save_all, query_logs)
+
     @abstractmethod
     def find_by_id(self, id: UUID) -> Optional[QueryLog]:
         """ID로 QueryLog를 조회합니다."""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[QueryLog]:
-        """모든 QueryLog를 조회합니다."""
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[QueryLogKey] = None,
+        status: Optional[QueryLogStatus] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[QueryLog]:
+        """QueryLog를 최신순 ``(created_at, id)`` 키셋 페이지로 조회합니다.
+
+        Args:
+            limit: 페이지 크기
+            after: 이전 페이지 마지막 항목의 (created_at, id). 이 위치 이후부터 조회
+            status: 상태 필터
+            created_from: 생성 시각 하한 (포함)
+            created_to: 생성 시각 상한 (미포함)
+        """
         pass
 
+    def iter_logs(
+        self,
+        status: Optional[QueryLogStatus] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[QueryLog]:
+        """조건에 맞는 QueryLog를 최신순으로 ``batch_size``개씩 나누어 순회합니다.
+
+        전체를 메모리에 올리지 않으며, 각 배치는 키셋 조회 한 번입니다.
+        """
+        after = None
+        while True:
+            page = self.find_page(
+                batch_size,
+                after=after,
+                status=status,
+                created_from=created_from,
+                created_to=created_to,
+            )
+            yield from page
+            if len(page) < batch_size:
+                return
+            after = (page[-1].created_at, page[-1].id)
+
     @abstractmethod
     def delete(self, id: UUID) -> bool:
         """QueryLog를 삭제합니다."""
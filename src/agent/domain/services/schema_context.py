@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from agent.domain.services.schema_retriever import RetrievedSchema
+
+
+@dataclass
+class SchemaContext:
+    """LLM 프롬프트에 넣을 스키마 컨텍스트."""
+
+    text: str
+    prompt_tokens: int  # 스키마 컨텍스트 + 질문 토큰 수 (고정 시스템 지시문 제외)
+    tables: list[str] = field(default_factory=list)
+    columns_total: int = 0
+    columns_included: int = 0  # 타입과 함께 포함된 컬럼 수 (나머지는 이름만 또는 생략)
+
+
+class SchemaContextBuilder(ABC):
+    """검색된 스키마로 토큰 예산 안의 컨텍스트를 만드는 인터페이스."""
+
+    @abstractmethod
+    def build(self, user_query: str, schemas: list[RetrievedSchema]) -> SchemaContext:
+        """질문과 관련도가 높은 컬럼 위주로 스키마 컨텍스트를 구성합니다.
+
+        Args:
+            user_query: 사용자의 자연어 질문
+            schemas: 관련성 순으로 정렬된 검색 결과
+        """
+        pass
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """프롬프트 토큰 수를 셉니다."""
+        pass
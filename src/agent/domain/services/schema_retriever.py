@@ -1,5 +1,18 @@
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class JoinKey:
+    """FK 조인 조건 (``table.column = ref_table.ref_column``)."""
+    table: str
+    column: str
+    ref_table: str
+    ref_column: str
+
+    def __str__(self) -> str:
+        return f"{self.table}.{self.column} = {self.ref_table}.{self.ref_column}"
 
 
 @dataclass
@@ -9,11 +22,32 @@ class RetrievedSchema:
     document: str
     relevance_score: float
     metadata: dict
+    matched_columns: list[str] = field(default_factory=list)  # 컬럼 단위 검색에 걸린 컬럼 (관련성 순)
+    # 앞선 테이블과 이 테이블을 잇는 조인 조건, 검색 결과끼리 잇기 위해 추가된 테이블이면 bridge
+    join_keys: list[JoinKey] = field(default_factory=list)
+    bridge: bool = False
+
+
+def format_join_keys(schemas: list[RetrievedSchema], table_names: set[str] | None = None) -> str:
+    """컨텍스트에 포함된 테이블 사이의 조인 조건 한 줄 (없으면 빈 문자열)."""
+    names = table_names if table_names is not None else {s.table_name for s in schemas}
+    keys = [
+        str(key)
+        for schema in schemas
+        for key in schema.join_keys
+        if key.table in names and key.ref_table in names
+    ]
+    return f"Join keys: {'; '.join(keys)}" if keys else ""
 
 
 class SchemaRetriever(ABC):
     """스키마 검색 인터페이스."""
 
+    @property
+    def schema_version(self) -> int:
+        """검색 대상 스키마 인덱스의 버전 (인덱스가 바뀔 때마다 증가)."""
+        return 0
+
     @abstractmethod
     def retrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
         """사용자 쿼리와 관련된 스키마를 검색합니다.
@@ -27,6 +61,37 @@ class SchemaRetriever(ABC):
         """
         pass
 
+    async def aretrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        """``retrieve``의 비동기 버전 (기본 구현은 워커 스레드에서 실행)."""
+        return await asyncio.to_thread(self.retrieve, query, top_k)
+
+    def retrieve_many(self, queries: list[str], top_k: int = 5) -> list[list[RetrievedSchema]]:
+        """여러 질문의 스키마를 검색합니다.
+
+        기본 구현은 질문마다 ``retrieve``를 호출하며, 일괄 검색을 지원하는
+        구현체가 재정의합니다.
+
+        Returns:
+            입력 질문 순서와 같은 순서의 검색 결과 목록
+        """
+        return [self.retrieve(query, top_k) for query in queries]
+
+    async def aretrieve_many(self, queries: list[str], top_k: int = 5) -> list[list[RetrievedSchema]]:
+        """``retrieve_many``의 비동기 버전 (기본 구현은 워커 스레드에서 실행)."""
+        return await asyncio.to_thread(self.retrieve_many, queries, top_k)
+
+    @abstractmethod
+    def format_context(self, schemas: list[RetrievedSchema]) -> str:
+        """이미 검색된 스키마 목록을 LLM 컨텍스트 문자열로 변환합니다.
+
+        Args:
+            schemas: ``retrieve()``가 반환한 스키마 목록
+
+        Returns:
+            LLM에 전달할 스키마 컨텍스트 문자열
+        """
+        pass
+
     @abstractmethod
     def build_context(self, query: str, top_k: int = 5) -> str:
         """검색된 스키마를 LLM 컨텍스트 문자열로 변환합니다.
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class SQLResponseCache(ABC):
+    """생성된 SQL 응답 캐시 인터페이스."""
+
+    @abstractmethod
+    def lookup(self, user_query: str, tables: Iterable[str]) -> str | None:
+        """재사용 가능한 SQL을 조회합니다.
+
+        Args:
+            user_query: 사용자의 자연어 질문
+            tables: 이번 요청에서 검색된 테이블 목록
+
+        Returns:
+            캐시된 SQL, 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def store(self, user_query: str, tables: Iterable[str], sql: str, epoch: int | None = None) -> None:
+        """완료된 SQL 생성 결과를 저장합니다.
+
+        Args:
+            epoch: 조회 시점의 ``epoch(tables)``. 생성하는 동안 테이블이 무효화되었으면
+                저장하지 않음
+        """
+        pass
+
+    def epoch(self, tables: Iterable[str]) -> int:
+        """테이블들의 무효화 세대 (무효화될 때마다 바뀜). 기본 구현은 항상 0."""
+        return 0
+
+    @abstractmethod
+    def invalidate_tables(self, table_names: Iterable[str]) -> int:
+        """지정된 테이블에 의존하는 항목을 제거하고 제거된 수를 반환합니다."""
+        pass
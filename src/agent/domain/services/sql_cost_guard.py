@@ -0,0 +1,50 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+COST_OK = "ok"
+COST_WARN = "warn"
+COST_BLOCK = "block"
+
+
+@dataclass
+class CostVerdict:
+    """생성된 SQL의 실행 계획 검사 결과."""
+
+    verdict: str  # ok | warn | block
+    reasons: list[str] = field(default_factory=list)
+    estimated_rows: Optional[int] = None  # 계획상 가장 큰 중간 결과 행 수 (추정)
+    full_scans: list[str] = field(default_factory=list)  # 인덱스 없이 전체 스캔하는 테이블
+    plan: list[str] = field(default_factory=list)  # 실행 계획 요약
+    elapsed_ms: float = 0.0
+
+    @property
+    def blocked(self) -> bool:
+        return self.verdict == COST_BLOCK
+
+    def to_dict(self) -> dict:
+        return {
+            "verdict": self.verdict,
+            "reasons": self.reasons,
+            "estimated_rows": self.estimated_rows,
+            "full_scans": self.full_scans,
+            "plan": self.plan,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+        }
+
+
+class SQLCostGuard(ABC):
+    """생성된 SQL을 실행 전에 비용 기준으로 분류하는 인터페이스."""
+
+    @abstractmethod
+    def check(self, sql: str) -> CostVerdict:
+        """SQL의 실행 계획을 분석해 ok/warn/block으로 분류합니다.
+
+        SQL을 실제로 실행하지는 않습니다.
+        """
+        pass
+
+    async def acheck(self, sql: str) -> CostVerdict:
+        """``check``의 비동기 버전 (기본 구현은 워커 스레드에서 실행)."""
+        return await asyncio.to_thread(self.check, sql)
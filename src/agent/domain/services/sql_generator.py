@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 
 class SQLGenerator(ABC):
@@ -16,3 +18,19 @@ class SQLGenerator(ABC):
             생성된 SQL 쿼리
         """
         pass
+
+    async def agenerate(self, user_query: str, schema_context: str) -> str:
+        """``generate``의 비동기 버전.
+
+        기본 구현은 워커 스레드에서 ``generate``를 실행하며, 비동기 클라이언트를
+        가진 구현체는 이벤트 루프를 막지 않도록 재정의해야 합니다.
+        """
+        return await asyncio.to_thread(self.generate, user_query, schema_context)
+
+    async def astream(self, user_query: str, schema_context: str) -> AsyncIterator[str]:
+        """생성되는 SQL을 토큰 단위로 스트리밍합니다.
+
+        기본 구현은 전체 결과를 한 번에 내보내며, 스트리밍을 지원하는 구현체가
+        재정의합니다.
+        """
+        yield await self.agenerate(user_query, schema_context)
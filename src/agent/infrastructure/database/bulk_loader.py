@@ -0,0 +1,260 @@
+"""Bulk row ingestion with chunked executemany."""
+
+import codecs
+import csv
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+from agent.config import settings
+
+_MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class BulkChunkError:
+    """실패한 청크 정보. ``start_row``는 입력 기준 0부터 시작하는 행 번호."""
+
+    chunk: int
+    start_row: int
+    rows: int
+    error: str
+
+
+@dataclass
+class BulkLoadResult:
+    """일괄 적재 결과."""
+
+    columns: list[str] = field(default_factory=list)
+    inserted: int = 0
+    failed: int = 0
+    chunks: int = 0
+    errors: list[BulkChunkError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    stopped: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.inserted / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": self.columns,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "errors": [e.__dict__ for e in self.errors],
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "stopped": self.stopped,
+        }
+
+
+class BulkRowLoader:
+    """행들을 ``chunk_size``개씩 executemany로 삽입합니다.
+
+    컬럼은 첫 행(또는 CSV 헤더)에서 한 번 정하고 리플렉션한 테이블 컬럼과 한 번만
+    비교합니다. 청크마다 하나의 트랜잭션이며, 실패한 청크는 롤백되어 오류 목록에
+    기록되고 다음 청크로 넘어갑니다 (``stop_on_error``이면 중단).
+
+    ``relax_durability``이면 SQLite에서 적재하는 동안만 ``synchronous=OFF``로
+    커밋마다의 fsync를 생략합니다. 적재 도중 전원이 꺼지면 마지막 청크들이
+    유실될 수 있습니다.
+    """
+
+    def __init__(self, engine: Engine, chunk_size: int | None = None):
+        self._engine = engine
+        self._chunk_size = chunk_size or settings.bulk_insert_chunk_size
+
+    def load(
+        self,
+        table_name: str,
+        rows: Iterable[dict | Sequence],
+        columns: Optional[list[str]] = None,
+        relax_durability: bool = False,
+        stop_on_error: bool = False,
+    ) -> BulkLoadResult:
+        """행을 적재합니다.
+
+        Args:
+            rows: dict(컬럼 → 값) 또는 ``columns`` 순서의 시퀀스. dict에 없는 컬럼은 INSERT에서
+                빠지므로 컬럼 DEFAULT가 적용됨
+            columns: 시퀀스 행의 컬럼 순서. 없으면 첫 dict 행의 키 사용
+
+        Raises:
+            ValueError: 테이블에 없는 컬럼
+        """
+        start = time.perf_counter()
+        result = BulkLoadResult()
+        rows = iter(rows)
+
+        if columns is None:
+            first = next(rows, None)
+            if first is None:
+                return result
+            if not isinstance(first, dict):
+                raise ValueError("컬럼 목록 없이 시퀀스 행을 적재할 수 없습니다.")
+            columns = list(first)
+            rows = itertools.chain([first], rows)
+
+        existing = {c["name"] for c in inspect(self._engine).get_columns(table_name)}
+        unknown = [c for c in columns if c not in existing]
+        if unknown:
+            raise ValueError(f"테이블 '{table_name}'에 없는 컬럼입니다: {', '.join(unknown)}")
+        result.columns = list(columns)
+
+        with self._engine.connect() as conn:
+            restore = self._relax(conn) if relax_durability else None
+            try:
+                self._load_chunks(conn, table_name, columns, rows, result, stop_on_error)
+            finally:
+                if restore is not None:
+                    conn.exec_driver_sql(f"PRAGMA synchronous={restore}")
+
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    def _insert_sql(self, table_name: str, columns: list[str]) -> str:
+        """드라이버 executemany에 바로 넘길 INSERT 문 (행을 튜플로 전달해 변환 비용 절약)."""
+        dialect = self._engine.dialect
+        quote = dialect.identifier_preparer.quote
+        if not columns:
+            return f"INSERT INTO {quote(table_name)} DEFAULT VALUES"
+        placeholders = {
+            "qmark": ["?"] * len(columns),
+            "format": ["%s"] * len(columns),
+            "pyformat": ["%s"] * len(columns),
+            "numeric": [f":{i + 1}" for i in range(len(columns))],
+        }.get(dialect.paramstyle)
+        if placeholders is None:
+            raise ValueError(f"지원하지 않는 paramstyle입니다: {dialect.paramstyle}")
+        return (
+            f"INSERT INTO {quote(table_name)} ({', '.join(quote(c) for c in columns)}) "
+            f"VALUES ({', '.join(placeholders)})"
+        )
+
+    def _load_chunks(
+        self,
+        conn: Connection,
+        table_name: str,
+        columns: list[str],
+        rows: Iterator,
+        result: BulkLoadResult,
+        stop_on_error: bool,
+    ) -> None:
+        column_set = set(columns)
+        width = len(columns)
+        full = tuple(columns)
+        # 일부 키만 있는 dict 행은 그 키들만으로 INSERT (빠진 컬럼은 DEFAULT)
+        statements: dict[tuple[str, ...], str] = {}
+        row_number = 0
+
+        while True:
+            chunk_start = row_number
+            params: dict[tuple[str, ...], list[tuple]] = {}
+            invalid: list[str] = []
+            parse_error = None
+            try:
+                for row in itertools.islice(rows, self._chunk_size):
+                    row_number += 1
+                    if isinstance(row, dict):
+                        extra = row.keys() - column_set
+                        if extra:
+                            invalid.append(f"row {row_number - 1}: unexpected columns {sorted(extra)}")
+                        elif len(row) == width:
+                            params.setdefault(full, []).append(tuple(row[c] for c in columns))
+                        else:
+                            present = tuple(c for c in columns if c in row)
+                            params.setdefault(present, []).append(tuple(row[c] for c in present))
+                    elif not isinstance(row, (list, tuple)):
+                        invalid.append(f"row {row_number - 1}: expected object or array, got {type(row).__name__}")
+                    elif len(row) == width:
+                        params.setdefault(full, []).append(tuple(row))
+                    else:
+                        invalid.append(f"row {row_number - 1}: expected {width} values, got {len(row)}")
+            except (ValueError, csv.Error) as e:
+                # 입력 스트림 자체가 깨진 경우: 이미 읽은 행까지 적재하고 중단
+                parse_error = f"input error after row {row_number}: {e}"
+
+            if row_number == chunk_start and parse_error is None:
+                return
+
+            chunk_index = result.chunks
+            result.chunks += 1
+            messages = invalid[:3]
+            failed = len(invalid)
+            if params:
+                count = sum(len(group) for group in params.values())
+                try:
+                    with conn.begin():
+                        for keys, group in params.items():
+                            if keys not in statements:
+                                statements[keys] = self._insert_sql(table_name, list(keys))
+                            conn.exec_driver_sql(statements[keys], group)
+                    result.inserted += count
+                except Exception as e:
+                    failed += count
+                    messages.append(str(e).splitlines()[0])
+            if parse_error is not None:
+                messages.append(parse_error)
+
+            if messages:
+                result.failed += failed
+                if len(result.errors) < _MAX_REPORTED_ERRORS:
+                    result.errors.append(
+                        BulkChunkError(chunk_index, chunk_start, row_number - chunk_start, "; ".join(messages))
+                    )
+                if stop_on_error or parse_error is not None:
+                    result.stopped = True
+                    return
+
+    def _relax(self, conn: Connection) -> Optional[int]:
+        """SQLite 내구성 PRAGMA를 완화하고 복원할 값을 반환합니다."""
+        if self._engine.dialect.name != "sqlite":
+            return None
+        previous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        conn.commit()
+        return previous
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """바이트 청크 스트림을 줄바꿈을 유지한 텍스트 줄로 나눕니다."""
+    pending = ""
+    for text in codecs.iterdecode(chunks, "utf-8-sig"):
+        *lines, pending = (pending + text).split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+def iter_csv_rows(chunks: Iterable[bytes]) -> tuple[list[str], Iterator[list]]:
+    """CSV 스트림을 (헤더, 행 이터레이터)로 변환합니다. 빈 값은 NULL로 적재됩니다."""
+    reader = csv.reader(_iter_lines(chunks))
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV 헤더가 없습니다.")
+
+    def rows() -> Iterator[list]:
+        for row in reader:
+            if row:
+                yield [value if value != "" else None for value in row]
+
+    return [h.strip() for h in header], rows()
+
+
+def iter_ndjson_records(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """NDJSON 스트림의 각 줄을 dict로 변환합니다."""
+    for number, line in enumerate(_iter_lines(chunks)):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(f"line {number + 1}: JSON object expected")
+        yield record
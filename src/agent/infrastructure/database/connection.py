@@ -1,19 +1,21 @@
-from sqlalchemy import create_engine
+from typing import Callable
+
+from sqlalchemy import inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-DATABASE_URL = "sqlite:///./sql_agent.db"
+from agent.infrastructure.database.engine_factory import create_engine_from_settings
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # SQLite 멀티스레드 지원
-    echo=True,  # SQL 로그 출력 (개발용)
-)
+# settings.database_url / database_profile 기반 엔진
+engine = create_engine_from_settings()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# shutdown_db()에서 엔진 정리 전에 실행할 훅 (버퍼 플러시 등)
+_shutdown_hooks: list[Callable[[], None]] = []
+
 
 def get_engine() -> Engine:
     """Get database engine dependency."""
@@ -30,10 +32,45 @@ def get_db():
 
 
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+
+    # create_all은 이미 존재하는 테이블의 새 인덱스를 만들지 않으므로 개별 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def _add_missing_columns() -> None:
+    """기존 테이블에 모델에 새로 추가된 nullable 컬럼을 ALTER TABLE로 추가합니다."""
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                )
+                print(f"[DB] Added column {table.name}.{column.name}")
+
+
+def register_shutdown_hook(hook: Callable[[], None]) -> None:
+    """``shutdown_db()`` 시 엔진을 닫기 전에 실행할 함수를 등록합니다."""
+    _shutdown_hooks.append(hook)
 
 
 def shutdown_db():
-    """Shutdown database (cleanup if needed)."""
-    pass  # SQLite는 별도 종료 불필요
+    """Shutdown database: run shutdown hooks, then close pooled connections."""
+    while _shutdown_hooks:
+        hook = _shutdown_hooks.pop()
+        try:
+            hook()
+        except Exception as e:
+            print(f"[DB] Shutdown hook failed: {e}")
+    engine.dispose()
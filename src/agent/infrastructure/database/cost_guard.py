@@ -0,0 +1,311 @@
+"""EXPLAIN-based cost guard for generated SQL."""
+
+import json
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.engine import Connection, Engine
+
+from agent.config import settings
+from agent.domain.services.sql_cost_guard import (
+    COST_BLOCK,
+    COST_OK,
+    COST_WARN,
+    CostVerdict,
+    SQLCostGuard,
+)
+from agent.infrastructure.database.connection import get_engine
+from agent.shared.sql import ensure_read_only, table_aliases
+
+_MAX_PLAN_LINES = 20
+_SQLITE_STEP = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\S+)(.*)$")
+
+
+@dataclass
+class _ScanStep:
+    """실행 계획에서 테이블을 읽는 단계."""
+
+    table: str
+    full_scan: bool
+    rows: Optional[int]  # 테이블 행 수 추정치
+    automatic_index: bool = False
+    group: object = None  # 같은 그룹의 단계들은 중첩 루프로 결합됨
+
+
+class ExplainCostGuard(SQLCostGuard):
+    """``EXPLAIN``으로 얻은 실행 계획을 분석해 생성된 SQL을 분류합니다.
+
+    - 인덱스 없이 전체 스캔하는 테이블이 ``full_scan_rows`` 이상이면 warn,
+      ``block_rows`` 이상이면 block
+    - 계획상 가장 큰 중간 결과(중첩 전체 스캔의 곱, PostgreSQL은 노드별 추정 행 수)가
+      ``warn_rows``/``block_rows`` 이상이면 warn/block
+
+    SQLite는 ``EXPLAIN QUERY PLAN``에 행 수가 없으므로 테이블 크기를 ``sqlite_stat1``
+    또는 ``MAX(rowid)``로 추정해 ``stats_ttl_seconds`` 동안 캐시합니다. 계획 조회는
+    SQL을 실행하지 않으며, 보통 수 밀리초 안에 끝납니다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        warn_rows: int | None = None,
+        block_rows: int | None = None,
+        full_scan_rows: int | None = None,
+        stats_ttl_seconds: float | None = None,
+    ):
+        self._engine = engine
+        self._warn_rows = warn_rows or settings.cost_guard_warn_rows
+        self._block_rows = block_rows or settings.cost_guard_block_rows
+        self._full_scan_rows = full_scan_rows or settings.cost_guard_full_scan_rows
+        self._stats_ttl = (
+            stats_ttl_seconds if stats_ttl_seconds is not None else settings.cost_guard_stats_ttl_seconds
+        )
+        self._row_estimates: dict[str, tuple[Optional[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, sql: str) -> CostVerdict:
+        start = time.perf_counter()
+        sql = sql.strip().rstrip(";")
+        try:
+            ensure_read_only(sql)
+        except ValueError as e:
+            return self._finish(CostVerdict(COST_WARN, [f"실행 계획을 검사하지 않았습니다: {e}"]), start)
+
+        dialect = self._engine.dialect.name
+        try:
+            with self._engine.connect() as conn:
+                if dialect == "sqlite":
+                    steps, estimated_rows, plan = self._sqlite_plan(conn, sql)
+                elif dialect == "postgresql":
+                    steps, estimated_rows, plan = self._postgres_plan(conn, sql)
+                else:
+                    return self._finish(CostVerdict(COST_OK, [f"{dialect}은(는) 비용 검사를 지원하지 않습니다."]), start)
+                conn.rollback()
+        except Exception as e:
+            message = str(e).splitlines()[0]
+            return self._finish(CostVerdict(COST_WARN, [f"EXPLAIN 실패: {message}"]), start)
+
+        return self._finish(self._classify(steps, estimated_rows, plan), start)
+
+    @staticmethod
+    def _finish(verdict: CostVerdict, start: float) -> CostVerdict:
+        verdict.elapsed_ms = (time.perf_counter() - start) * 1000
+        return verdict
+
+    def _classify(self, steps: list[_ScanStep], estimated_rows: Optional[int], plan: list[str]) -> CostVerdict:
+        verdict = CostVerdict(COST_OK, estimated_rows=estimated_rows, plan=plan)
+        level = 0  # 0: ok, 1: warn, 2: block
+
+        for step in steps:
+            if step.full_scan:
+                verdict.full_scans.append(step.table)
+            if step.rows is None or step.rows < self._full_scan_rows:
+                continue
+            if step.full_scan:
+                severe = step.rows >= self._block_rows
+                level = max(level, 2 if severe else 1)
+                verdict.reasons.append(f"{step.table} 전체 스캔 (약 {step.rows:,}행, 사용 가능한 인덱스 없음)")
+            elif step.automatic_index:
+                level = max(level, 1)
+                verdict.reasons.append(f"{step.table}에 적절한 인덱스가 없어 임시 인덱스를 만듭니다 (약 {step.rows:,}행)")
+
+        groups: dict[object, list[_ScanStep]] = {}
+        for step in steps:
+            if step.full_scan:
+                groups.setdefault(step.group, []).append(step)
+        for nested in groups.values():
+            if len(nested) < 2 or any(s.rows is None for s in nested):
+                continue
+            if math.prod(max(s.rows, 1) for s in nested) >= self._warn_rows:
+                level = max(level, 1)
+                names = " × ".join(s.table for s in nested)
+                verdict.reasons.append(f"인덱스 없이 중첩된 전체 스캔 ({names}): 조인 조건 누락(카티션 곱) 가능성")
+
+        if estimated_rows is not None and estimated_rows >= self._warn_rows:
+            level = max(level, 2 if estimated_rows >= self._block_rows else 1)
+            verdict.reasons.append(f"추정 중간 결과 약 {estimated_rows:,}행")
+
+        verdict.verdict = (COST_OK, COST_WARN, COST_BLOCK)[level]
+        return verdict
+
+    # --- SQLite ---------------------------------------------------------
+
+    def _sqlite_plan(self, conn: Connection, sql: str) -> tuple[list[_ScanStep], Optional[int], list[str]]:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        aliases = table_aliases(sql)
+
+        depth: dict[int, int] = {}
+        plan: list[str] = []
+        steps: list[_ScanStep] = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            plan.append("  " * depth[node_id] + detail)
+
+            match = _SQLITE_STEP.match(detail)
+            if match is None:
+                continue
+            kind, name, rest = match.groups()
+            if name == "CONSTANT" or name.startswith("("):
+                continue
+            table = aliases.get(name.lower(), name)
+            rows_estimate = self._sqlite_table_rows(conn, table)
+            if rows_estimate is None:
+                continue  # CTE, 서브쿼리 등 실제 테이블이 아닌 경우
+            steps.append(
+                _ScanStep(
+                    table=table,
+                    full_scan=kind == "SCAN",
+                    rows=rows_estimate,
+                    automatic_index="AUTOMATIC" in rest,
+                    group=parent,
+                )
+            )
+
+        # 같은 부모 아래의 전체 스캔은 중첩 루프: 행 수를 곱해 가장 큰 그룹을 추정치로 사용
+        products: dict[object, int] = {}
+        for step in steps:
+            if step.full_scan:
+                products[step.group] = products.get(step.group, 1) * max(step.rows, 1)
+        estimated = max(products.values(), default=None)
+        return steps, estimated, plan[:_MAX_PLAN_LINES]
+
+    def _sqlite_table_rows(self, conn: Connection, table: str) -> Optional[int]:
+        cached = self._cached_rows(table)
+        if cached is not False:
+            return cached
+
+        rows = None
+        quoted = self._engine.dialect.identifier_preparer.quote(table)
+        try:
+            # ANALYZE 결과가 있으면 우선 사용 (stat의 첫 값이 테이블 행 수)
+            stat = conn.exec_driver_sql(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table,)
+            ).scalar()
+            if stat:
+                rows = int(stat.split()[0])
+        except Exception:
+            pass
+        if rows is None:
+            try:
+                # rowid B-tree의 마지막 키: 전체 COUNT 없이 O(log n)으로 상한 추정
+                rows = conn.exec_driver_sql(f"SELECT MAX(rowid) FROM {quoted}").scalar() or 0
+            except Exception:
+                rows = None
+        self._store_rows(table, rows)
+        return rows
+
+    # --- PostgreSQL -----------------------------------------------------
+
+    def _postgres_plan(self, conn: Connection, sql: str) -> tuple[list[_ScanStep], Optional[int], list[str]]:
+        raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+        document = json.loads(raw) if isinstance(raw, str) else raw
+        root = document[0]["Plan"]
+
+        plan: list[str] = []
+        steps: list[_ScanStep] = []
+        estimated = 0
+
+        def walk(node: dict, level: int, join: Optional[dict]) -> None:
+            nonlocal estimated
+            node_type = node["Node Type"]
+            relation = node.get("Relation Name")
+            plan_rows = int(node.get("Plan Rows", 0))
+            estimated = max(estimated, plan_rows)
+
+            label = f"{node_type} on {relation}" if relation else node_type
+            if node.get("Index Name"):
+                label += f" using {node['Index Name']}"
+            plan.append(f"{'  ' * level}{label} (rows={plan_rows:,}, cost={node.get('Total Cost', 0):,.0f})")
+
+            if relation and node_type in ("Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan"):
+                steps.append(
+                    _ScanStep(
+                        table=relation,
+                        full_scan=node_type == "Seq Scan",
+                        rows=None,
+                        group=id(join) if join is not None else id(node),
+                    )
+                )
+            # 조건 없는 중첩 루프 아래의 스캔은 (Materialize를 거치더라도) 같은 그룹
+            if _is_unconditioned_join(node):
+                child_join = node
+            else:
+                child_join = join if node_type == "Materialize" else None
+            for child in node.get("Plans", []):
+                walk(child, level + 1, child_join)
+
+        walk(root, 0, None)
+
+        scanned = [s.table for s in steps if s.full_scan]
+        table_rows = self._postgres_table_rows(conn, scanned)
+        for step in steps:
+            step.rows = table_rows.get(step.table)
+        return steps, estimated, plan[:_MAX_PLAN_LINES]
+
+    def _postgres_table_rows(self, conn: Connection, tables: list[str]) -> dict[str, Optional[int]]:
+        result: dict[str, Optional[int]] = {}
+        missing = []
+        for table in set(tables):
+            cached = self._cached_rows(table)
+            if cached is False:
+                missing.append(table)
+            else:
+                result[table] = cached
+        if missing:
+            rows = conn.exec_driver_sql(
+                "SELECT relname, reltuples FROM pg_class WHERE relkind IN ('r', 'p') AND relname = ANY(%(names)s)",
+                {"names": missing},
+            ).fetchall()
+            found = {name: int(tuples) if tuples >= 0 else None for name, tuples in rows}
+            for table in missing:
+                result[table] = found.get(table)
+                self._store_rows(table, result[table])
+        return result
+
+    # --- 행 수 추정치 캐시 ----------------------------------------------
+
+    def _cached_rows(self, table: str):
+        """캐시된 행 수 (None일 수 있음). 없거나 만료되었으면 False."""
+        with self._lock:
+            entry = self._row_estimates.get(table)
+        if entry is None or entry[1] <= time.monotonic():
+            return False
+        return entry[0]
+
+    def _store_rows(self, table: str, rows: Optional[int]) -> None:
+        with self._lock:
+            self._row_estimates[table] = (rows, time.monotonic() + self._stats_ttl)
+
+    def invalidate(self) -> None:
+        """행 수 추정치 캐시를 비웁니다."""
+        with self._lock:
+            self._row_estimates.clear()
+
+
+def _is_unconditioned_join(node: dict) -> bool:
+    """조인 조건 없이 두 입력을 곱하는 중첩 루프인지 확인합니다."""
+    return (
+        node.get("Node Type") == "Nested Loop"
+        and not node.get("Join Filter")
+        and not any("Index Cond" in child or "Recheck Cond" in child for child in node.get("Plans", []))
+    )
+
+
+_cost_guard: Optional[ExplainCostGuard] = None
+_guard_lock = threading.Lock()
+
+
+def get_cost_guard() -> Optional[ExplainCostGuard]:
+    """프로세스 전역 비용 검사기를 반환합니다. 비활성화된 경우 None."""
+    global _cost_guard
+    if not settings.cost_guard_enabled:
+        return None
+    if _cost_guard is None:
+        with _guard_lock:
+            if _cost_guard is None:
+                _cost_guard = ExplainCostGuard(get_engine())
+    return _cost_guard
@@ -0,0 +1,282 @@
+"""Settings-driven SQLAlchemy engine factory with pooling profiles."""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from agent.config import Settings, settings as default_settings
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """엔진/커넥션 풀 성능 프로파일."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_timeout_ms: int = 30_000  # PostgreSQL 전용
+    # SQLite 연결별 PRAGMA
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5_000
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    # 새 DB 파일에만 적용됨 (기존 파일은 VACUUM 한 번 필요)
+    sqlite_auto_vacuum: str = "INCREMENTAL"
+
+
+ENGINE_PROFILES: dict[str, EngineProfile] = {
+    "default": EngineProfile(),
+    # 동시 요청이 많은 API 서버
+    "high_concurrency": EngineProfile(
+        pool_size=20,
+        max_overflow=30,
+        pool_timeout=10.0,
+        statement_timeout_ms=15_000,
+        sqlite_busy_timeout_ms=10_000,
+    ),
+    # 메모리가 작은 개발/CI 환경
+    "low_memory": EngineProfile(
+        pool_size=2,
+        max_overflow=3,
+        sqlite_cache_size_kib=8 * 1024,
+        sqlite_mmap_size=0,
+    ),
+    # 긴 분석 쿼리/일괄 작업
+    "batch": EngineProfile(
+        pool_size=4,
+        max_overflow=4,
+        pool_timeout=60.0,
+        statement_timeout_ms=300_000,
+        sqlite_busy_timeout_ms=30_000,
+    ),
+}
+
+
+class PoolStats:
+    """커넥션 풀 체크아웃/대기/오버플로 통계."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.peak_checked_out = 0
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            self.waits += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def record_checkout(self, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "waits": self.waits,
+                "avg_wait_ms": round(self.total_wait_ms / self.waits, 2) if self.waits else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 2),
+                "peak_checked_out": self.peak_checked_out,
+            }
+
+
+# 엔진 → (프로파일 이름, 풀 통계)
+_engine_meta: "weakref.WeakKeyDictionary[Engine, tuple[str, PoolStats]]" = weakref.WeakKeyDictionary()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """커넥션 획득 대기 시간을 측정하는 QueuePool."""
+
+    stats: PoolStats
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        # 음수면 오버플로 무제한 (대기 없음)
+        self.overflow_limit = max_overflow
+
+    def _do_get(self):
+        # 유휴 연결도 없고 오버플로도 다 쓴 경우에만 반납을 기다리게 됨
+        exhausted = (
+            self.checkedin() == 0
+            and self.overflow_limit >= 0
+            and self.checkedout() >= self.size() + self.overflow_limit
+        )
+        if not exhausted:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.stats.record_wait((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        self.stats.record_wait((time.perf_counter() - start) * 1000)
+        return entry
+
+    def recreate(self):
+        # engine.dispose() 후에도 같은 통계 객체를 유지
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def resolve_profile(config: Settings) -> EngineProfile:
+    """설정의 프로파일 이름과 개별 오버라이드를 합쳐 최종 프로파일을 만듭니다."""
+    try:
+        profile = ENGINE_PROFILES[config.database_profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database profile '{config.database_profile}'. "
+            f"Available: {', '.join(ENGINE_PROFILES)}"
+        ) from None
+
+    overrides = {
+        "pool_size": config.database_pool_size,
+        "max_overflow": config.database_max_overflow,
+        "statement_timeout_ms": config.database_statement_timeout_ms,
+    }
+    return replace(profile, **{k: v for k, v in overrides.items() if v is not None})
+
+
+def _is_sqlite_memory(database: Optional[str]) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+def _install_sqlite_pragmas(engine: Engine, profile: EngineProfile, in_memory: bool) -> None:
+    pragmas = [
+        f"PRAGMA synchronous={profile.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={profile.sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size=-{profile.sqlite_cache_size_kib}",
+    ]
+    if not in_memory:
+        pragmas += [
+            f"PRAGMA auto_vacuum={profile.sqlite_auto_vacuum}",
+            f"PRAGMA journal_mode={profile.sqlite_journal_mode}",
+            f"PRAGMA mmap_size={profile.sqlite_mmap_size}",
+        ]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _install_pool_listeners(engine: Engine, stats: PoolStats) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.record_connect()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool = engine.pool
+        stats.record_checkout(pool.checkedout() if isinstance(pool, QueuePool) else 0)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.record_checkin()
+
+
+def create_engine_from_settings(config: Optional[Settings] = None) -> Engine:
+    """``Settings``의 ``database_url``/프로파일로 엔진을 생성합니다.
+
+    - SQLite: 연결마다 WAL, synchronous, busy_timeout, cache_size, mmap_size PRAGMA 적용
+    - PostgreSQL: pool_size, max_overflow, pool_pre_ping, statement_timeout 적용
+
+    파일 기반 DB는 ``InstrumentedQueuePool``을 사용하며 통계는 ``get_pool_stats()``로
+    조회할 수 있습니다.
+    """
+    config = config or default_settings
+    profile = resolve_profile(config)
+    url = make_url(config.database_url)
+    backend = url.get_backend_name()
+
+    kwargs: dict = {"echo": config.database_echo}
+    connect_args: dict = {}
+    stats = PoolStats()
+    instrumented = True
+
+    if backend == "sqlite":
+        connect_args["check_same_thread"] = False  # SQLite 멀티스레드 지원
+        in_memory = _is_sqlite_memory(url.database)
+        # 인메모리 DB는 SQLAlchemy 기본 풀(연결 공유)을 유지
+        instrumented = not in_memory
+    elif backend == "postgresql":
+        connect_args["options"] = f"-c statement_timeout={profile.statement_timeout_ms}"
+
+    if instrumented:
+        kwargs.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle,
+            # 로컬 파일 DB는 끊길 연결이 없으므로 ping 생략
+            pool_pre_ping=profile.pool_pre_ping and backend != "sqlite",
+        )
+
+    engine = create_engine(url, connect_args=connect_args, **kwargs)
+    if instrumented:
+        engine.pool.stats = stats
+    _install_pool_listeners(engine, stats)
+    if backend == "sqlite":
+        _install_sqlite_pragmas(engine, profile, in_memory)
+
+    _engine_meta[engine] = (config.database_profile, stats)
+    return engine
+
+
+def get_pool_stats(engine: Engine) -> dict:
+    """엔진 커넥션 풀의 현재 상태와 누적 통계를 반환합니다."""
+    pool = engine.pool
+    profile, stats = _engine_meta.get(engine, (None, None))
+    result = {
+        "dialect": engine.dialect.name,
+        "profile": profile,
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    if isinstance(pool, QueuePool):
+        result.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    if stats is not None:
+        result.update(stats.to_dict())
+    return result
@@ -1,50 +1,102 @@
 """Global schema service and indexer instances for dependency injection."""
 
+import threading
 from typing import Optional
 
+from agent.config import settings
 from agent.infrastructure.database.connection import get_engine
 from agent.infrastructure.database.schema_service import SchemaService
-from agent.application.services.schema_indexer import SchemaIndexer
+from agent.application.services.index_worker import IndexWorker
+from agent.application.services.schema_indexer import IndexSyncResult, SchemaIndexer
+from agent.infrastructure.llm.semantic_cache import get_semantic_sql_cache
 from agent.infrastructure.vectorstore.chroma_client import get_chroma_client
 
 
 _schema_service: Optional[SchemaService] = None
 _schema_indexer: Optional[SchemaIndexer] = None
+_index_worker: Optional[IndexWorker] = None
+# 백그라운드 워밍업과 첫 요청이 동시에 초기화하지 않도록 보호
+_init_lock = threading.RLock()
 
 
-def init_schema_services() -> int:
+def init_schema_services() -> IndexSyncResult:
     """Initialize schema service and indexer with proper wiring.
     
     Returns:
-        Number of indexed tables
+        Result of syncing the vector index with the live schema
     """
-    global _schema_service, _schema_indexer
-    
-    engine = get_engine()
-    _schema_service = SchemaService(db_engine=engine)
-    
-    chroma = get_chroma_client()
-    _schema_indexer = SchemaIndexer(
-        schema_service=_schema_service,
-        chroma_client=chroma
-    )
-    
-    # Wire indexer back to schema service for auto-indexing
-    _schema_service.set_indexer(_schema_indexer)
-    
-    # Index all existing tables
-    return _schema_indexer.index_all_tables()
+    global _schema_service, _schema_indexer, _index_worker
+
+    with _init_lock:
+        engine = get_engine()
+        _schema_service = SchemaService(db_engine=engine)
+
+        chroma = get_chroma_client()
+        _schema_indexer = SchemaIndexer(
+            schema_service=_schema_service,
+            chroma_client=chroma
+        )
+
+        # Wire indexer back to schema service for auto-indexing.
+        # DDL only enqueues; the worker debounces and batches the updates.
+        if _index_worker is not None:
+            _index_worker.stop()
+        _index_worker = IndexWorker(_schema_indexer)
+        _index_worker.start()
+        _schema_service.set_indexer(_index_worker)
+
+        # DDL 발생 시 해당 테이블에 의존하는 캐시된 SQL 무효화
+        sql_cache = get_semantic_sql_cache()
+        if sql_cache is not None:
+            _schema_service.add_change_listener(sql_cache.invalidate_tables)
+
+        # Embed only new/changed tables; vectors persist across restarts
+        return _schema_indexer.sync_all_tables()
+
+
+def sync_schema_index() -> IndexSyncResult:
+    """이미 초기화된 전역 인스턴스로 벡터 인덱스를 동기화합니다 (없으면 초기화).
+
+    첫 요청이 먼저 초기화한 경우 SchemaService(메타데이터 캐시)와 IndexWorker를
+    다시 만들지 않습니다.
+    """
+    with _init_lock:
+        if _schema_indexer is None:
+            return init_schema_services()
+        indexer = _schema_indexer
+    return indexer.sync_all_tables()
 
 
 def get_global_schema_service() -> SchemaService:
     """Get the global schema service instance."""
     if _schema_service is None:
-        init_schema_services()
+        with _init_lock:
+            if _schema_service is None:
+                init_schema_services()
     return _schema_service
 
 
 def get_global_schema_indexer() -> SchemaIndexer:
     """Get the global schema indexer instance."""
     if _schema_indexer is None:
-        init_schema_services()
+        with _init_lock:
+            if _schema_indexer is None:
+                init_schema_services()
     return _schema_indexer
+
+
+def get_global_index_worker() -> IndexWorker:
+    """Get the global background index worker."""
+    if _index_worker is None:
+        with _init_lock:
+            if _index_worker is None:
+                init_schema_services()
+    return _index_worker
+
+
+def shutdown_schema_services() -> None:
+    """Flush pending index updates and stop the background worker."""
+    global _index_worker
+    if _index_worker is not None:
+        _index_worker.stop(timeout=settings.index_wait_timeout_seconds)
+        _index_worker = None
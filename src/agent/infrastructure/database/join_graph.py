@@ -0,0 +1,224 @@
+"""In-memory foreign-key graph for finding join paths between tables."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from agent.config import settings
+from agent.domain.services.schema_retriever import JoinKey
+
+# 경로 하나를 찾을 때 방문할 최대 테이블 수 (허브 테이블을 거치며 탐색이 폭증하는 것 방지)
+_MAX_VISITED = 1_000
+
+
+@dataclass
+class JoinPlan:
+    """검색된 테이블들을 잇는 조인 트리."""
+
+    bridges: list[str] = field(default_factory=list)  # 경로 중간에 추가해야 하는 테이블 (경로 순)
+    # 트리에 연결된 테이블 → 이미 연결된 쪽과 잇는 조인 조건
+    join_keys: dict[str, list[JoinKey]] = field(default_factory=dict)
+    unreachable: list[str] = field(default_factory=list)  # max_hops 안에 경로가 없는 테이블
+
+
+class JoinGraph:
+    """FK 인접 리스트 (방향 없이 탐색).
+
+    테이블마다 자신이 가진 FK(나가는 간선)만 소유하므로 ``upsert``는 그 테이블의 간선만
+    교체합니다. 사라진 테이블을 참조하는 간선은 남겨 두고 탐색할 때 건너뜁니다.
+    검색된 테이블 사이의 경로는 양방향 BFS를 ``max_hops``까지만 확장해 찾으므로
+    스키마 크기가 아니라 질의 주변 이웃 수에 비례해 탐색합니다.
+    """
+
+    def __init__(self, max_hops: int | None = None, max_bridges: int | None = None):
+        self._max_hops = max_hops or settings.join_graph_max_hops
+        self._max_bridges = max_bridges if max_bridges is not None else settings.join_graph_max_bridges
+        self._tables: set[str] = set()
+        self._primary_keys: dict[str, list[str]] = {}
+        self._outgoing: dict[str, list[JoinKey]] = {}
+        self._adjacent: dict[str, dict[str, list[JoinKey]]] = {}
+        self._lock = threading.Lock()
+        self._lookups = 0
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(keys) for keys in self._outgoing.values())
+
+    def upsert(self, table_info) -> None:
+        """테이블의 PK와 FK 간선을 추가/교체합니다."""
+        keys = []
+        for column in table_info.columns:
+            if column.foreign_key:
+                ref_table, _, ref_column = column.foreign_key.partition(".")
+                keys.append(JoinKey(table_info.name, column.name, ref_table, ref_column))
+        primary_keys = [c.name for c in table_info.columns if c.primary_key]
+
+        with self._lock:
+            self._remove_edges(table_info.name)
+            self._tables.add(table_info.name)
+            self._primary_keys[table_info.name] = primary_keys
+            self._outgoing[table_info.name] = keys
+            for key in keys:
+                self._adjacent.setdefault(key.table, {}).setdefault(key.ref_table, []).append(key)
+                if key.ref_table != key.table:
+                    self._adjacent.setdefault(key.ref_table, {}).setdefault(key.table, []).append(key)
+
+    def remove(self, table_name: str) -> None:
+        with self._lock:
+            self._remove_edges(table_name)
+            self._tables.discard(table_name)
+            self._primary_keys.pop(table_name, None)
+
+    def _remove_edges(self, table_name: str) -> None:
+        for key in self._outgoing.pop(table_name, []):
+            for a, b in ((key.table, key.ref_table), (key.ref_table, key.table)):
+                neighbors = self._adjacent.get(a)
+                edges = neighbors.get(b) if neighbors else None
+                if edges is None:
+                    continue
+                if key in edges:
+                    edges.remove(key)
+                if not edges:
+                    del neighbors[b]
+                    if not neighbors:
+                        del self._adjacent[a]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._primary_keys.clear()
+            self._outgoing.clear()
+            self._adjacent.clear()
+
+    def table_names(self) -> list[str]:
+        return list(self._tables)
+
+    def neighbors(self, table_name: str) -> list[str]:
+        return [n for n in self._adjacent.get(table_name, ()) if n in self._tables]
+
+    def plan(self, table_names: list[str]) -> JoinPlan:
+        """``table_names``를 모두 잇는 작은 조인 트리를 찾습니다.
+
+        첫 테이블에서 시작해, 이미 연결된 테이블 집합에서 가장 가까운 나머지 테이블까지의
+        최단 경로를 차례로 붙이는 근사(최소 스타이너 트리)입니다. 경로 중간 테이블이
+        bridge가 되며, ``max_bridges``를 넘게 되는 경로는 붙이지 않습니다.
+        """
+        plan = JoinPlan()
+        with self._lock:
+            self._lookups += 1
+            terminals = [t for t in dict.fromkeys(table_names) if t in self._tables]
+            plan.unreachable = [t for t in dict.fromkeys(table_names) if t not in self._tables]
+            if len(terminals) < 2:
+                return plan
+
+            tree = {terminals[0]}
+            remaining = set(terminals[1:])
+            while remaining:
+                # 남은 bridge 수보다 긴 경로는 쓸 수 없으므로 그만큼만 탐색
+                max_hops = min(self._max_hops, self._max_bridges - len(plan.bridges) + 1)
+                path = self._shortest_path(tree, remaining, max_hops)
+                new_bridges = [n for n in path[1:-1] if n not in tree and n not in remaining] if path else []
+                if path is None or len(plan.bridges) + len(new_bridges) > self._max_bridges:
+                    # 연결하지 못한 테이블은 별도 트리의 시작점으로 (나머지는 여기에 붙을 수 있음)
+                    orphan = min(remaining, key=terminals.index)
+                    plan.unreachable.append(orphan)
+                    remaining.discard(orphan)
+                    tree.add(orphan)
+                    continue
+                plan.bridges.extend(new_bridges)
+                for a, b in zip(path, path[1:]):
+                    if b not in tree:
+                        plan.join_keys.setdefault(b, []).extend(self._resolved(self._adjacent[a][b]))
+                    tree.add(b)
+                remaining.difference_update(path)
+        return plan
+
+    def _resolved(self, keys: list[JoinKey]) -> list[JoinKey]:
+        """참조 컬럼이 생략된 FK(SQLite ``REFERENCES t``)는 참조 테이블의 PK로 채웁니다."""
+        resolved = []
+        for key in keys:
+            if not key.ref_column:
+                primary_keys = self._primary_keys.get(key.ref_table, [])
+                if len(primary_keys) == 1:
+                    key = JoinKey(key.table, key.column, key.ref_table, primary_keys[0])
+            resolved.append(key)
+        return resolved
+
+    def _shortest_path(self, sources: set[str], targets: set[str], max_hops: int) -> Optional[list[str]]:
+        """``sources`` 중 하나에서 ``targets`` 중 하나까지의 최단 경로 (양방향 BFS)."""
+        adjacent, tables = self._adjacent, self._tables
+        parents_a: dict[str, Optional[str]] = dict.fromkeys(sources)
+        parents_b: dict[str, Optional[str]] = dict.fromkeys(targets)
+        frontier_a, frontier_b = list(sources), list(targets)
+        # 각 frontier를 확장할 때 살펴볼 간선 수
+        degree_a = sum(len(adjacent.get(n, ())) for n in frontier_a)
+        degree_b = sum(len(adjacent.get(n, ())) for n in frontier_b)
+
+        for hop in range(max_hops):
+            # 간선이 적은 쪽을 확장
+            expand_a = degree_a <= degree_b
+            frontier, parents, other = (
+                (frontier_a, parents_a, parents_b) if expand_a else (frontier_b, parents_b, parents_a)
+            )
+            if hop == max_hops - 1:
+                # 마지막 단계는 반대쪽과 만나는 간선만 찾으면 됨 (다음 frontier 불필요)
+                for node in frontier:
+                    for neighbor in adjacent.get(node, ()):
+                        if neighbor in other and neighbor in tables:
+                            parents[neighbor] = node
+                            head, tail = _walk(parents_a, neighbor), _walk(parents_b, neighbor)
+                            return head[::-1] + tail[1:]
+                return None
+
+            next_frontier, degree = [], 0
+            for node in frontier:
+                if len(parents_a) + len(parents_b) > _MAX_VISITED:
+                    return None
+                for neighbor in adjacent.get(node, ()):
+                    if neighbor in parents or neighbor not in tables:
+                        continue
+                    parents[neighbor] = node
+                    if neighbor in other:
+                        head, tail = _walk(parents_a, neighbor), _walk(parents_b, neighbor)
+                        return head[::-1] + tail[1:]
+                    next_frontier.append(neighbor)
+                    degree += len(adjacent[neighbor])
+            if not next_frontier:
+                return None
+            if expand_a:
+                frontier_a, degree_a = next_frontier, degree
+            else:
+                frontier_b, degree_b = next_frontier, degree
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tables": len(self._tables),
+                "foreign_keys": self.edge_count,
+                "lookups": self._lookups,
+            }
+
+
+def _walk(parents: dict[str, Optional[str]], node: str) -> list[str]:
+    path = [node]
+    while parents[node] is not None:
+        node = parents[node]
+        path.append(node)
+    return path
+
+
+_join_graph: Optional[JoinGraph] = None
+
+
+def get_join_graph() -> Optional[JoinGraph]:
+    """조인 경로 보강이 꺼져 있으면 None."""
+    global _join_graph
+    if not settings.join_graph_enabled:
+        return None
+    if _join_graph is None:
+        _join_graph = JoinGraph()
+    return _join_graph
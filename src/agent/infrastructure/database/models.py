@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy import Column, Date, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.dialects.sqlite import CHAR
 
 from agent.domain.entities.query_log import QueryLogStatus
@@ -18,4 +18,29 @@ class QueryLogModel(Base):
     status = Column(String(20), nullable=False, default=QueryLogStatus.PENDING.value)
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.now)
+    execution_time_ms = Column(Float, nullable=True)
+    row_count = Column(Integer, nullable=True)
 
+    # 키셋 페이지네이션 (created_at, id) 및 상태 필터용 복합 인덱스
+    __table_args__ = (
+        Index("ix_query_logs_created_at_id", "created_at", "id"),
+        Index("ix_query_logs_status_created_at_id", "status", "created_at", "id"),
+    )
+
+
+
+class QueryLogDailyRollupModel(Base):
+    """아카이브된 날짜를 포함한 일별 QueryLog 집계."""
+
+    __tablename__ = "query_log_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+    processing = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    top_questions = Column(Text, nullable=True)  # JSON: [{"question": ..., "count": ...}]
+    archived_rows = Column(Integer, nullable=False, default=0)
+    archive_path = Column(String(512), nullable=True)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
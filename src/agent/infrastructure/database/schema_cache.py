@@ -0,0 +1,112 @@
+"""Versioned in-memory cache of reflected schema metadata."""
+
+import threading
+from typing import Iterable, Optional
+
+from agent.presentation.api.schemas import TableInfoDTO
+
+
+class SchemaMetadataCache:
+    """리플렉션한 스키마 메타데이터(테이블 목록, 컬럼/PK, 컨텍스트 문자열) 캐시.
+
+    ``version``은 무효화가 일어날 때마다 단조 증가하며, 테이블별 버전도 함께
+    관리합니다. 무효화는 DDL이 발생한 테이블 단위로만 이루어지므로 나머지
+    테이블의 메타데이터는 계속 메모리에서 제공됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables: Optional[list[str]] = None
+        self._table_infos: dict[str, TableInfoDTO] = {}
+        self._context: Optional[str] = None
+        self._version = 0
+        self._table_versions: dict[str, int] = {}
+        # 앱을 통한 데이터 변경(행 추가/일괄 적재) 횟수. 결과 캐시 키에 사용
+        self._data_versions: dict[str, int] = {}
+
+    @property
+    def version(self) -> int:
+        """전체 스키마 메타데이터 버전."""
+        return self._version
+
+    def table_version(self, table_name: str) -> int:
+        """테이블별 메타데이터 버전 (한 번도 변경되지 않았다면 0)."""
+        return self._table_versions.get(table_name, 0)
+
+    def data_version(self, table_name: str) -> int:
+        """테이블별 데이터 버전 (앱을 통한 쓰기마다 증가)."""
+        return self._data_versions.get(table_name, 0)
+
+    def bump_data_version(self, table_name: str) -> int:
+        """테이블 데이터가 변경되었음을 기록합니다."""
+        with self._lock:
+            self._data_versions[table_name] = self._data_versions.get(table_name, 0) + 1
+            return self._data_versions[table_name]
+
+    def get_tables(self) -> Optional[list[str]]:
+        with self._lock:
+            return list(self._tables) if self._tables is not None else None
+
+    def set_tables(self, tables: list[str], version: int) -> None:
+        """테이블 목록을 저장합니다. 조회 중 무효화가 있었다면 버립니다."""
+        with self._lock:
+            if version == self._version:
+                self._tables = list(tables)
+
+    def get_table_info(self, table_name: str) -> Optional[TableInfoDTO]:
+        with self._lock:
+            return self._table_infos.get(table_name)
+
+    def set_table_info(self, table_info: TableInfoDTO, version: int) -> None:
+        with self._lock:
+            if version == self._version:
+                self._table_infos[table_info.name] = table_info
+
+    def get_context(self) -> Optional[str]:
+        with self._lock:
+            return self._context
+
+    def set_context(self, context: str, version: int) -> None:
+        with self._lock:
+            if version == self._version:
+                self._context = context
+
+    def invalidate_tables(self, table_names: Iterable[str], membership_changed: bool = False) -> int:
+        """변경된 테이블의 메타데이터만 무효화합니다.
+
+        Args:
+            table_names: DDL이 발생한 테이블 목록
+            membership_changed: 테이블 생성/삭제/이름 변경으로 목록 자체가 바뀌었는지 여부
+
+        Returns:
+            새 스키마 버전
+        """
+        with self._lock:
+            self._version += 1
+            for name in table_names:
+                self._table_infos.pop(name, None)
+                self._table_versions[name] = self._version
+            if membership_changed:
+                self._tables = None
+            self._context = None
+            return self._version
+
+    def invalidate_all(self) -> int:
+        """모든 메타데이터를 무효화합니다 (외부에서 스키마가 변경된 경우)."""
+        with self._lock:
+            self._version += 1
+            for name in set(self._table_infos) | set(self._tables or []):
+                self._table_versions[name] = self._version
+            self._tables = None
+            self._table_infos.clear()
+            self._context = None
+            return self._version
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "version": self._version,
+                "tables_cached": self._tables is not None,
+                "table_infos": len(self._table_infos),
+                "context_cached": self._context is not None,
+            }
@@ -1,10 +1,18 @@
-from typing import Annotated, Optional
+import base64
+import datetime
+import decimal
+import json
+import threading
+import uuid
+from typing import Annotated, Any, Callable, Iterable, Optional, Sequence
 
 from fastapi import Depends
-from sqlalchemy import inspect, text
+from sqlalchemy import bindparam, inspect, text
 from sqlalchemy.engine import Engine
 
+from agent.infrastructure.database.bulk_loader import BulkLoadResult, BulkRowLoader
 from agent.infrastructure.database.connection import Base, get_engine
+from agent.infrastructure.database.schema_cache import SchemaMetadataCache
 from agent.presentation.api.schemas import (
     ColumnDefinitionDTO,
     ColumnInfoDTO,
@@ -14,20 +22,73 @@ from agent.presentation.api.schemas import (
     TableInfoDTO,
 )
 
+# SQLite 리플렉션 한 번에 IN으로 넘기는 테이블 수
+_SQLITE_MAX_IN_NAMES = 900
+
 
 class SchemaService:
     """데이터베이스 스키마 조회 서비스."""
 
-    def __init__(self, db_engine: Engine, schema_indexer=None):
+    def __init__(
+        self,
+        db_engine: Engine,
+        schema_indexer=None,
+        metadata_cache: Optional[SchemaMetadataCache] = None,
+    ):
         self._engine = db_engine
         self._indexer = schema_indexer
+        self._metadata_cache = metadata_cache or SchemaMetadataCache()
+        self._change_listeners: list[Callable[[list[str]], None]] = []
+        # 테이블 → (메타데이터 버전, 커서 정렬에 쓸 수 있는 컬럼)
+        self._sortable_columns: dict[str, tuple[int, set[str]]] = {}
+        self._sortable_lock = threading.Lock()
+
+    @property
+    def metadata_cache(self) -> SchemaMetadataCache:
+        """스키마 메타데이터 캐시."""
+        return self._metadata_cache
+
+    def refresh_metadata(self) -> int:
+        """외부에서 변경된 스키마를 반영하도록 메타데이터 캐시를 비웁니다.
+
+        Returns:
+            새 스키마 버전
+        """
+        return self._metadata_cache.invalidate_all()
 
     def set_indexer(self, indexer) -> None:
-        """스키마 인덱서를 설정합니다 (순환 의존성 방지용)."""
+        """스키마 인덱서를 설정합니다 (순환 의존성 방지용).
+
+        ``index_table``/``remove_table``을 가진 객체면 되며, 백그라운드 워커를
+        연결하면 DDL 요청은 인덱스 갱신을 기다리지 않습니다.
+        """
         self._indexer = indexer
 
+    def wait_for_index(self, timeout: Optional[float] = None) -> bool:
+        """지금까지의 스키마 변경이 인덱스에 반영될 때까지 기다립니다.
+
+        Returns:
+            제한 시간 안에 반영되었으면 True (동기 인덱서는 항상 True)
+        """
+        wait = getattr(self._indexer, "wait", None)
+        return wait(timeout) if wait is not None else True
+
+    def add_change_listener(self, listener: Callable[[list[str]], None]) -> None:
+        """DDL로 변경된 테이블 목록을 전달받을 리스너를 등록합니다."""
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, *table_names: str, membership_changed: bool = False) -> None:
+        """메타데이터 캐시를 무효화하고 등록된 리스너에 테이블 변경을 알립니다."""
+        self._metadata_cache.invalidate_tables(table_names, membership_changed=membership_changed)
+
+        for listener in self._change_listeners:
+            try:
+                listener(list(table_names))
+            except Exception as e:
+                print(f"[Schema] Change listener failed for {table_names}: {e}")
+
     def _trigger_index(self, table_name: str) -> None:
-        """테이블 인덱스를 갱신합니다."""
+        """테이블 인덱스 갱신을 요청합니다."""
         if self._indexer:
             try:
                 self._indexer.index_table(table_name)
@@ -35,7 +96,7 @@ class SchemaService:
                 print(f"[RAG] Index update failed for {table_name}: {e}")
 
     def _trigger_remove(self, table_name: str) -> None:
-        """테이블 인덱스를 제거합니다."""
+        """테이블 인덱스 제거를 요청합니다."""
         if self._indexer:
             try:
                 self._indexer.remove_table(table_name)
@@ -53,8 +114,7 @@ class SchemaService:
             with self._engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
 
-            inspector = inspect(self._engine)
-            tables = [t for t in inspector.get_table_names() if t not in self._internal_tables]
+            tables = self.get_tables()
 
             return DatabaseInfoDTO(
                 connected=True,
@@ -72,41 +132,187 @@ class SchemaService:
 
     def get_tables(self) -> list[str]:
         """테이블 목록을 반환합니다 (내부 시스템 테이블 제외)."""
+        cached = self._metadata_cache.get_tables()
+        if cached is not None:
+            return cached
+
+        version = self._metadata_cache.version
         inspector = inspect(self._engine)
-        return [t for t in inspector.get_table_names() if t not in self._internal_tables]
+        tables = [t for t in inspector.get_table_names() if t not in self._internal_tables]
+        self._metadata_cache.set_tables(tables, version)
+        return tables
 
     def get_table_info(self, table_name: str) -> Optional[TableInfoDTO]:
         """테이블 상세 정보를 반환합니다."""
-        inspector = inspect(self._engine)
+        cached = self._metadata_cache.get_table_info(table_name)
+        if cached is not None:
+            return cached
+
+        version = self._metadata_cache.version
+        if table_name not in self.get_tables() and table_name not in self._internal_tables:
+            return None
 
-        if table_name not in inspector.get_table_names():
+        if table_name in self._internal_tables and not inspect(self._engine).has_table(table_name):
             return None
 
-        columns = []
-        pk_columns = inspector.get_pk_constraint(table_name).get("constrained_columns", [])
+        table_info = self._reflect_table_infos([table_name]).get(table_name)
+        if table_info is not None:
+            self._metadata_cache.set_table_info(table_info, version)
+        return table_info
 
-        for col in inspector.get_columns(table_name):
-            columns.append(
+    def get_all_table_infos(self) -> dict[str, TableInfoDTO]:
+        """모든 테이블의 상세 정보를 한 번의 리플렉션으로 반환합니다.
+
+        캐시에 없는 테이블만 일괄 리플렉션합니다.
+
+        Returns:
+            테이블명 → 상세 정보 (``get_tables()`` 순서)
+        """
+        version = self._metadata_cache.version
+        tables = self.get_tables()
+
+        infos: dict[str, TableInfoDTO] = {}
+        missing = []
+        for table_name in tables:
+            cached = self._metadata_cache.get_table_info(table_name)
+            if cached is not None:
+                infos[table_name] = cached
+            else:
+                missing.append(table_name)
+
+        if missing:
+            for table_name, table_info in self._reflect_table_infos(missing).items():
+                self._metadata_cache.set_table_info(table_info, version)
+                infos[table_name] = table_info
+
+        return {name: infos[name] for name in tables if name in infos}
+
+    def _reflect_table_infos(self, table_names: list[str]) -> dict[str, TableInfoDTO]:
+        """지정된 테이블들의 컬럼/PK/FK를 한 번에 리플렉션합니다.
+
+        SQLAlchemy 2.0 멀티 리플렉션(``get_multi_columns`` / ``get_multi_pk_constraint``)을
+        사용합니다. SQLite 방언의 멀티 리플렉션은 내부적으로 테이블마다 sqlite_master를
+        조회해 테이블 수에 대해 제곱으로 느려지므로 ``pragma_table_info``를 조인한
+        단일 쿼리로 대체합니다. 이 경로는 선언 타입을 Inspector와 같게 해석하려고 SQLite
+        방언의 ``_resolve_type_affinity``(SQLAlchemy 2.0~2.1)를 쓰며, 없는 버전에서는
+        공개 멀티 리플렉션으로 돌아갑니다.
+        """
+        dialect = self._engine.dialect
+        if dialect.name == "sqlite" and hasattr(dialect, "_resolve_type_affinity"):
+            return self._reflect_sqlite_table_infos(table_names)
+        return self._reflect_multi_table_infos(table_names)
+
+    def _reflect_multi_table_infos(self, table_names: list[str]) -> dict[str, TableInfoDTO]:
+        """Inspector 멀티 리플렉션으로 조회합니다."""
+        inspector = inspect(self._engine)
+        multi_columns = inspector.get_multi_columns(filter_names=table_names)
+        multi_pks = inspector.get_multi_pk_constraint(filter_names=table_names)
+        multi_fks = inspector.get_multi_foreign_keys(filter_names=table_names)
+
+        return {
+            table_name: self._build_table_info(
+                table_name,
+                columns,
+                multi_pks.get((schema, table_name), {}),
+                _foreign_key_map(multi_fks.get((schema, table_name), [])),
+            )
+            for (schema, table_name), columns in multi_columns.items()
+        }
+
+    def _reflect_sqlite_table_infos(self, table_names: list[str]) -> dict[str, TableInfoDTO]:
+        """SQLite: 테이블들의 컬럼/PK/FK 정보를 테이블 묶음마다 단일 쿼리로 조회합니다."""
+        names = bindparam("names", expanding=True)
+        sql = text(
+            'SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk '
+            "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type = 'table' AND m.name IN :names "
+            "ORDER BY m.name, p.cid"
+        ).bindparams(names)
+        fk_sql = text(
+            'SELECT m.name, f."from", f."table", f."to" '
+            "FROM sqlite_master AS m JOIN pragma_foreign_key_list(m.name) AS f "
+            "WHERE m.type = 'table' AND m.name IN :names"
+        ).bindparams(names)
+
+        dialect = self._engine.dialect
+        type_names: dict[str, str] = {}
+        columns_by_table: dict[str, list[dict]] = {}
+        pks_by_table: dict[str, list[tuple[int, str]]] = {}
+        fks_by_table: dict[str, dict[str, str]] = {}
+
+        with self._engine.connect() as conn:
+            # SQLite 바인드 변수 개수 한도(구버전 999) 안에서 나누어 조회
+            for start in range(0, len(table_names), _SQLITE_MAX_IN_NAMES):
+                params = {"names": table_names[start:start + _SQLITE_MAX_IN_NAMES]}
+                for table_name, name, type_, notnull, default, pk in conn.execute(sql, params):
+                    declared = (type_ or "").upper()
+                    if declared not in type_names:
+                        # Inspector.get_columns와 동일한 타입 해석
+                        type_names[declared] = str(dialect._resolve_type_affinity(declared))
+                    columns_by_table.setdefault(table_name, []).append({
+                        "name": name,
+                        "type": type_names[declared],
+                        "nullable": not notnull,
+                        "default": str(default) if default is not None else None,
+                    })
+                    if pk:
+                        pks_by_table.setdefault(table_name, []).append((pk, name))
+
+                for table_name, column, referred_table, referred_column in conn.execute(fk_sql, params):
+                    # "to"가 비어 있으면 참조 테이블의 기본 키를 가리킴
+                    target = f"{referred_table}.{referred_column}" if referred_column else referred_table
+                    fks_by_table.setdefault(table_name, {})[column] = target
+
+        return {
+            table_name: self._build_table_info(
+                table_name,
+                columns,
+                {"constrained_columns": [name for _, name in sorted(pks_by_table.get(table_name, []))]},
+                fks_by_table.get(table_name, {}),
+            )
+            for table_name, columns in columns_by_table.items()
+        }
+
+    @staticmethod
+    def _build_table_info(
+        table_name: str,
+        columns: list[dict],
+        pk_constraint: dict,
+        foreign_keys: Optional[dict[str, str]] = None,
+    ) -> TableInfoDTO:
+        """리플렉션 결과를 TableInfoDTO로 변환합니다."""
+        pk_columns = (pk_constraint or {}).get("constrained_columns", [])
+        foreign_keys = foreign_keys or {}
+
+        return TableInfoDTO(
+            name=table_name,
+            columns=[
                 ColumnInfoDTO(
                     name=col["name"],
                     type=str(col["type"]),
                     nullable=col.get("nullable", True),
                     primary_key=col["name"] in pk_columns,
                     default=str(col.get("default")) if col.get("default") else None,
+                    foreign_key=foreign_keys.get(col["name"]),
+                    comment=col.get("comment"),
                 )
-            )
-
-        return TableInfoDTO(name=table_name, columns=columns)
+                for col in columns
+            ],
+        )
 
     def get_schema_context(self) -> str:
         """LLM에 전달할 스키마 컨텍스트 문자열을 생성합니다."""
+        cached = self._metadata_cache.get_context()
+        if cached is not None:
+            return cached
+
+        version = self._metadata_cache.version
         tables = self.get_tables()
         if not tables:
             return "No tables found in database."
 
         context_lines = []
-        for table_name in tables:
-            table_info = self.get_table_info(table_name)
+        for table_name, table_info in self.get_all_table_infos().items():
             if table_info:
                 columns_str = ", ".join(
                     f"{col.name} ({col.type}{'*' if col.primary_key else ''})"
@@ -114,7 +320,9 @@ class SchemaService:
                 )
                 context_lines.append(f"- {table_name}: {columns_str}")
 
-        return "Tables:\n" + "\n".join(context_lines)
+        context = "Tables:\n" + "\n".join(context_lines)
+        self._metadata_cache.set_context(context, version)
+        return context
 
     def create_table(self, request: CreateTableRequestDTO) -> None:
         """새로운 테이블을 생성합니다."""
@@ -144,6 +352,7 @@ class SchemaService:
         with self._engine.begin() as conn:
             conn.execute(text(sql))
         
+        self._notify_change(request.table_name, membership_changed=True)
         self._trigger_index(request.table_name)
 
     def drop_table(self, table_name: str) -> None:
@@ -155,6 +364,7 @@ class SchemaService:
         with self._engine.begin() as conn:
             conn.execute(text(sql))
         
+        self._notify_change(table_name, membership_changed=True)
         self._trigger_remove(table_name)
 
     def rename_table(self, old_name: str, new_name: str) -> None:
@@ -162,12 +372,27 @@ class SchemaService:
         if old_name in self._internal_tables:
             raise ValueError(f"시스템 테이블 '{old_name}'은(는) 이름을 변경할 수 없습니다.")
 
+        # 이름 변경은 이 테이블을 참조하는 FK도 바꾸므로(SQLite) 참조하는 테이블도 다시 반영
+        referencing = self._referencing_tables(old_name)
+
         sql = f"ALTER TABLE {old_name} RENAME TO {new_name}"
         with self._engine.begin() as conn:
             conn.execute(text(sql))
         
+        self._notify_change(old_name, new_name, *referencing, membership_changed=True)
         self._trigger_remove(old_name)
         self._trigger_index(new_name)
+        for table_name in referencing:
+            self._trigger_index(table_name)
+
+    def _referencing_tables(self, table_name: str) -> list[str]:
+        """``table_name``을 FK로 참조하는 다른 테이블 목록."""
+        return [
+            name
+            for name, info in self.get_all_table_infos().items()
+            if name != table_name
+            and any(c.foreign_key and c.foreign_key.partition(".")[0] == table_name for c in info.columns)
+        ]
 
     def add_column(self, table_name: str, column: ColumnDefinitionDTO) -> None:
         """테이블에 컬럼을 추가합니다."""
@@ -184,6 +409,7 @@ class SchemaService:
         with self._engine.begin() as conn:
             conn.execute(text(sql))
         
+        self._notify_change(table_name)
         self._trigger_index(table_name)
 
     def drop_column(self, table_name: str, column_name: str) -> None:
@@ -195,6 +421,7 @@ class SchemaService:
         with self._engine.begin() as conn:
             conn.execute(text(sql))
         
+        self._notify_change(table_name)
         self._trigger_index(table_name)
 
     def get_table_data(self, table_name: str, limit: int = 100, offset: int = 0) -> TableDataDTO:
@@ -210,6 +437,113 @@ class SchemaService:
 
         return TableDataDTO(columns=columns, rows=rows)
 
+    def get_table_data_page(
+        self,
+        table_name: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+    ) -> TableDataDTO:
+        """테이블 데이터를 키셋(커서) 방식으로 조회합니다.
+
+        기본 키(기본 키가 없는 SQLite 테이블은 rowid) 순서로 정렬하며, ``sort``를 주면
+        해당 컬럼 다음에 기본 키를 붙여 정렬합니다. 이전 페이지의 마지막 키보다 뒤의 행만
+        인덱스로 찾으므로 페이지 깊이와 관계없이 비용이 일정합니다.
+
+        Args:
+            sort: 정렬 컬럼. 인덱스의 첫 컬럼이면서 NOT NULL이어야 합니다.
+            cursor: 이전 응답의 ``next_cursor``
+
+        Raises:
+            ValueError: 시스템 테이블, 정렬할 수 없는 컬럼, 잘못된 커서
+        """
+        if table_name in self._internal_tables:
+            raise ValueError(f"시스템 테이블 '{table_name}'은(는) 조회할 수 없습니다.")
+
+        table_info = self.get_table_info(table_name)
+        if table_info is None:
+            raise ValueError(f"테이블 '{table_name}'을(를) 찾을 수 없습니다.")
+
+        key_columns = [c.name for c in table_info.columns if c.primary_key]
+        use_rowid = not key_columns
+        if use_rowid:
+            if self._engine.dialect.name != "sqlite":
+                raise ValueError(f"기본 키가 없는 테이블 '{table_name}'은(는) 커서 조회를 지원하지 않습니다.")
+            key_columns = [_ROWID]
+
+        if sort is not None and sort not in key_columns:
+            if sort not in self._get_sortable_columns(table_name, table_info):
+                raise ValueError(
+                    f"'{sort}' 컬럼으로는 정렬할 수 없습니다. 인덱스가 있는 NOT NULL 컬럼만 지원합니다."
+                )
+        order_columns = [sort] + [k for k in key_columns if k != sort] if sort else key_columns
+
+        after = None
+        if cursor:
+            after = _decode_table_cursor(cursor, order_columns, descending)
+
+        quote = self._engine.dialect.identifier_preparer.quote
+        ordered = [quote(c) if c != _ROWID else "rowid" for c in order_columns]
+        select_list = f"rowid AS {_ROWID}, *" if use_rowid else "*"
+        sql = f"SELECT {select_list} FROM {quote(table_name)}"
+
+        params: dict[str, Any] = {"limit": limit + 1}
+        if after is not None:
+            placeholders = [f":k{i}" for i in range(len(after))]
+            params.update({f"k{i}": v for i, v in enumerate(after)})
+            op = "<" if descending else ">"
+            if len(ordered) == 1:
+                sql += f" WHERE {ordered[0]} {op} {placeholders[0]}"
+            else:
+                sql += f" WHERE ({', '.join(ordered)}) {op} ({', '.join(placeholders)})"
+
+        direction = "DESC" if descending else "ASC"
+        sql += f" ORDER BY {', '.join(f'{c} {direction}' for c in ordered)} LIMIT :limit"
+
+        with self._engine.connect() as conn:
+            result = conn.execute(text(sql), params)
+            columns = [c for c in result.keys() if c != _ROWID]
+            rows = [dict(row._mapping) for row in result]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_table_cursor(
+                [rows[-1][c] for c in order_columns], order_columns, descending
+            )
+        if use_rowid:
+            for row in rows:
+                row.pop(_ROWID, None)
+
+        return TableDataDTO(columns=columns, rows=rows, next_cursor=next_cursor)
+
+    def _get_sortable_columns(self, table_name: str, table_info: TableInfoDTO) -> set[str]:
+        """인덱스 첫 컬럼 중 NOT NULL인 컬럼 (테이블 메타데이터 버전별 캐시)."""
+        version = self._metadata_cache.table_version(table_name)
+        with self._sortable_lock:
+            cached = self._sortable_columns.get(table_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        inspector = inspect(self._engine)
+        leading = {
+            index["column_names"][0]
+            for index in inspector.get_indexes(table_name)
+            if index.get("column_names") and index["column_names"][0]
+        }
+        leading |= {
+            uc["column_names"][0]
+            for uc in inspector.get_unique_constraints(table_name)
+            if uc.get("column_names")
+        }
+        not_null = {c.name for c in table_info.columns if not c.nullable}
+        sortable = leading & not_null
+
+        with self._sortable_lock:
+            self._sortable_columns[table_name] = (version, sortable)
+        return sortable
+
     def add_row(self, table_name: str, data: dict) -> None:
         """테이블에 새로운 행을 추가합니다."""
         if table_name in self._internal_tables:
@@ -221,6 +555,96 @@ class SchemaService:
 
         with self._engine.begin() as conn:
             conn.execute(text(sql), data)
+        self._metadata_cache.bump_data_version(table_name)
+
+    def add_rows_bulk(
+        self,
+        table_name: str,
+        rows: Iterable[dict | Sequence],
+        columns: Optional[list[str]] = None,
+        relax_durability: bool = False,
+        stop_on_error: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> BulkLoadResult:
+        """여러 행을 청크 단위 executemany로 적재합니다. (``BulkRowLoader`` 참고)"""
+        if table_name in self._internal_tables:
+            raise ValueError(f"시스템 테이블 '{table_name}'은(는) 수정할 수 없습니다.")
+        if table_name not in self.get_tables():
+            raise ValueError(f"테이블 '{table_name}'을(를) 찾을 수 없습니다.")
+
+        loader = BulkRowLoader(self._engine, chunk_size=chunk_size)
+        try:
+            return loader.load(
+                table_name,
+                rows,
+                columns=columns,
+                relax_durability=relax_durability,
+                stop_on_error=stop_on_error,
+            )
+        finally:
+            self._metadata_cache.bump_data_version(table_name)
+
+
+def _foreign_key_map(foreign_keys: list[dict]) -> dict[str, str]:
+    """Inspector FK 목록 → 컬럼 이름별 참조 대상 "table.column"."""
+    mapping = {}
+    for fk in foreign_keys:
+        for column, referred in zip(fk["constrained_columns"], fk["referred_columns"]):
+            mapping[column] = f"{fk['referred_table']}.{referred}"
+    return mapping
+
+
+# SQLite 테이블에 기본 키가 없을 때 키로 사용하는 rowid 별칭
+_ROWID = "__rowid__"
+
+
+# JSON으로 그대로 담을 수 없는 키 값의 타입 태그 → (타입, 직렬화, 역직렬화)
+_CURSOR_TYPES = {
+    "bytes": (bytes, lambda v: base64.b64encode(v).decode(), base64.b64decode),
+    "datetime": (datetime.datetime, datetime.datetime.isoformat, datetime.datetime.fromisoformat),
+    "date": (datetime.date, datetime.date.isoformat, datetime.date.fromisoformat),
+    "time": (datetime.time, datetime.time.isoformat, datetime.time.fromisoformat),
+    "decimal": (decimal.Decimal, str, decimal.Decimal),
+    "uuid": (uuid.UUID, str, uuid.UUID),
+}
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    """키 값을 JSON 값으로 변환합니다. JSON 기본 타입이 아니면 ``{"t": 태그, "v": 문자열}``."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    for tag, (kind, encode, _) in _CURSOR_TYPES.items():
+        if isinstance(value, kind):
+            return {"t": tag, "v": encode(value)}
+    raise ValueError(f"커서 정렬에 사용할 수 없는 값 타입입니다: {type(value).__name__}")
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return _CURSOR_TYPES[value["t"]][2](value["v"])
+
+
+def _encode_table_cursor(values: list, order_columns: list[str], descending: bool) -> str:
+    """정렬 조건과 마지막 행의 키 값을 불투명한 커서 문자열로 만듭니다."""
+    payload = json.dumps(
+        {"o": order_columns, "d": descending, "k": [_encode_cursor_value(v) for v in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_table_cursor(cursor: str, order_columns: list[str], descending: bool) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_cursor_value(v) for v in payload["k"]]
+        matches = payload["o"] == order_columns and payload["d"] == descending
+    except (ValueError, TypeError, KeyError, decimal.InvalidOperation) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    if not matches or len(values) != len(order_columns):
+        raise ValueError("커서의 정렬 조건이 요청과 다릅니다.")
+    return values
 
 
 def get_schema_service(db_engine: Annotated[Engine, Depends(get_engine)]) -> SchemaService:
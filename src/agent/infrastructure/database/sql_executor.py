@@ -0,0 +1,285 @@
+"""Read-only execution of generated SQL with streamed results and a result cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy.engine import Connection, Engine
+
+from agent.config import settings
+from agent.domain.services.sql_cost_guard import SQLCostGuard
+from agent.infrastructure.database.connection import get_engine
+from agent.infrastructure.database.cost_guard import get_cost_guard
+from agent.infrastructure.database.globals import get_global_schema_service
+from agent.shared.sql import ensure_read_only, normalize_sql, referenced_tables
+
+@dataclass
+class _CachedResult:
+    columns: list[str]
+    rows: list[list]
+    truncated: bool
+    expires_at: float
+
+
+class QueryResultCache:
+    """SQL 실행 결과 LRU 캐시.
+
+    키에 참조 테이블별 (스키마 버전, 데이터 버전)이 포함되므로 앱을 통한 DDL이나
+    행 적재가 일어나면 이전 결과는 다시 조회되지 않습니다. 앱 밖에서의 변경은
+    TTL이 지나야 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+        max_rows: int | None = None,
+    ):
+        self._max_size = max_size or settings.query_result_cache_size
+        self._ttl = ttl_seconds if ttl_seconds is not None else settings.query_result_cache_ttl_seconds
+        self.max_rows = max_rows if max_rows is not None else settings.query_result_cache_max_rows
+        self._entries: OrderedDict[tuple, _CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple) -> Optional[_CachedResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: tuple, columns: list[str], rows: list[list], truncated: bool) -> None:
+        if len(rows) > self.max_rows:
+            return
+        with self._lock:
+            self._entries[key] = _CachedResult(columns, rows, truncated, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            }
+
+
+@dataclass
+class ExecutionPlan:
+    """검증을 마친 실행 요청 (스트리밍 시작 전에 오류를 돌려주기 위해 분리)."""
+
+    sql: str
+    max_rows: int
+    tables: list[str]
+    cache_key: tuple
+
+
+class SQLExecutor:
+    """생성된 SQL을 읽기 전용으로 실행하고 결과를 청크 단위 이벤트로 내보냅니다.
+
+    - SQLite: ``PRAGMA query_only``와 진행 핸들러로 쓰기 차단/시간 제한
+    - PostgreSQL: ``READ ONLY`` 트랜잭션과 ``statement_timeout``
+    - ``max_rows``까지만 읽고 나머지는 ``truncated``로 표시
+
+    이벤트는 ``columns`` → ``rows``(여러 번) → ``done`` 순서이며 실패 시 ``error``로
+    끝납니다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        schema_service,
+        cache: Optional[QueryResultCache] = None,
+        timeout_seconds: float | None = None,
+        max_rows: int | None = None,
+        chunk_rows: int | None = None,
+        cost_guard: Optional[SQLCostGuard] = None,
+    ):
+        self._engine = engine
+        self._schema_service = schema_service
+        self._cache = cache
+        self._cost_guard = cost_guard
+        self._timeout = (
+            timeout_seconds if timeout_seconds is not None else settings.query_execute_timeout_seconds
+        )
+        self._max_rows = max_rows or settings.query_execute_max_rows
+        self._chunk_rows = chunk_rows or settings.query_execute_chunk_rows
+
+    def prepare(self, sql: str, max_rows: Optional[int] = None) -> ExecutionPlan:
+        """SQL을 검증하고 캐시 키를 계산합니다.
+
+        Raises:
+            ValueError: 읽기 전용 단일 SELECT 문이 아니거나 비용 검사에서 차단됨
+        """
+        ensure_read_only(sql)
+        if self._cost_guard is not None:
+            cost = self._cost_guard.check(sql)
+            if cost.blocked:
+                raise ValueError(f"비용 검사에서 차단된 질의입니다: {'; '.join(cost.reasons)}")
+        max_rows = min(max_rows or self._max_rows, self._max_rows)
+        tables = referenced_tables(sql, self._schema_service.get_tables())
+        cache = self._schema_service.metadata_cache
+        versions = tuple((t, cache.table_version(t), cache.data_version(t)) for t in tables)
+        return ExecutionPlan(
+            sql=sql.strip().rstrip(";"),
+            max_rows=max_rows,
+            tables=tables,
+            cache_key=(normalize_sql(sql), max_rows, versions),
+        )
+
+    def stream(self, plan: ExecutionPlan) -> Iterator[dict]:
+        """실행 결과 이벤트를 순서대로 생성합니다."""
+        start = time.perf_counter()
+        cached = self._cache.get(plan.cache_key) if self._cache is not None else None
+        if cached is not None:
+            yield {"event": "columns", "columns": cached.columns}
+            for i in range(0, len(cached.rows), self._chunk_rows):
+                yield {"event": "rows", "rows": cached.rows[i : i + self._chunk_rows]}
+            yield self._done(len(cached.rows), cached.truncated, start, cached=True)
+            return
+
+        buffer: Optional[list[list]] = [] if self._cache is not None else None
+        row_count = 0
+        truncated = False
+        try:
+            with self._engine.connect() as conn, self._read_only(conn) as clock:
+                with clock.running():
+                    result = conn.execution_options(
+                        stream_results=True, yield_per=self._chunk_rows
+                    ).exec_driver_sql(plan.sql)
+                columns = list(result.keys())
+                yield {"event": "columns", "columns": columns}
+
+                # 제한 시간은 DB가 결과를 만드는 시간에만 적용 (클라이언트가 읽는 동안은 멈춤)
+                partitions = result.partitions(self._chunk_rows)
+                while True:
+                    with clock.running():
+                        partition = next(partitions, None)
+                    if partition is None:
+                        break
+                    rows = [list(row) for row in partition[: plan.max_rows - row_count]]
+                    row_count += len(rows)
+                    if rows:
+                        yield {"event": "rows", "rows": rows}
+                    if buffer is not None:
+                        buffer.extend(rows)
+                        if len(buffer) > self._cache.max_rows:
+                            buffer = None  # 캐시하기엔 너무 큰 결과
+                    if row_count >= plan.max_rows:
+                        with clock.running():
+                            truncated = len(partition) > len(rows) or result.fetchone() is not None
+                        break
+                result.close()
+        except Exception as e:
+            yield {"event": "error", "message": str(e).splitlines()[0], "row_count": row_count}
+            return
+
+        if buffer is not None:
+            self._cache.put(plan.cache_key, columns, buffer, truncated)
+        yield self._done(row_count, truncated, start, cached=False)
+
+    @staticmethod
+    def _done(row_count: int, truncated: bool, start: float, cached: bool) -> dict:
+        return {
+            "event": "done",
+            "row_count": row_count,
+            "truncated": truncated,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+            "cached": cached,
+        }
+
+    @contextmanager
+    def _read_only(self, conn: Connection) -> Iterator["_ExecutionClock"]:
+        dialect = self._engine.dialect.name
+        clock = _ExecutionClock(self._timeout)
+        if dialect == "sqlite":
+            driver = conn.connection.driver_connection
+            # 0이 아닌 값을 반환하면 SQLite가 실행을 중단 (OperationalError: interrupted)
+            driver.set_progress_handler(lambda: int(clock.expired()), 10_000)
+            conn.exec_driver_sql("PRAGMA query_only=1")
+            try:
+                yield clock
+            finally:
+                conn.rollback()
+                conn.exec_driver_sql("PRAGMA query_only=0")
+                driver.set_progress_handler(None, 0)
+        elif dialect == "postgresql":
+            with conn.begin() as transaction:
+                conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self._timeout * 1000)}")
+                try:
+                    yield clock
+                finally:
+                    transaction.rollback()
+        else:
+            try:
+                yield clock
+            finally:
+                conn.rollback()
+
+
+class _ExecutionClock:
+    """``running()`` 구간의 시간만 누적하는 실행 시간 타이머 (SQLite 진행 핸들러용)."""
+
+    def __init__(self, timeout: float):
+        self._timeout = timeout
+        self._spent = 0.0
+        self._started: Optional[float] = None
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        self._started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._spent += time.monotonic() - self._started
+            self._started = None
+
+    def expired(self) -> bool:
+        started = self._started
+        return started is not None and self._spent + time.monotonic() - started > self._timeout
+
+
+_query_result_cache: Optional[QueryResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_query_result_cache() -> Optional[QueryResultCache]:
+    """프로세스 전역 결과 캐시를 반환합니다. 비활성화된 경우 None."""
+    global _query_result_cache
+    if not settings.query_result_cache_enabled:
+        return None
+    if _query_result_cache is None:
+        with _cache_lock:
+            if _query_result_cache is None:
+                _query_result_cache = QueryResultCache()
+    return _query_result_cache
+
+
+def get_sql_executor() -> SQLExecutor:
+    return SQLExecutor(
+        get_engine(),
+        get_global_schema_service(),
+        cache=get_query_result_cache(),
+        cost_guard=get_cost_guard(),
+    )
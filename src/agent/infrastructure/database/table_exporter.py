@@ -0,0 +1,204 @@
+"""Streaming table export (CSV, NDJSON, Arrow IPC) with constant memory."""
+
+import base64
+import csv
+import io
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import MetaData, Table, select, type_coerce, types as sa_types
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import NullType
+
+from agent.config import settings
+from agent.infrastructure.database.connection import get_engine
+
+EXPORT_FORMATS = {
+    # format → (media type, 파일 확장자)
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+@dataclass
+class ExportPlan:
+    """검증을 마친 내보내기 요청 (스트리밍 시작 전에 오류를 돌려주기 위해 분리)."""
+
+    table: Table
+    columns: list[str]
+    format: str
+    compress: bool
+
+    @property
+    def media_type(self) -> str:
+        return "application/gzip" if self.compress else EXPORT_FORMATS[self.format][0]
+
+    @property
+    def filename(self) -> str:
+        name = f"{self.table.name}.{EXPORT_FORMATS[self.format][1]}"
+        return f"{name}.gz" if self.compress else name
+
+
+class TableExporter:
+    """테이블을 서버 측 커서로 읽어 고정 크기 청크로 직렬화합니다.
+
+    ``chunk_rows``개씩 ``yield_per``로 가져와 바로 인코딩하므로, 테이블 크기와
+    관계없이 메모리 사용량은 청크 하나 분량으로 유지됩니다. ``compress``이면
+    청크마다 gzip 스트림으로 압축해 내보냅니다.
+    """
+
+    def __init__(self, engine: Engine, chunk_rows: int | None = None):
+        self._engine = engine
+        self._chunk_rows = chunk_rows or settings.export_chunk_rows
+
+    def prepare(
+        self,
+        table_name: str,
+        format: str = "csv",
+        columns: Optional[list[str]] = None,
+        compress: bool = False,
+    ) -> ExportPlan:
+        """요청을 검증하고 내보낼 테이블/컬럼을 확정합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 형식, 존재하지 않는 컬럼, pyarrow 미설치
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {format} (csv, ndjson, arrow)")
+        if format == "arrow":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ValueError("arrow 형식을 사용하려면 pyarrow를 설치해야 합니다.") from None
+
+        table = Table(table_name, MetaData(), autoload_with=self._engine)
+        if columns:
+            unknown = [c for c in columns if c not in table.c]
+            if unknown:
+                raise ValueError(f"테이블 '{table_name}'에 없는 컬럼입니다: {', '.join(unknown)}")
+        else:
+            columns = [c.name for c in table.columns]
+
+        return ExportPlan(table=table, columns=columns, format=format, compress=compress)
+
+    def stream(self, plan: ExportPlan) -> Iterator[bytes]:
+        """직렬화된 청크를 순서대로 생성합니다."""
+        encoder = {
+            "csv": self._encode_csv,
+            "ndjson": self._encode_ndjson,
+            "arrow": self._encode_arrow,
+        }[plan.format]
+        chunks = encoder(plan, self._iter_batches(plan))
+        return _gzip_chunks(chunks) if plan.compress else chunks
+
+    def _iter_batches(self, plan: ExportPlan) -> Iterator[list[tuple]]:
+        columns = [plan.table.c[c] for c in plan.columns]
+        if plan.format != "arrow":
+            # 텍스트 형식은 드라이버 값을 그대로 직렬화 (Decimal/datetime 변환 비용 생략)
+            columns = [type_coerce(c, NullType()).label(c.name) for c in columns]
+        stmt = select(*columns)
+        with self._engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=self._chunk_rows).execute(stmt)
+            for partition in result.partitions():
+                yield partition
+
+    @staticmethod
+    def _encode_csv(plan: ExportPlan, batches: Iterator[list[tuple]]) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(plan.columns)
+        for rows in batches:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _encode_ndjson(plan: ExportPlan, batches: Iterator[list[tuple]]) -> Iterator[bytes]:
+        columns = plan.columns
+        # json.dumps는 옵션이 있으면 호출마다 인코더를 새로 만들므로 하나를 재사용
+        encode = json.JSONEncoder(ensure_ascii=False, default=json_default).encode
+        for rows in batches:
+            yield "".join(encode(dict(zip(columns, row))) + "\n" for row in rows).encode("utf-8")
+
+    @staticmethod
+    def _encode_arrow(plan: ExportPlan, batches: Iterator[list[tuple]]) -> Iterator[bytes]:
+        import pyarrow as pa
+
+        fields = [_arrow_field(plan.table.c[c]) for c in plan.columns]
+        schema = pa.schema([f for f, _ in fields])
+        sink = io.BytesIO()
+        writer = pa.ipc.new_stream(sink, schema)
+
+        def drain() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        yield drain()  # 스키마 메시지
+        for rows in batches:
+            arrays = [
+                pa.array([convert(row[i]) if row[i] is not None else None for row in rows], type=f.type)
+                for i, (f, convert) in enumerate(fields)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield drain()
+        writer.close()
+        yield drain()
+
+
+def get_table_exporter() -> TableExporter:
+    return TableExporter(get_engine())
+
+
+def json_default(value: Any):
+    """JSON으로 직렬화할 수 없는 DB 값 변환 (datetime → ISO, Decimal → float, bytes → base64)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode()
+    return str(value)
+
+
+def _arrow_field(column) -> tuple[Any, Callable[[Any], Any]]:
+    """SQLAlchemy 컬럼 타입 → (Arrow 필드, 값 변환 함수)."""
+    import pyarrow as pa
+
+    type_ = column.type
+    identity = lambda v: v  # noqa: E731
+    if isinstance(type_, sa_types.Boolean):
+        mapping = (pa.bool_(), bool)
+    elif isinstance(type_, sa_types.Integer):
+        mapping = (pa.int64(), int)
+    elif isinstance(type_, sa_types.Numeric):  # Float 포함, Decimal은 float로 변환
+        mapping = (pa.float64(), float)
+    elif isinstance(type_, sa_types.DateTime):
+        mapping = (pa.timestamp("us"), identity)
+    elif isinstance(type_, sa_types.Date):
+        mapping = (pa.date32(), identity)
+    elif isinstance(type_, sa_types._Binary):
+        mapping = (pa.binary(), bytes)
+    else:
+        mapping = (pa.string(), str)
+    arrow_type, convert = mapping
+    return pa.field(column.name, arrow_type, nullable=column.nullable), convert
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """청크 스트림을 하나의 gzip 스트림으로 압축합니다."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더/트레일러
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
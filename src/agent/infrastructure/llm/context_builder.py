@@ -0,0 +1,266 @@
+"""Token-budgeted schema context for SQL generation prompts."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from agent.config import settings
+from agent.domain.services.schema_context import SchemaContext, SchemaContextBuilder
+from agent.domain.services.schema_retriever import RetrievedSchema, format_join_keys
+from agent.infrastructure.database.globals import get_global_schema_service
+from agent.infrastructure.llm.tokenizer import TokenCounter, get_token_counter
+from agent.presentation.api.schemas import ColumnInfoDTO, TableInfoDTO
+from agent.shared.text import identifier_terms
+
+_HEADER = "Relevant tables for your query:"
+_HANGUL = re.compile(r"[가-힣]")
+_TIME_TERMS = {
+    "date", "time", "day", "daily", "week", "weekly", "month", "monthly", "year", "yearly",
+    "when", "recent", "latest", "last", "since", "before", "after", "between", "today",
+    "날짜", "시간", "일자", "최근", "언제", "이번", "지난", "기간", "월별", "연도",
+}
+_TIME_TYPES = ("DATE", "TIME")
+_MAX_COMMENT_CHARS = 60
+_MAX_CACHED_COLUMNS = 50_000
+
+
+def _terms(text: str) -> set[str]:
+    return set(identifier_terms(text))
+
+
+@dataclass(frozen=True)
+class _ColumnEntry:
+    """질문과 무관한 컬럼별 값 (렌더링 조각, 토큰 수, 단어 집합)."""
+
+    text: str
+    tokens: int
+    name_tokens: int
+    name_terms: frozenset[str]
+    comment_terms: frozenset[str]
+    is_time: bool
+
+
+class TokenBudgetContextBuilder(SchemaContextBuilder):
+    """검색된 테이블을 ``max_tokens`` 안에 들어오도록 압축해 렌더링합니다.
+
+    전체 스키마가 예산 안에 들어가면 그대로 쓰고, 넘치면 PK/FK 컬럼은 항상 남긴 채
+    컬럼 인덱스에서 검색된 컬럼과 질문과 겹치는 단어가 있는 컬럼을 관련도 순으로
+    채웁니다. 관련 없는 컬럼은 예산이 남는 만큼 이름만, 나머지는 개수만 표시합니다.
+    PK/FK만으로도 넘치면 관련도가 낮은 테이블부터 뺍니다. 검색 결과에 조인 조건이
+    있으면 남은 테이블 사이의 조건을 마지막 줄에 표시합니다.
+    """
+
+    def __init__(
+        self,
+        schema_service,
+        max_tokens: int | None = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        self._schema_service = schema_service
+        self._max_tokens = max_tokens or settings.schema_context_max_tokens
+        self._counter = token_counter or get_token_counter()
+        self._columns: dict[tuple, _ColumnEntry] = {}
+
+    def count_tokens(self, text: str) -> int:
+        return self._counter.count(text)
+
+    def build(self, user_query: str, schemas: list[RetrievedSchema]) -> SchemaContext:
+        if not schemas:
+            return self._result("No relevant tables found in the database.", user_query, [], 0, 0)
+
+        tables: list[TableInfoDTO | RetrievedSchema] = []
+        for schema in schemas:
+            info = self._schema_service.get_table_info(schema.table_name)
+            # 인덱스에는 있지만 DB에서 사라진 테이블 등은 검색 문서를 그대로 사용
+            tables.append(info if info is not None and info.columns else schema)
+        columns_total = sum(len(t.columns) for t in tables if isinstance(t, TableInfoDTO))
+
+        entries = {
+            (t.name, c.name): self._entry(c) for t in tables if isinstance(t, TableInfoDTO) for c in t.columns
+        }
+        # 조각 토큰 합으로 예산을 확실히 넘는 경우에는 전체 렌더링을 세지 않음
+        if sum(e.tokens + 1 for e in entries.values()) <= self._max_tokens:
+            full = self._render(tables, {}, schemas=schemas)
+            if self.count_tokens(full) <= self._max_tokens:
+                return self._result(full, user_query, tables, columns_total, columns_total)
+
+        query_lower = user_query.lower()
+        query_terms = _terms(user_query)
+        wants_time = bool(query_terms & _TIME_TERMS) or any(
+            _HANGUL.match(t) and t in user_query for t in _TIME_TERMS
+        )
+        selected: dict[str, set[str]] = {
+            t.name: {c.name for c in t.columns if c.primary_key or c.foreign_key}
+            for t in tables
+            if isinstance(t, TableInfoDTO)
+        }
+
+        used = self.count_tokens(self._render(tables, selected, schemas=schemas))
+        while used > self._max_tokens and len(tables) > 1:
+            tables = tables[:-1]
+            used = self.count_tokens(self._render(tables, selected, schemas=schemas))
+
+        candidates = []
+        # 컬럼 인덱스에서 검색된 컬럼은 의미상 관련 (한국어 질문처럼 단어가 겹치지 않아도)
+        semantic = {
+            (s.table_name, name): 2.0 + 0.5 / (1 + i)
+            for s in schemas
+            for i, name in enumerate(s.matched_columns)
+        }
+        for rank, table in enumerate(tables):
+            if not isinstance(table, TableInfoDTO):
+                continue
+            for position, column in enumerate(table.columns):
+                if column.name in selected[table.name]:
+                    continue
+                score = semantic.get((table.name, column.name), 0.0) + self._score(
+                    column, entries[(table.name, column.name)], query_lower, query_terms, wants_time
+                )
+                candidates.append((-score, rank, position, table.name, column))
+        # 관련 컬럼은 점수 → 테이블 순위, 이름만 넣을 컬럼은 테이블마다 앞쪽 컬럼부터 번갈아
+        candidates.sort(key=lambda c: c[:3] if c[0] < 0 else (0, c[2], c[1]))
+
+        # 관련 컬럼은 타입과 함께, 나머지는 남는 예산만큼 이름만 (조각 단위 토큰 합으로 추정)
+        added: list[tuple[str, str]] = []
+        named: dict[str, list[str]] = {}
+        for negative_score, _, _, table_name, column in candidates:
+            if self._max_tokens - used < 2:
+                break
+            entry = entries[(table_name, column.name)]
+            if negative_score < 0:
+                cost = entry.tokens + 1
+                if used + cost <= self._max_tokens:
+                    selected[table_name].add(column.name)
+                    added.append((table_name, column.name))
+                    used += cost
+            else:
+                cost = entry.name_tokens + 1
+                if used + cost <= self._max_tokens:
+                    named.setdefault(table_name, []).append(column.name)
+                    used += cost
+
+        # 추정치와 실제 토큰 수의 차이로 넘치면 이름 목록, 관련도가 낮은 컬럼 순으로 제거
+        text = self._render(tables, selected, named, schemas)
+        while self.count_tokens(text) > self._max_tokens and (named or added):
+            if named:
+                named.clear()
+            else:
+                table_name, column_name = added.pop()
+                selected[table_name].discard(column_name)
+            text = self._render(tables, selected, named, schemas)
+
+        included = sum(len(selected.get(t.name, ())) for t in tables if isinstance(t, TableInfoDTO))
+        return self._result(text, user_query, tables, columns_total, included)
+
+    def _result(
+        self, text: str, user_query: str, tables: list, columns_total: int, columns_included: int
+    ) -> SchemaContext:
+        return SchemaContext(
+            text=text,
+            prompt_tokens=self.count_tokens(text) + self.count_tokens(user_query),
+            tables=[_table_name(t) for t in tables],
+            columns_total=columns_total,
+            columns_included=columns_included,
+        )
+
+    def _entry(self, column: ColumnInfoDTO) -> _ColumnEntry:
+        key = (column.name, column.type, column.primary_key, column.foreign_key, column.nullable, column.comment)
+        entry = self._columns.get(key)
+        if entry is None:
+            if len(self._columns) >= _MAX_CACHED_COLUMNS:
+                self._columns.clear()
+            text = _column_text(column)
+            entry = _ColumnEntry(
+                text=text,
+                tokens=self.count_tokens(text),
+                name_tokens=self.count_tokens(column.name),
+                name_terms=frozenset(_terms(column.name)),
+                comment_terms=frozenset(_terms(column.comment)),
+                is_time=any(t in column.type.upper() for t in _TIME_TYPES),
+            )
+            self._columns[key] = entry
+        return entry
+
+    @staticmethod
+    def _score(
+        column: ColumnInfoDTO,
+        entry: _ColumnEntry,
+        query_lower: str,
+        query_terms: set[str],
+        wants_time: bool,
+    ) -> float:
+        """질문과 컬럼의 관련도 (이름 단어 일치 > 설명 일치 > 타입 힌트)."""
+        score = 2.0 * len(entry.name_terms & query_terms)
+        if column.name.lower() in query_lower:
+            score += 2.0
+        if entry.comment_terms:
+            score += 0.5 * len(entry.comment_terms & query_terms)
+            # 한국어는 조사가 붙으므로 설명의 단어가 질문에 포함되는지로 판단
+            score += 0.5 * sum(
+                1 for t in entry.comment_terms if len(t) > 1 and _HANGUL.match(t) and t in query_lower
+            )
+        if wants_time and entry.is_time:
+            score += 1.0
+        return score
+
+    @staticmethod
+    def _render(
+        tables: list,
+        selected: dict[str, set[str]],
+        named: Optional[dict[str, list[str]]] = None,
+        schemas: Optional[list[RetrievedSchema]] = None,
+    ) -> str:
+        """``selected`` 컬럼은 타입과 함께, ``named`` 컬럼은 이름만, 나머지는 개수만 표시합니다.
+
+        ``selected``에 없는 테이블은 모든 컬럼을 표시합니다.
+        """
+        lines = [_HEADER]
+        for table in tables:
+            if not isinstance(table, TableInfoDTO):
+                lines.append(f"- {table.document}")
+                continue
+            keep = selected.get(table.name)
+            shown = [c for c in table.columns if keep is None or c.name in keep]
+            parts = [_column_text(c) for c in shown]
+            omitted = len(table.columns) - len(shown)
+            names = (named or {}).get(table.name)
+            if names:
+                parts.append(f"also: {' '.join(names)}")
+                omitted -= len(names)
+            if omitted:
+                parts.append(f"+{omitted} more")
+            lines.append(f"- {table.name}({', '.join(parts)})")
+        join_keys = format_join_keys(schemas, {_table_name(t) for t in tables}) if schemas else ""
+        if join_keys:
+            lines.append(join_keys)
+        return "\n".join(lines)
+
+
+def _column_text(column: ColumnInfoDTO) -> str:
+    text = f"{column.name} {column.type}"
+    if column.primary_key:
+        text += " PK"
+    if column.foreign_key:
+        text += f" FK->{column.foreign_key}"
+    if not column.nullable and not column.primary_key:
+        text += " NOT NULL"
+    if column.comment:
+        text += f' "{column.comment[:_MAX_COMMENT_CHARS]}"'
+    return text
+
+
+def _table_name(table) -> str:
+    return table.name if isinstance(table, TableInfoDTO) else table.table_name
+
+
+_schema_context_builder: Optional[TokenBudgetContextBuilder] = None
+
+
+def get_schema_context_builder() -> TokenBudgetContextBuilder:
+    """컬럼별 토큰 수 캐시를 요청 간에 공유하는 전역 builder를 반환합니다."""
+    global _schema_context_builder
+    schema_service = get_global_schema_service()
+    builder = _schema_context_builder
+    if builder is None or builder._schema_service is not schema_service:
+        builder = _schema_context_builder = TokenBudgetContextBuilder(schema_service)
+    return builder
@@ -1,5 +1,4 @@
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from typing import AsyncIterator
 
 from agent.config import settings
 from agent.domain.services.sql_generator import SQLGenerator
@@ -21,6 +20,11 @@ class LangChainSQLGenerator(SQLGenerator):
             return
 
         self._initialized = True
+
+        # LangChain은 무거우므로 모듈 임포트가 아닌 첫 생성 시점에 로드
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_openai import ChatOpenAI
+
         self._llm = ChatOpenAI(
             api_key=settings.openai_api_key,
             base_url=settings.openai_base_url,
@@ -41,18 +45,34 @@ Database Schema:
 
         self._chain = self._prompt | self._llm
 
-    def generate(self, user_query: str, schema_context: str) -> str:
-        """자연어를 SQL로 변환합니다."""
+    @staticmethod
+    def _build_inputs(user_query: str, schema_context: str) -> dict:
         if not schema_context:
             schema_context = "No schema provided. Generate a generic SQL query."
 
-        response = self._chain.invoke({
+        return {
             "user_query": user_query,
             "schema_context": schema_context,
-        })
+        }
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        """자연어를 SQL로 변환합니다."""
+        response = self._chain.invoke(self._build_inputs(user_query, schema_context))
 
         return response.content
 
+    async def agenerate(self, user_query: str, schema_context: str) -> str:
+        """자연어를 SQL로 변환합니다 (비동기 HTTP 클라이언트 사용)."""
+        response = await self._chain.ainvoke(self._build_inputs(user_query, schema_context))
+
+        return response.content
+
+    async def astream(self, user_query: str, schema_context: str) -> AsyncIterator[str]:
+        """LLM이 생성하는 토큰을 도착 즉시 전달합니다."""
+        async for chunk in self._chain.astream(self._build_inputs(user_query, schema_context)):
+            if chunk.content:
+                yield chunk.content
+
 
 def get_sql_generator() -> LangChainSQLGenerator:
     return LangChainSQLGenerator()
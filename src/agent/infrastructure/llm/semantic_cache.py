@@ -0,0 +1,216 @@
+"""Semantic response cache in front of the SQL generator."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable
+from uuid import uuid4
+
+from agent.config import settings
+from agent.domain.services.sql_cache import SQLResponseCache
+from agent.shared.text import normalize_query, query_literals
+
+
+@dataclass
+class _CacheEntry:
+    """캐시된 SQL 생성 결과."""
+
+    normalized_query: str
+    tables: frozenset[str]
+    literals: tuple[str, ...]  # 질문의 숫자/날짜/문자열 리터럴 (정확히 같아야 재사용)
+    sql: str
+    embedding: tuple[float, ...]
+    expires_at: float
+
+
+def _default_embed(text: str) -> list[float]:
+    # sentence-transformers 모델은 첫 캐시 조회 시점에 로드
+    from agent.infrastructure.vectorstore.embedding_service import get_embedding_service
+
+    return get_embedding_service().embed_query(text)
+
+
+def _unit(vector: Iterable[float]) -> tuple[float, ...]:
+    values = tuple(float(v) for v in vector)
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return tuple(v / norm for v in values)
+
+
+class SemanticSQLCache(SQLResponseCache):
+    """질문 임베딩 유사도 기반의 SQL 응답 캐시.
+
+    검색된 테이블 집합과 질문의 리터럴(숫자, 날짜, 따옴표 문자열)이 동일하고 질문
+    임베딩의 코사인 유사도가 임계값 이상인 이전 생성 결과를 재사용합니다. 크기 제한(LRU)과 TTL을 가지며, 캐시된 SQL이
+    의존하는 테이블에 DDL이 발생하면 ``invalidate_tables()``로 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], list[float]] = _default_embed,
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+        similarity_threshold: float | None = None,
+    ):
+        self._embed = embed_fn
+        self._max_size = max_size or settings.semantic_cache_size
+        self._ttl = ttl_seconds if ttl_seconds is not None else settings.semantic_cache_ttl_seconds
+        self._threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else settings.semantic_cache_threshold
+        )
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._stale_skips = 0
+        # 테이블 → 무효화 횟수, clear() 횟수 (생성 중 DDL이 있었는지 판별)
+        self._table_epochs: dict[str, int] = {}
+        self._clear_epoch = 0
+
+    @staticmethod
+    def _table_key(tables: Iterable[str]) -> frozenset[str]:
+        return frozenset(t.lower() for t in tables)
+
+    def _epoch(self, tables: frozenset[str]) -> int:
+        return self._clear_epoch + sum(self._table_epochs.get(t, 0) for t in tables)
+
+    def epoch(self, tables: Iterable[str]) -> int:
+        """테이블들의 무효화 세대 (``invalidate_tables``/``clear``마다 증가)."""
+        table_key = self._table_key(tables)
+        with self._lock:
+            return self._epoch(table_key)
+
+    def _purge_expired(self, now: float) -> None:
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._evictions += len(expired)
+
+    def _find_exact(self, normalized: str, tables: frozenset[str], literals: tuple[str, ...]) -> str | None:
+        for key, entry in self._entries.items():
+            if entry.normalized_query == normalized and entry.tables == tables and entry.literals == literals:
+                return key
+        return None
+
+    def lookup(self, user_query: str, tables: Iterable[str]) -> str | None:
+        """캐시된 SQL을 조회합니다 (정확 일치 우선, 이후 임베딩 유사도)."""
+        table_key = self._table_key(tables)
+        normalized = normalize_query(user_query)
+        literals = query_literals(user_query)
+
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            key = self._find_exact(normalized, table_key, literals)
+            if key is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key].sql
+            if not any(e.tables == table_key and e.literals == literals for e in self._entries.values()):
+                self._misses += 1
+                return None
+
+        # 임베딩 계산은 락 밖에서 수행
+        embedding = _unit(self._embed(normalized))
+
+        with self._lock:
+            best_key, best_score = None, self._threshold
+            for key, entry in self._entries.items():
+                if entry.tables != table_key or entry.literals != literals:
+                    continue
+                score = sum(a * b for a, b in zip(embedding, entry.embedding))
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(best_key)
+            self._hits += 1
+            return self._entries[best_key].sql
+
+    def store(self, user_query: str, tables: Iterable[str], sql: str, epoch: int | None = None) -> None:
+        """완료된 SQL 생성 결과를 저장합니다.
+
+        ``epoch``가 주어졌고 그 사이 테이블이 무효화되었으면(생성 중 DDL) 저장하지 않습니다.
+        """
+        table_key = self._table_key(tables)
+        if not table_key or not sql:
+            return
+
+        normalized = normalize_query(user_query)
+        literals = query_literals(user_query)
+        embedding = _unit(self._embed(normalized))
+
+        with self._lock:
+            if epoch is not None and epoch != self._epoch(table_key):
+                self._stale_skips += 1
+                return
+            existing = self._find_exact(normalized, table_key, literals)
+            if existing is not None:
+                del self._entries[existing]
+
+            self._entries[uuid4().hex] = _CacheEntry(
+                normalized_query=normalized,
+                tables=table_key,
+                literals=literals,
+                sql=sql,
+                embedding=embedding,
+                expires_at=time.monotonic() + self._ttl,
+            )
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_tables(self, table_names: Iterable[str]) -> int:
+        """지정된 테이블에 의존하는 캐시 항목을 제거합니다.
+
+        Returns:
+            제거된 항목 수
+        """
+        names = self._table_key(table_names)
+        with self._lock:
+            for name in names:
+                self._table_epochs[name] = self._table_epochs.get(name, 0) + 1
+            stale = [key for key, entry in self._entries.items() if entry.tables & names]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._clear_epoch += 1
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "stale_skips": self._stale_skips,
+            }
+
+
+_semantic_sql_cache: SemanticSQLCache | None = None
+
+
+def get_semantic_sql_cache() -> SemanticSQLCache | None:
+    """프로세스 전역 시맨틱 캐시를 반환합니다. 비활성화된 경우 None."""
+    global _semantic_sql_cache
+    if not settings.semantic_cache_enabled:
+        return None
+    if _semantic_sql_cache is None:
+        _semantic_sql_cache = SemanticSQLCache()
+    return _semantic_sql_cache
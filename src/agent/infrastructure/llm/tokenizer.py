@@ -0,0 +1,59 @@
+"""Local token counting for prompt budgeting."""
+
+import re
+import threading
+from typing import Callable, Optional
+
+from agent.config import settings
+
+# tiktoken이 없을 때의 근사: 단어/숫자 묶음과 구두점 하나씩을 토큰으로 간주하고
+# 긴 단어는 4글자당 1토큰으로 계산 (BPE 토큰 수와 대략 ±15% 이내)
+_APPROX_TOKEN = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+def _approximate(text: str) -> int:
+    return sum(max(1, (len(piece) + 3) // 4) for piece in _APPROX_TOKEN.findall(text))
+
+
+class TokenCounter:
+    """프롬프트 토큰 수를 로컬에서 계산합니다.
+
+    tiktoken이 설치되어 있으면 ``encoding`` BPE로 정확히 세고, 없거나 인코딩 파일을
+    받을 수 없으면 정규식 기반 근사치를 사용합니다. ``exact``로 어느 쪽인지 확인할 수
+    있습니다.
+    """
+
+    def __init__(self, encoding: str | None = None):
+        self._encoding_name = encoding or settings.schema_context_tokenizer
+        self._count: Optional[Callable[[str], int]] = None
+        self._lock = threading.Lock()
+        self.exact = False
+
+    def _load(self) -> Callable[[str], int]:
+        with self._lock:
+            if self._count is None:
+                try:
+                    import tiktoken
+
+                    encoding = tiktoken.get_encoding(self._encoding_name)
+                    self._count = lambda text: len(encoding.encode_ordinary(text))
+                    self.exact = True
+                except Exception as e:
+                    print(f"[Tokenizer] tiktoken unavailable ({e}); using approximate token counts")
+                    self._count = _approximate
+        return self._count
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return (self._count or self._load())(text)
+
+
+_token_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
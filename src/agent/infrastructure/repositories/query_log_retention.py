@@ -0,0 +1,412 @@
+"""QueryLog retention: daily rollups, compressed archives and SQLite maintenance.
+
+CLI:
+    python -m agent.infrastructure.repositories.query_log_retention --days 30
+"""
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.engine import Connection, Engine
+
+from agent.config import settings
+from agent.domain.entities.query_log import QueryLogStatus
+from agent.infrastructure.database.connection import get_engine, register_shutdown_hook
+from agent.infrastructure.database.models import QueryLogDailyRollupModel, QueryLogModel
+
+_ARCHIVE_COLUMNS = (
+    "id",
+    "user_query",
+    "generated_sql",
+    "status",
+    "error_message",
+    "created_at",
+    "execution_time_ms",
+    "row_count",
+)
+
+
+@dataclass
+class RetentionResult:
+    """보존 정책 실행 결과."""
+
+    cutoff: datetime
+    dry_run: bool = False
+    days: list[date] = field(default_factory=list)
+    archived: int = 0
+    deleted: int = 0
+    rollups_written: int = 0
+    files: list[str] = field(default_factory=list)
+    freed_pages: int = 0
+    checkpoint: Optional[dict] = None
+    interrupted: bool = False
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "cutoff": self.cutoff.isoformat(),
+            "dry_run": self.dry_run,
+            "days": [d.isoformat() for d in self.days],
+            "archived": self.archived,
+            "deleted": self.deleted,
+            "rollups_written": self.rollups_written,
+            "files": self.files,
+            "freed_pages": self.freed_pages,
+            "checkpoint": self.checkpoint,
+            "interrupted": self.interrupted,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+class QueryLogRetention:
+    """오래된 QueryLog를 날짜별 gzip NDJSON 파일로 옮기고 일별 집계를 남깁니다.
+
+    ``retention_days``일보다 오래된 로그를 날짜 단위로 처리합니다.
+
+    1. 해당 날짜의 집계(상태별 건수, 자주 묻는 질문)가 없으면 SQL 집계로 먼저 저장
+    2. ``(created_at, id)`` 키셋 순서로 ``chunk_size``개씩 읽어
+       ``<archive_dir>/YYYY/MM/query_logs-YYYY-MM-DD.ndjson.gz``에 덧붙이고 fsync
+    3. 같은 청크를 짧은 트랜잭션으로 삭제하고 ``pause_ms``만큼 쉬어 라이브 쓰기에 락을 양보
+
+    파일 기록 후 삭제 전에 중단되면 다음 실행에서 같은 행이 다시 기록될 수 있습니다
+    (at-least-once). 메모리 사용량은 청크 크기로 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        retention_days: int | None = None,
+        archive_dir: str | Path | None = None,
+        chunk_size: int | None = None,
+        pause_ms: float | None = None,
+        top_questions: int | None = None,
+        vacuum_pages: int | None = None,
+    ):
+        self._engine = engine
+        self._retention_days = (
+            retention_days if retention_days is not None else settings.query_log_retention_days
+        )
+        self._archive_dir = Path(archive_dir or settings.query_log_archive_dir)
+        self._chunk_size = chunk_size or settings.query_log_archive_chunk_size
+        self._pause = (pause_ms if pause_ms is not None else settings.query_log_archive_pause_ms) / 1000
+        self._top_questions = (
+            top_questions if top_questions is not None else settings.query_log_rollup_top_questions
+        )
+        self._vacuum_pages = (
+            vacuum_pages if vacuum_pages is not None else settings.query_log_vacuum_pages
+        )
+
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """이 시각 이전의 로그가 아카이브 대상입니다 (날짜 경계로 내림)."""
+        today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=self._retention_days)
+
+    def archive_path(self, day: date) -> Path:
+        return self._archive_dir / f"{day:%Y}" / f"{day:%m}" / f"query_logs-{day.isoformat()}.ndjson.gz"
+
+    def run(
+        self,
+        now: Optional[datetime] = None,
+        dry_run: bool = False,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> RetentionResult:
+        """보존 정책을 한 번 실행합니다.
+
+        Args:
+            now: 기준 시각 (테스트용)
+            dry_run: 대상 날짜와 건수만 계산하고 아무것도 쓰지 않음
+            should_stop: 청크 사이마다 확인하는 중단 요청 함수
+        """
+        start = time.perf_counter()
+        result = RetentionResult(cutoff=self.cutoff(now), dry_run=dry_run)
+        should_stop = should_stop or (lambda: False)
+
+        day = self._next_day(None, result.cutoff)
+        while day is not None:
+            if should_stop():
+                result.interrupted = True
+                break
+            result.days.append(day)
+            self._process_day(day, result, dry_run, should_stop)
+            day = self._next_day(day, result.cutoff)
+
+        if not dry_run and result.deleted:
+            self._maintain(result)
+
+        result.duration_seconds = time.perf_counter() - start
+        return result
+
+    def _next_day(self, after: Optional[date], cutoff: datetime) -> Optional[date]:
+        """``after`` 다음으로 로그가 있는 가장 오래된 날짜."""
+        stmt = select(func.min(QueryLogModel.created_at)).where(QueryLogModel.created_at < cutoff)
+        if after is not None:
+            stmt = stmt.where(QueryLogModel.created_at >= _day_start(after + timedelta(days=1)))
+        with self._engine.connect() as conn:
+            oldest = conn.scalar(stmt)
+        return oldest.date() if oldest is not None else None
+
+    def _process_day(
+        self,
+        day: date,
+        result: RetentionResult,
+        dry_run: bool,
+        should_stop: Callable[[], bool],
+    ) -> None:
+        day_from, day_to = _day_start(day), _day_start(day + timedelta(days=1))
+        in_day = (QueryLogModel.created_at >= day_from) & (QueryLogModel.created_at < day_to)
+
+        if dry_run:
+            with self._engine.connect() as conn:
+                result.archived += conn.scalar(select(func.count()).where(in_day))
+            return
+
+        if self._write_rollup(day, in_day):
+            result.rollups_written += 1
+
+        path = self.archive_path(day)
+        after = None
+        while True:
+            stmt = select(*[QueryLogModel.__table__.c[c] for c in _ARCHIVE_COLUMNS]).where(in_day)
+            if after is not None:
+                stmt = stmt.where(tuple_(QueryLogModel.created_at, QueryLogModel.id) > after)
+            stmt = stmt.order_by(QueryLogModel.created_at, QueryLogModel.id).limit(self._chunk_size)
+
+            with self._engine.connect() as conn:
+                rows = [dict(row._mapping) for row in conn.execute(stmt)]
+            if not rows:
+                break
+
+            self._append(path, rows)
+            ids = [row["id"] for row in rows]
+            with self._engine.begin() as conn:
+                deleted = conn.execute(delete(QueryLogModel).where(QueryLogModel.id.in_(ids))).rowcount
+                conn.execute(
+                    QueryLogDailyRollupModel.__table__.update()
+                    .where(QueryLogDailyRollupModel.day == day)
+                    .values(
+                        archived_rows=QueryLogDailyRollupModel.archived_rows + len(rows),
+                        archive_path=str(path),
+                    )
+                )
+
+            result.archived += len(rows)
+            result.deleted += deleted
+            if str(path) not in result.files:
+                result.files.append(str(path))
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+            if len(rows) < self._chunk_size:
+                break
+            if should_stop():
+                result.interrupted = True
+                break
+            time.sleep(self._pause)
+
+    def _write_rollup(self, day: date, in_day) -> bool:
+        """해당 날짜의 집계가 없으면 남은 로그 전체로 계산해 저장합니다.
+
+        날짜 처리가 중간에 끊긴 경우 이미 저장된 (완전한) 집계를 유지합니다.
+        """
+        table = QueryLogDailyRollupModel.__table__
+        with self._engine.begin() as conn:
+            if conn.scalar(select(table.c.day).where(table.c.day == day)) is not None:
+                return False
+
+            counts = dict(
+                conn.execute(
+                    select(QueryLogModel.status, func.count()).where(in_day).group_by(QueryLogModel.status)
+                ).all()
+            )
+            count = func.count().label("count")
+            top = conn.execute(
+                select(QueryLogModel.user_query, count)
+                .where(in_day)
+                .group_by(QueryLogModel.user_query)
+                .order_by(count.desc(), QueryLogModel.user_query)
+                .limit(self._top_questions)
+            ).all()
+
+            conn.execute(
+                table.insert().values(
+                    day=day,
+                    total=sum(counts.values()),
+                    **{s.value: counts.get(s.value, 0) for s in QueryLogStatus},
+                    top_questions=json.dumps(
+                        [{"question": q, "count": c} for q, c in top], ensure_ascii=False
+                    ),
+                    archived_rows=0,
+                )
+            )
+        return True
+
+    @staticmethod
+    def _append(path: Path, rows: list[dict]) -> None:
+        """청크를 gzip 멤버 하나로 덧붙이고 디스크에 반영될 때까지 기다립니다."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+                for row in rows:
+                    line = json.dumps(
+                        {**row, "created_at": row["created_at"].isoformat()}, ensure_ascii=False
+                    )
+                    gz.write(line.encode("utf-8") + b"\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def _maintain(self, result: RetentionResult) -> None:
+        """삭제로 생긴 빈 페이지를 조금씩 반환하고 WAL을 체크포인트합니다 (SQLite 전용)."""
+        if self._engine.dialect.name != "sqlite":
+            return
+
+        try:
+            with self._engine.connect() as conn:
+                if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:  # INCREMENTAL
+                    before = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                    pages = self._vacuum_pages or before
+                    # sqlite3의 execute는 한 단계(한 페이지)만 실행하므로 executescript로 끝까지 실행
+                    conn.connection.driver_connection.executescript(
+                        f"PRAGMA incremental_vacuum({int(pages)})"
+                    )
+                    result.freed_pages = before - conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                else:
+                    print(
+                        "[QueryLog] auto_vacuum is not INCREMENTAL; "
+                        "run the retention CLI once with --full-vacuum to reclaim space"
+                    )
+
+                # PASSIVE: 읽기/쓰기를 막지 않고 가능한 만큼만 체크포인트
+                busy, log, checkpointed = conn.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)").one()
+                result.checkpoint = {"busy": busy, "log_pages": log, "checkpointed_pages": checkpointed}
+                conn.commit()
+        except Exception as e:
+            print(f"[QueryLog] SQLite maintenance failed: {e}")
+
+
+def full_vacuum(engine: Engine) -> None:
+    """auto_vacuum을 INCREMENTAL로 전환하고 전체 VACUUM을 실행합니다 (DB 전체 잠금)."""
+    if engine.dialect.name != "sqlite":
+        raise ValueError("full_vacuum is only supported for SQLite")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+
+
+def get_daily_rollups(conn: Connection, day_from: date, day_to: date) -> list[dict]:
+    """``day_from`` 이상 ``day_to`` 이하 날짜의 일별 집계를 반환합니다."""
+    table = QueryLogDailyRollupModel.__table__
+    rows = conn.execute(
+        select(table).where(table.c.day >= day_from, table.c.day <= day_to).order_by(table.c.day)
+    ).mappings()
+    return [
+        {
+            **{k: v for k, v in row.items() if k != "top_questions"},
+            "top_questions": json.loads(row["top_questions"] or "[]"),
+        }
+        for row in rows
+    ]
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day)
+
+
+class RetentionScheduler:
+    """보존 정책을 ``interval_hours``마다 백그라운드 스레드에서 실행합니다."""
+
+    def __init__(self, retention: QueryLogRetention, interval_hours: float | None = None):
+        self._retention = retention
+        self._interval = (
+            interval_hours if interval_hours is not None else settings.query_log_retention_interval_hours
+        ) * 3600
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_result: Optional[RetentionResult] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="query-log-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """진행 중인 실행은 현재 청크를 마친 뒤 중단됩니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def last_result(self) -> Optional[RetentionResult]:
+        return self._last_result
+
+    def _run(self) -> None:
+        # 기동 직후 워밍업과 겹치지 않도록 한 주기 뒤부터 실행
+        while not self._stop.wait(self._interval):
+            try:
+                self._last_result = self._retention.run(should_stop=self._stop.is_set)
+                result = self._last_result
+                print(
+                    f"[QueryLog] Retention archived {result.archived} logs "
+                    f"from {len(result.days)} days in {result.duration_seconds:.1f}s"
+                )
+            except Exception as e:
+                print(f"[QueryLog] Retention run failed: {e}")
+
+
+_scheduler: Optional[RetentionScheduler] = None
+
+
+def start_retention_scheduler() -> Optional[RetentionScheduler]:
+    """설정이 켜져 있으면 보존 정책 스케줄러를 시작합니다."""
+    global _scheduler
+    if not settings.query_log_retention_enabled:
+        return None
+    if _scheduler is None:
+        _scheduler = RetentionScheduler(QueryLogRetention(get_engine()))
+        _scheduler.start()
+        register_shutdown_hook(_scheduler.stop)
+    return _scheduler
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Archive old query logs and write daily rollups.")
+    parser.add_argument("--days", type=int, help="retention in days (default: QUERY_LOG_RETENTION_DAYS)")
+    parser.add_argument("--archive-dir", help="archive directory (default: QUERY_LOG_ARCHIVE_DIR)")
+    parser.add_argument("--chunk-size", type=int, help="rows per archive chunk")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be archived")
+    parser.add_argument(
+        "--full-vacuum",
+        action="store_true",
+        help="switch SQLite to incremental auto_vacuum and VACUUM once (locks the database)",
+    )
+    args = parser.parse_args(argv)
+
+    from agent.infrastructure.database.connection import init_db
+
+    init_db()
+    retention = QueryLogRetention(
+        get_engine(),
+        retention_days=args.days,
+        archive_dir=args.archive_dir,
+        chunk_size=args.chunk_size,
+    )
+    result = retention.run(dry_run=args.dry_run)
+    print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
+
+    if args.full_vacuum and not args.dry_run:
+        full_vacuum(get_engine())
+        print("[QueryLog] VACUUM finished")
+
+
+if __name__ == "__main__":
+    main()
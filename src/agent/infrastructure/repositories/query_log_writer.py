@@ -0,0 +1,311 @@
+"""Write-behind buffer for QueryLog persistence."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.engine import Engine
+
+from agent.config import settings
+from agent.domain.entities.query_log import QueryLog
+from agent.infrastructure.database.connection import get_engine, register_shutdown_hook
+from agent.infrastructure.database.models import QueryLogModel
+
+# 마지막 상태로 덮어쓰는 컬럼 (id/user_query/created_at은 최초 값 유지)
+_MUTABLE_COLUMNS = ("generated_sql", "status", "error_message", "execution_time_ms", "row_count")
+_MAX_ATTEMPTS = 3
+
+
+def _to_row(query_log: QueryLog) -> dict:
+    return {
+        "id": str(query_log.id),
+        "user_query": query_log.user_query,
+        "generated_sql": query_log.generated_sql,
+        "status": query_log.status.value,
+        "error_message": query_log.error_message,
+        "created_at": query_log.created_at,
+        "execution_time_ms": query_log.execution_time_ms,
+        "row_count": query_log.row_count,
+    }
+
+
+class QueryLogWriter:
+    """QueryLog를 모아 주기적으로 일괄 저장하는 write-behind 버퍼.
+
+    요청 경로에서는 엔티티를 버퍼에 넣기만 하고, 백그라운드 스레드가
+    ``flush_interval_ms``마다 또는 ``flush_batch_size``개가 쌓이면 한 번의
+    executemany upsert로 저장합니다. 같은 id의 로그는 버퍼 안에서 마지막 상태로
+    합쳐지므로, 플러시 구간 안에 끝난 생성(PROCESSING → COMPLETED)은 INSERT 한 번으로
+    기록됩니다.
+
+    버퍼는 ``max_pending``개로 제한되며, 가득 차면 호출자는 플러시로 자리가 날 때까지
+    기다립니다(backpressure). ``enqueue_timeout_seconds`` 안에 자리가 나지 않으면
+    해당 로그는 호출자 스레드에서 직접 저장합니다.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        flush_interval_ms: float | None = None,
+        flush_batch_size: int | None = None,
+        max_pending: int | None = None,
+        enqueue_timeout_seconds: float | None = None,
+    ):
+        self._engine = engine
+        self._interval = (
+            flush_interval_ms if flush_interval_ms is not None else settings.query_log_flush_interval_ms
+        ) / 1000
+        self._batch_size = flush_batch_size or settings.query_log_flush_batch_size
+        self._max_pending = max_pending or settings.query_log_max_pending
+        self._enqueue_timeout = (
+            enqueue_timeout_seconds
+            if enqueue_timeout_seconds is not None
+            else settings.query_log_enqueue_timeout_seconds
+        )
+
+        self._pending: OrderedDict[str, dict] = OrderedDict()
+        self._attempts: dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._enqueued = 0
+        self._collapsed = 0
+        self._written = 0
+        self._flushes = 0
+        self._backpressure_waits = 0
+        self._direct_writes = 0
+        self._dropped = 0
+
+    def start(self) -> None:
+        """플러시 스레드를 시작합니다."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="query-log-writer", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """남은 로그를 모두 저장하고 플러시 스레드를 종료합니다."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _offer(self, row: dict) -> bool:
+        """버퍼에 자리가 있으면 추가합니다. (락 보유 상태에서 호출)"""
+        key = row["id"]
+        if key in self._pending:
+            self._pending[key].update({c: row[c] for c in _MUTABLE_COLUMNS})
+            self._collapsed += 1
+        elif len(self._pending) >= self._max_pending:
+            return False
+        else:
+            self._pending[key] = row
+        self._enqueued += 1
+        if len(self._pending) >= self._batch_size:
+            self._cond.notify_all()
+        return True
+
+    def submit(self, query_log: QueryLog) -> QueryLog:
+        """로그를 버퍼에 넣습니다. 버퍼가 가득 차면 자리가 날 때까지 기다립니다."""
+        row = _to_row(query_log)
+        with self._cond:
+            if not self._stopping:
+                if self._offer(row):
+                    return query_log
+
+                self._backpressure_waits += 1
+                self._cond.notify_all()
+                deadline = time.monotonic() + self._enqueue_timeout
+                while (remaining := deadline - time.monotonic()) > 0:
+                    self._cond.wait(remaining)
+                    if self._offer(row):
+                        return query_log
+
+            # 종료 이후이거나 제한 시간 안에 자리가 나지 않음: 직접 저장
+            self._direct_writes += 1
+
+        self._write_direct(row)
+        return query_log
+
+    def _write_direct(self, row: dict) -> None:
+        # 진행 중인 플러시보다 먼저 커밋되어 최신 상태가 덮어써지지 않도록 직렬화
+        with self._flush_lock:
+            self._write([row])
+
+    async def asubmit(self, query_log: QueryLog) -> QueryLog:
+        """이벤트 루프용 ``submit``. 버퍼가 가득 찬 경우에만 워커 스레드에서 대기합니다."""
+        with self._cond:
+            if not self._stopping and self._offer(_to_row(query_log)):
+                return query_log
+        return await asyncio.to_thread(self.submit, query_log)
+
+    def submit_all(self, query_logs: list[QueryLog]) -> list[QueryLog]:
+        for query_log in query_logs:
+            self.submit(query_log)
+        return query_logs
+
+    def pending(self, id: str) -> Optional[dict]:
+        """아직 저장되지 않은 로그의 최신 상태를 반환합니다."""
+        with self._cond:
+            row = self._pending.get(id)
+            return dict(row) if row is not None else None
+
+    def pending_rows(self) -> list[dict]:
+        with self._cond:
+            return [dict(row) for row in self._pending.values()]
+
+    def discard(self, id: str) -> bool:
+        """저장 전인 로그를 버퍼에서 제거합니다."""
+        with self._cond:
+            self._attempts.pop(id, None)
+            return self._pending.pop(id, None) is not None
+
+    def flush(self) -> int:
+        """버퍼의 로그를 즉시 저장합니다.
+
+        Returns:
+            저장된 로그 수
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._cond:
+                    if not self._pending:
+                        return written
+                    batch = []
+                    while self._pending and len(batch) < self._batch_size:
+                        batch.append(self._pending.popitem(last=False)[1])
+                    self._cond.notify_all()  # backpressure 대기자 깨우기
+
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    print(f"[QueryLog] Flush of {len(batch)} logs failed: {e}")
+                    self._requeue(batch)
+                    return written
+
+                written += len(batch)
+                with self._cond:
+                    for row in batch:
+                        self._attempts.pop(row["id"], None)
+                    self._flushes += 1
+
+    def _requeue(self, batch: list[dict]) -> None:
+        """실패한 배치를 다시 버퍼 앞쪽에 넣습니다 (그 사이 들어온 최신 상태 우선)."""
+        with self._cond:
+            restored: OrderedDict[str, dict] = OrderedDict()
+            for row in batch:
+                key = row["id"]
+                attempts = self._attempts.get(key, 0) + 1
+                if attempts >= _MAX_ATTEMPTS:
+                    self._attempts.pop(key, None)
+                    self._dropped += 1
+                    print(f"[QueryLog] Dropping log {key} after {attempts} failed writes")
+                    continue
+                self._attempts[key] = attempts
+                newer = self._pending.pop(key, None)
+                restored[key] = {**row, **{c: newer[c] for c in _MUTABLE_COLUMNS}} if newer else row
+            restored.update(self._pending)
+            self._pending = restored
+
+    def _write(self, rows: list[dict]) -> None:
+        """행들을 한 번의 executemany upsert로 저장합니다."""
+        with self._engine.begin() as conn:
+            upsert = self._upsert_statement()
+            if upsert is not None:
+                conn.execute(upsert, rows)
+            else:
+                self._write_without_upsert(conn, rows)
+        with self._cond:
+            self._written += len(rows)
+
+    @staticmethod
+    def _write_without_upsert(conn, rows: list[dict]) -> None:
+        """ON CONFLICT를 지원하지 않는 방언: 기존 id는 UPDATE, 나머지는 INSERT (각각 executemany)."""
+        ids = [row["id"] for row in rows]
+        existing = set(conn.scalars(select(QueryLogModel.id).where(QueryLogModel.id.in_(ids))))
+
+        new_rows = [row for row in rows if row["id"] not in existing]
+        if new_rows:
+            conn.execute(insert(QueryLogModel), new_rows)
+
+        updates = [
+            {"b_id": row["id"], **{c: row[c] for c in _MUTABLE_COLUMNS}}
+            for row in rows
+            if row["id"] in existing
+        ]
+        if updates:
+            conn.execute(
+                update(QueryLogModel)
+                .where(QueryLogModel.id == bindparam("b_id"))
+                .values({c: bindparam(c) for c in _MUTABLE_COLUMNS}),
+                updates,
+            )
+
+    def _upsert_statement(self):
+        dialect = self._engine.dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            return None
+
+        stmt = dialect_insert(QueryLogModel)
+        return stmt.on_conflict_do_update(
+            index_elements=[QueryLogModel.id],
+            set_={c: stmt.excluded[c] for c in _MUTABLE_COLUMNS},
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._pending) < self._batch_size:
+                    self._cond.wait(self._interval)
+                if self._stopping:
+                    return
+            self.flush()
+
+    def stats(self) -> dict:
+        """버퍼 상태와 누적 통계를 반환합니다."""
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "max_pending": self._max_pending,
+                "enqueued": self._enqueued,
+                "collapsed": self._collapsed,
+                "written": self._written,
+                "flushes": self._flushes,
+                "backpressure_waits": self._backpressure_waits,
+                "direct_writes": self._direct_writes,
+                "dropped": self._dropped,
+            }
+
+
+_query_log_writer: Optional[QueryLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_query_log_writer() -> Optional[QueryLogWriter]:
+    """프로세스 전역 QueryLog writer를 반환합니다. 비활성화된 경우 None."""
+    global _query_log_writer
+    if not settings.query_log_write_behind:
+        return None
+    if _query_log_writer is None:
+        with _writer_lock:
+            if _query_log_writer is None:
+                writer = QueryLogWriter(get_engine())
+                writer.start()
+                register_shutdown_hook(writer.close)
+                _query_log_writer = writer
+    return _query_log_writer
@@ -1,58 +1,119 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from agent.domain.entities.query_log import QueryLog, QueryLogStatus
-from agent.domain.repositories.query_log_repository import QueryLogRepository
+from agent.domain.repositories.query_log_repository import QueryLogKey, QueryLogRepository
 from agent.infrastructure.database.models import QueryLogModel
+from agent.infrastructure.repositories.query_log_writer import QueryLogWriter, get_query_log_writer
 
 
 class SQLAlchemyQueryLogRepository(QueryLogRepository):
-    """QueryLogRepository의 SQLAlchemy 구현체."""
+    """QueryLogRepository의 SQLAlchemy 구현체.
 
-    def __init__(self, session: Session):
+    ``writer``가 주어지면 저장은 write-behind 버퍼로 위임되고, 조회는 아직 플러시되지
+    않은 로그의 최신 상태를 우선합니다.
+    """
+
+    def __init__(self, session: Session, writer: Optional[QueryLogWriter] = None):
         self._session = session
+        self._writer = writer
 
     def save(self, query_log: QueryLog) -> QueryLog:
-        model = QueryLogModel(
-            id=str(query_log.id),
-            user_query=query_log.user_query,
-            generated_sql=query_log.generated_sql,
-            status=query_log.status.value,
-            error_message=query_log.error_message,
-            created_at=query_log.created_at,
-        )
+        if self._writer is not None:
+            return self._writer.submit(query_log)
+
+        model = self._entity_to_model(query_log)
 
         existing = self._session.query(QueryLogModel).filter_by(id=str(query_log.id)).first()
         if existing:
             existing.generated_sql = model.generated_sql
             existing.status = model.status
             existing.error_message = model.error_message
+            existing.execution_time_ms = model.execution_time_ms
+            existing.row_count = model.row_count
         else:
             self._session.add(model)
 
         self._session.commit()
         return query_log
 
+    async def asave(self, query_log: QueryLog) -> QueryLog:
+        if self._writer is not None:
+            return await self._writer.asubmit(query_log)
+        return await super().asave(query_log)
+
+    def save_all(self, query_logs: list[QueryLog]) -> list[QueryLog]:
+        """새 QueryLog들을 하나의 트랜잭션으로 저장합니다."""
+        if self._writer is not None:
+            return self._writer.submit_all(query_logs)
+        self._session.add_all([self._entity_to_model(q) for q in query_logs])
+        self._session.commit()
+        return query_logs
+
     def find_by_id(self, id: UUID) -> Optional[QueryLog]:
+        if self._writer is not None:
+            pending = self._writer.pending(str(id))
+            if pending is not None:
+                return self._model_to_entity(QueryLogModel(**pending))
+
         model = self._session.query(QueryLogModel).filter_by(id=str(id)).first()
         if not model:
             return None
         return self._model_to_entity(model)
 
-    def find_all(self) -> list[QueryLog]:
-        models = self._session.query(QueryLogModel).all()
-        return [self._model_to_entity(m) for m in models]
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[QueryLogKey] = None,
+        status: Optional[QueryLogStatus] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> list[QueryLog]:
+        """``(created_at, id)`` 키셋 조회. 복합 인덱스로 페이지 크기만큼만 읽습니다.
+
+        write-behind 버퍼에서 아직 플러시되지 않은 로그는 포함되지 않습니다.
+        """
+        stmt = select(QueryLogModel)
+        if status is not None:
+            stmt = stmt.where(QueryLogModel.status == status.value)
+        if created_from is not None:
+            stmt = stmt.where(QueryLogModel.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(QueryLogModel.created_at < created_to)
+        if after is not None:
+            after_created_at, after_id = after
+            stmt = stmt.where(
+                tuple_(QueryLogModel.created_at, QueryLogModel.id) < (after_created_at, str(after_id))
+            )
+
+        stmt = stmt.order_by(QueryLogModel.created_at.desc(), QueryLogModel.id.desc()).limit(limit)
+        return [self._model_to_entity(m) for m in self._session.scalars(stmt)]
 
     def delete(self, id: UUID) -> bool:
+        discarded = self._writer.discard(str(id)) if self._writer is not None else False
         model = self._session.query(QueryLogModel).filter_by(id=str(id)).first()
         if not model:
-            return False
+            return discarded
         self._session.delete(model)
         self._session.commit()
         return True
 
+    def _entity_to_model(self, query_log: QueryLog) -> QueryLogModel:
+        return QueryLogModel(
+            id=str(query_log.id),
+            user_query=query_log.user_query,
+            generated_sql=query_log.generated_sql,
+            status=query_log.status.value,
+            error_message=query_log.error_message,
+            created_at=query_log.created_at,
+            execution_time_ms=query_log.execution_time_ms,
+            row_count=query_log.row_count,
+        )
+
     def _model_to_entity(self, model: QueryLogModel) -> QueryLog:
         return QueryLog(
             id=UUID(model.id),
@@ -61,5 +122,11 @@ class SQLAlchemyQueryLogRepository(QueryLogRepository):
             status=QueryLogStatus(model.status),
             error_message=model.error_message,
             created_at=model.created_at,
+            execution_time_ms=model.execution_time_ms,
+            row_count=model.row_count,
         )
 
+
+def get_query_log_repository(session: Session) -> SQLAlchemyQueryLogRepository:
+    """설정에 따라 write-behind 버퍼를 사용하는 리포지토리를 반환합니다."""
+    return SQLAlchemyQueryLogRepository(session, writer=get_query_log_writer())
@@ -0,0 +1,127 @@
+"""Dynamic micro-batching front-end for the embedding model."""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+from agent.config import settings
+
+
+class BatchingEmbedder:
+    """동시에 들어온 단건 임베딩 요청을 모아 한 번의 배치 인코딩으로 처리합니다.
+
+    전용 워커 스레드가 첫 요청을 받은 뒤 ``max_wait_ms`` 동안 또는 ``max_batch_size``
+    개가 찰 때까지 요청을 모아 ``embed_batch_fn``을 한 번 호출합니다. 직전 배치가
+    단건이었으면 기다리지 않고 이미 쌓인 요청만 모아, 저부하 시 지연을 늘리지 않습니다.
+
+    호출자는 ``Future``로 결과를 기다리므로, 이벤트 루프에서 ``aembed``를 사용하면
+    모델 추론 동안 루프가 막히지 않습니다.
+    """
+
+    def __init__(
+        self,
+        embed_batch_fn: Callable[[list[str]], list[list[float]]],
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ):
+        self._embed_batch = embed_batch_fn
+        self._max_batch_size = max_batch_size or settings.embedding_batch_max_size
+        self._max_wait = (
+            max_wait_ms if max_wait_ms is not None else settings.embedding_batch_max_wait_ms
+        ) / 1000
+        self._queue: queue.Queue[tuple[str, Future] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._max_seen = 0
+        self._last_batch_size = 0
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """임베딩 요청을 큐에 넣고 결과 Future를 반환합니다."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> list[float]:
+        """단일 텍스트를 임베딩합니다 (동기, 배치에 합류)."""
+        return self.submit(text).result()
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """여러 텍스트를 다른 요청과 함께 배치로 임베딩합니다."""
+        futures = [self.submit(text) for text in texts]
+        return [future.result() for future in futures]
+
+    async def aembed(self, text: str) -> list[float]:
+        """이벤트 루프를 막지 않고 단일 텍스트를 임베딩합니다."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def close(self) -> None:
+        """대기 중인 요청을 처리한 뒤 워커 스레드를 종료합니다."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self) -> list[tuple[str, Future]] | None:
+        first = self._queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        # 직전 배치가 단건이었다면 (동시 요청 없음) 기다리지 않고 바로 처리
+        wait = self._max_wait if self._last_batch_size > 1 else 0
+        deadline = time.monotonic() + wait
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # 종료 신호는 현재 배치를 처리한 뒤 반영
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            self._last_batch_size = len(batch)
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            # 같은 배치 안의 중복 텍스트는 한 번만 인코딩
+            unique = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                vectors = dict(zip(unique, self._embed_batch(unique)))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for text, future in batch:
+                future.set_result(vectors[text])
+
+            with self._lock:
+                self._batches += 1
+                self._items += len(batch)
+                self._max_seen = max(self._max_seen, len(batch))
+
+    def stats(self) -> dict:
+        """배치 처리 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "batches": self._batches,
+                "items": self._items,
+                "avg_batch_size": round(self._items / self._batches, 2) if self._batches else 0.0,
+                "max_batch_size": self._max_seen,
+                "queued": self._queue.qsize(),
+            }
@@ -1,6 +1,3 @@
-import chromadb
-from chromadb.config import Settings
-
 from agent.config import settings
 
 
@@ -9,6 +6,7 @@ class ChromaDBClient:
 
     _instance: "ChromaDBClient | None" = None
     COLLECTION_NAME = "schema_metadata"
+    COLUMN_COLLECTION_NAME = "schema_columns"
 
     def __new__(cls) -> "ChromaDBClient":
         if cls._instance is None:
@@ -21,7 +19,11 @@ class ChromaDBClient:
             return
 
         self._initialized = True
-        
+
+        # chromadb는 무거우므로 첫 클라이언트 생성 시점에 로드
+        import chromadb
+        from chromadb.config import Settings
+
         # Persistent storage path
         persist_dir = getattr(settings, 'chroma_persist_dir', './chroma_db')
         
@@ -30,11 +32,36 @@ class ChromaDBClient:
             settings=Settings(anonymized_telemetry=False)
         )
         
-        self._collection = self._client.get_or_create_collection(
+        self._collection = self._get_or_create_collection()
+        self._column_collection = self._get_or_create_column_collection()
+        # 문서 수는 변경 시에만 다시 계산 (매 검색마다 count() 호출 방지)
+        self._count: int | None = None
+        self._column_count: int | None = None
+
+    def _get_or_create_collection(self):
+        # 임베딩은 항상 EmbeddingService로 직접 계산해 전달하므로
+        # Chroma 기본 임베딩 모델은 로드하지 않음
+        return self._client.get_or_create_collection(
             name=self.COLLECTION_NAME,
-            metadata={"description": "Database schema metadata for RAG"}
+            metadata={"description": "Database schema metadata for RAG"},
+            embedding_function=None,
+        )
+
+    def _get_or_create_column_collection(self):
+        # 넓은 테이블용 컬럼 단위 문서 (id: "table.column", metadata.table_name으로 필터)
+        return self._client.get_or_create_collection(
+            name=self.COLUMN_COLLECTION_NAME,
+            metadata={"description": "Column-level schema metadata for wide tables"},
+            embedding_function=None,
         )
 
+    @staticmethod
+    def _embedder():
+        # sentence-transformers는 실제 임베딩이 필요할 때 로드
+        from agent.infrastructure.vectorstore.embedding_service import get_embedding_service
+
+        return get_embedding_service()
+
     @property
     def collection(self):
         """Get the schema metadata collection."""
@@ -44,9 +71,33 @@ class ChromaDBClient:
         """테이블 메타데이터를 벡터 저장소에 추가/업데이트."""
         self._collection.upsert(
             ids=[table_name],
+            embeddings=self._embedder().embed_batch([document]),
             documents=[document],
             metadatas=[metadata]
         )
+        self._count = None
+
+    def upsert_tables(
+        self,
+        table_names: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+        batch_size: int = 256,
+    ) -> None:
+        """여러 테이블 메타데이터를 배치 단위로 추가/업데이트.
+
+        배치마다 한 번의 ``upsert``(임베딩 포함)가 수행됩니다.
+        """
+        embedder = self._embedder()
+        for start in range(0, len(table_names), batch_size):
+            end = start + batch_size
+            self._collection.upsert(
+                ids=table_names[start:end],
+                embeddings=embedder.embed_batch(documents[start:end]),
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
+        self._count = None
 
     def delete_table(self, table_name: str) -> None:
         """테이블 메타데이터를 벡터 저장소에서 삭제."""
@@ -54,28 +105,185 @@ class ChromaDBClient:
             self._collection.delete(ids=[table_name])
         except Exception:
             pass  # Ignore if not exists
+        self._count = None
+
+    def delete_tables(self, table_names: list[str]) -> None:
+        """여러 테이블 메타데이터를 한 번에 삭제."""
+        if not table_names:
+            return
+        self._collection.delete(ids=list(table_names))
+        self._count = None
+
+    def get_fingerprints(self) -> dict[str, str | None]:
+        """저장된 테이블별 문서 fingerprint를 반환 (임베딩은 조회하지 않음).
+
+        fingerprint 없이 저장된 이전 버전의 문서는 None으로 반환됩니다.
+        """
+        result = self._collection.get(include=["metadatas"])
+        metadatas = result.get("metadatas") or [None] * len(result["ids"])
+        return {
+            table_id: (metadata or {}).get("fingerprint")
+            for table_id, metadata in zip(result["ids"], metadatas)
+        }
+
+    def count(self) -> int:
+        """저장된 테이블 문서 수 (캐시됨)."""
+        if self._count is None:
+            self._count = self._collection.count()
+        return self._count
 
     def search(self, query: str, top_k: int = 5) -> list[dict]:
         """쿼리와 유사한 테이블 메타데이터 검색."""
+        return self.search_many([query], top_k=top_k)[0]
+
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[list[dict]]:
+        """여러 쿼리를 한 번의 ``query()`` 호출로 검색합니다.
+
+        Returns:
+            입력 쿼리 순서와 같은 순서의 검색 결과 목록
+        """
+        if not queries:
+            return []
+
+        count = self.count()
+        if count == 0:
+            return [[] for _ in queries]
+
         results = self._collection.query(
-            query_texts=[query],
-            n_results=min(top_k, self._collection.count() or 1)
+            query_embeddings=self._embedder().embed_queries(queries),
+            n_results=min(top_k, count)
         )
-        
-        if not results["ids"] or not results["ids"][0]:
+
+        return [self._to_tables(results, i) for i in range(len(queries))]
+
+    def search_many_with_columns(
+        self, queries: list[str], top_k: int = 5, column_top_k: int = 40
+    ) -> list[tuple[list[dict], list[dict]]]:
+        """테이블과 컬럼 컬렉션을 같은 질의 임베딩으로 검색합니다.
+
+        Returns:
+            입력 쿼리 순서와 같은 순서의 (테이블 목록, 컬럼 목록). 컬럼은 거리순이며
+            ``table_name``, ``column_name``, ``metadata``, ``distance``를 가집니다.
+        """
+        if not queries:
             return []
-        
+
+        count = self.count()
+        if count == 0:
+            return [([], []) for _ in queries]
+
+        embeddings = self._embedder().embed_queries(queries)
+        tables = self._collection.query(query_embeddings=embeddings, n_results=min(top_k, count))
+
+        column_count = self.column_count()
+        columns = None
+        if column_count and column_top_k > 0:
+            columns = self._column_collection.query(
+                query_embeddings=embeddings,
+                n_results=min(column_top_k, column_count),
+                include=["metadatas", "distances"],
+            )
+
+        return [
+            (self._to_tables(tables, i), self._to_columns(columns, i) if columns else [])
+            for i in range(len(queries))
+        ]
+
+    @staticmethod
+    def _to_columns(results: dict, index: int) -> list[dict]:
+        if not results["ids"] or len(results["ids"]) <= index:
+            return []
+        columns = []
+        for i, _ in enumerate(results["ids"][index]):
+            metadata = results["metadatas"][index][i] or {}
+            columns.append({
+                "table_name": metadata.get("table_name"),
+                "column_name": metadata.get("column_name"),
+                "metadata": metadata,
+                "distance": results["distances"][index][i] if results.get("distances") else 0,
+            })
+        return columns
+
+    def get_tables(self, table_names: list[str]) -> list[dict]:
+        """저장된 테이블 문서를 이름으로 조회합니다 (없는 테이블은 제외)."""
+        if not table_names:
+            return []
+        result = self._collection.get(ids=list(table_names), include=["documents", "metadatas"])
+        return [
+            {"table_name": table_id, "document": document, "metadata": metadata or {}}
+            for table_id, document, metadata in zip(
+                result["ids"], result["documents"], result["metadatas"]
+            )
+        ]
+
+    @staticmethod
+    def _to_tables(results: dict, index: int) -> list[dict]:
+        """``query()`` 결과에서 index번째 쿼리의 테이블 목록을 추출합니다."""
+        if not results["ids"] or len(results["ids"]) <= index or not results["ids"][index]:
+            return []
+
         tables = []
-        for i, table_id in enumerate(results["ids"][0]):
+        for i, table_id in enumerate(results["ids"][index]):
             tables.append({
                 "table_name": table_id,
-                "document": results["documents"][0][i] if results["documents"] else "",
-                "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                "distance": results["distances"][0][i] if results.get("distances") else 0
+                "document": results["documents"][index][i] if results["documents"] else "",
+                "metadata": results["metadatas"][index][i] if results["metadatas"] else {},
+                "distance": results["distances"][index][i] if results.get("distances") else 0
             })
-        
+
         return tables
 
+    def upsert_columns(
+        self,
+        column_ids: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+        batch_size: int = 256,
+    ) -> None:
+        """컬럼 문서를 배치 단위로 추가/업데이트."""
+        embedder = self._embedder()
+        for start in range(0, len(column_ids), batch_size):
+            end = start + batch_size
+            self._column_collection.upsert(
+                ids=column_ids[start:end],
+                embeddings=embedder.embed_batch(documents[start:end]),
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
+        self._column_count = None
+
+    def delete_columns(self, column_ids: list[str]) -> None:
+        """컬럼 문서를 id로 삭제."""
+        if not column_ids:
+            return
+        self._column_collection.delete(ids=list(column_ids))
+        self._column_count = None
+
+    def delete_table_columns(self, table_names: list[str]) -> None:
+        """테이블들의 컬럼 문서를 모두 삭제."""
+        if not table_names:
+            return
+        self._column_collection.delete(where={"table_name": {"$in": list(table_names)}})
+        self._column_count = None
+
+    def get_column_fingerprints(self, table_names: list[str] | None = None) -> dict[str, str | None]:
+        """저장된 컬럼별 fingerprint를 반환합니다. ``table_names``가 있으면 해당 테이블만."""
+        if table_names is not None and not table_names:
+            return {}
+        where = {"table_name": {"$in": list(table_names)}} if table_names is not None else None
+        result = self._column_collection.get(where=where, include=["metadatas"])
+        metadatas = result.get("metadatas") or [None] * len(result["ids"])
+        return {
+            column_id: (metadata or {}).get("fingerprint")
+            for column_id, metadata in zip(result["ids"], metadatas)
+        }
+
+    def column_count(self) -> int:
+        """저장된 컬럼 문서 수 (캐시됨)."""
+        if self._column_count is None:
+            self._column_count = self._column_collection.count()
+        return self._column_count
+
     def get_all_tables(self) -> list[str]:
         """저장된 모든 테이블 이름 반환."""
         result = self._collection.get()
@@ -84,10 +292,11 @@ class ChromaDBClient:
     def clear(self) -> None:
         """컬렉션 초기화."""
         self._client.delete_collection(self.COLLECTION_NAME)
-        self._collection = self._client.get_or_create_collection(
-            name=self.COLLECTION_NAME,
-            metadata={"description": "Database schema metadata for RAG"}
-        )
+        self._client.delete_collection(self.COLUMN_COLLECTION_NAME)
+        self._collection = self._get_or_create_collection()
+        self._column_collection = self._get_or_create_column_collection()
+        self._count = None
+        self._column_count = None
 
 
 def get_chroma_client() -> ChromaDBClient:
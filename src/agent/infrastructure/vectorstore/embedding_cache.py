@@ -0,0 +1,70 @@
+"""Bounded LRU cache of query embeddings."""
+
+import threading
+from collections import OrderedDict
+
+from agent.config import settings
+from agent.shared.text import normalize_query
+
+
+class QueryEmbeddingCache:
+    """정규화된 질의 텍스트 → 임베딩 벡터 LRU 캐시.
+
+    모델을 로드하지 않고도 통계를 조회할 수 있도록 ``EmbeddingService``와 분리되어
+    있습니다.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self._max_size = max_size or settings.query_embedding_cache_size
+        self._entries: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(text: str) -> str:
+        return normalize_query(text)
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(vector)
+
+    def put(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._entries[key] = tuple(vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            }
+
+
+_query_embedding_cache: QueryEmbeddingCache | None = None
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """프로세스 전역 질의 임베딩 캐시를 반환합니다."""
+    global _query_embedding_cache
+    if _query_embedding_cache is None:
+        _query_embedding_cache = QueryEmbeddingCache()
+    return _query_embedding_cache
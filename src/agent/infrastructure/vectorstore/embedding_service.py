@@ -1,36 +1,118 @@
 """Embedding service for text vectorization."""
 
-from sentence_transformers import SentenceTransformer
+import asyncio
 from typing import Optional
 
+from agent.config import settings
+from agent.infrastructure.vectorstore.batching_embedder import BatchingEmbedder
+from agent.infrastructure.vectorstore.embedding_cache import (
+    QueryEmbeddingCache,
+    get_query_embedding_cache,
+)
+
 
 class EmbeddingService:
-    """텍스트 임베딩 서비스 - sentence-transformers 기반."""
+    """텍스트 임베딩 서비스 - sentence-transformers 기반.
+
+    프로세스당 하나의 모델만 메모리에 올리며, 벡터 저장소의 문서/질의 임베딩도
+    모두 이 서비스를 사용합니다.
+    """
 
     _instance: "EmbeddingService | None" = None
     DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
-    def __new__(cls) -> "EmbeddingService":
+    def __new__(cls, *args, **kwargs) -> "EmbeddingService":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, query_cache: Optional[QueryEmbeddingCache] = None):
         if self._initialized:
             return
 
         self._initialized = True
-        self._model = SentenceTransformer(model_name or self.DEFAULT_MODEL)
+        self._model_name = model_name or settings.embedding_model or self.DEFAULT_MODEL
+        # sentence-transformers(torch)는 서비스 생성 시점에 로드
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(self._model_name)
+        self._query_cache = query_cache or get_query_embedding_cache()
+        # 동시 단건 요청은 워커 스레드에서 마이크로 배치로 인코딩
+        self._batcher = (
+            BatchingEmbedder(self.embed_batch) if settings.embedding_batching_enabled else None
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def batcher(self) -> Optional[BatchingEmbedder]:
+        return self._batcher
+
+    def warmup(self) -> None:
+        """모델 가중치를 메모리에 올리고 첫 추론 비용을 미리 치릅니다."""
+        self._model.encode(["warmup"])
 
     def embed(self, text: str) -> list[float]:
         """단일 텍스트를 임베딩 벡터로 변환."""
+        if self._batcher is not None:
+            return self._batcher.embed(text)
         return self._model.encode(text).tolist()
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """여러 텍스트를 임베딩 벡터로 변환."""
         return self._model.encode(texts).tolist()
 
+    def embed_query(self, text: str) -> list[float]:
+        """사용자 질의를 임베딩합니다 (정규화된 텍스트 기준 LRU 캐시)."""
+        key = self._query_cache.key(text)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        vector = self.embed(key)
+        self._query_cache.put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """이벤트 루프를 막지 않는 ``embed_query``."""
+        key = self._query_cache.key(text)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if self._batcher is not None:
+            vector = await self._batcher.aembed(key)
+        else:
+            vector = await asyncio.to_thread(self.embed, key)
+        self._query_cache.put(key, vector)
+        return vector
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """여러 질의를 임베딩합니다. 캐시에 없는 질의만 한 번에 인코딩합니다."""
+        keys = [self._query_cache.key(t) for t in texts]
+        vectors: dict[str, list[float]] = {}
+        misses = []
+        for key in keys:
+            if key in vectors or key in misses:
+                continue
+            cached = self._query_cache.get(key)
+            if cached is None:
+                misses.append(key)
+            else:
+                vectors[key] = cached
+
+        if misses:
+            # 미스는 동시에 들어온 다른 요청과 같은 배치로 인코딩
+            encode = self._batcher.embed_many if self._batcher is not None else self.embed_batch
+            for key, vector in zip(misses, encode(misses)):
+                self._query_cache.put(key, vector)
+                vectors[key] = vector
+
+        return [vectors[key] for key in keys]
+
 
 def get_embedding_service() -> EmbeddingService:
     return EmbeddingService()
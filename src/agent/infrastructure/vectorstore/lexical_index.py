@@ -0,0 +1,225 @@
+"""In-memory BM25 index over table and column identifiers."""
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from agent.config import settings
+from agent.shared.text import identifier_terms, stem_term
+
+_K1 = 1.2
+# 넓은 테이블이 길이 보정으로 지나치게 밀리지 않도록 일반 문서(0.75)보다 낮게
+_B = 0.4
+_TABLE_WEIGHT = 3  # 테이블 이름 단어는 컬럼 단어보다 3배
+# 이 점수 비율 미만의 후보는 반환하지 않음 (공통 단어 "id"로만 걸린 테이블 등)
+_MIN_RELATIVE_SCORE = 0.2
+
+_WORD_RE = re.compile(r"\w+")
+_STOP_WORDS = frozenset(
+    """a an the of by for in on at to from with without and or not per each every all any
+    is are was were be been do does did has have had what which who whom whose when where how
+    many much show list get find give return me my our their there this that these those than
+    top most least more less""".split()
+)
+
+
+@dataclass
+class LexicalEntry:
+    """인덱스에 저장된 테이블 문서 (임베딩 없이 검색 결과를 만들 때 사용)."""
+
+    table_name: str
+    document: str
+    metadata: dict
+    column_fragments: dict[str, str]
+    column_terms: dict[str, frozenset[str]]
+
+
+@dataclass
+class LexicalHit:
+    table_name: str
+    score: float
+    matched_columns: list[str] = field(default_factory=list)
+    exact: bool = False  # 질문에 테이블 이름이 그대로 나옴
+
+
+@dataclass
+class LexicalResult:
+    hits: list[LexicalHit]
+    coverage: float  # 질문 단어 중 스키마 식별자에 있는 단어 비율
+    confident: bool  # 벡터 검색 없이 이 결과만 사용해도 되는지
+
+
+def _identifier_token(name: str) -> str:
+    """식별자 전체를 하나의 토큰으로 (``order_items`` → ``order_item``)."""
+    return stem_term(name.lower())
+
+
+class SchemaLexicalIndex:
+    """테이블/컬럼 식별자 단어의 역색인과 BM25 점수.
+
+    식별자는 snake_case/camelCase로 나눈 단어와 식별자 전체를 모두 색인하므로
+    "customer id"와 "customer_id" 모두 맞습니다. 질문의 (불용어 제외) 단어가
+    ``skip_coverage`` 이상 스키마에 있고 상위 결과에 테이블 이름이 그대로 나오면
+    ``confident``로 표시되어 호출자가 임베딩/벡터 검색을 생략할 수 있습니다.
+    """
+
+    def __init__(self, skip_coverage: float | None = None):
+        self._skip_coverage = (
+            skip_coverage if skip_coverage is not None else settings.lexical_skip_coverage
+        )
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter] = {}
+        self._lengths: dict[str, int] = {}
+        self._entries: dict[str, LexicalEntry] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+        self._searches = 0
+        self._confident = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _table_terms(table_info) -> tuple[Counter, dict[str, frozenset[str]]]:
+        terms: Counter = Counter()
+        name_terms = set(identifier_terms(table_info.name)) | {_identifier_token(table_info.name)}
+        for term in name_terms:
+            terms[term] += _TABLE_WEIGHT
+
+        column_terms = {}
+        for column in table_info.columns:
+            words = set(identifier_terms(column.name)) | {_identifier_token(column.name)}
+            if column.comment:
+                words |= set(identifier_terms(column.comment))
+            column_terms[column.name] = frozenset(words)
+            terms.update(words)
+        return terms, column_terms
+
+    def upsert(self, table_info, document: str, metadata: dict, column_fragments: dict[str, str]) -> None:
+        """테이블 문서를 추가/교체합니다."""
+        terms, column_terms = self._table_terms(table_info)
+        entry = LexicalEntry(table_info.name, document, metadata, column_fragments, column_terms)
+        with self._lock:
+            self._remove_locked(table_info.name)
+            self._doc_terms[table_info.name] = terms
+            self._entries[table_info.name] = entry
+            self._lengths[table_info.name] = sum(terms.values())
+            self._total_length += self._lengths[table_info.name]
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[table_info.name] = tf
+
+    def remove(self, table_name: str) -> None:
+        with self._lock:
+            self._remove_locked(table_name)
+
+    def _remove_locked(self, table_name: str) -> None:
+        terms = self._doc_terms.pop(table_name, None)
+        if terms is None:
+            return
+        self._entries.pop(table_name, None)
+        self._total_length -= self._lengths.pop(table_name)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(table_name, None)
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._lengths.clear()
+            self._entries.clear()
+            self._total_length = 0
+
+    def entry(self, table_name: str) -> Optional[LexicalEntry]:
+        return self._entries.get(table_name)
+
+    def table_names(self) -> list[str]:
+        return list(self._entries)
+
+    @staticmethod
+    def _query_terms(query: str) -> list[str]:
+        words = [w for w in identifier_terms(query) if w not in _STOP_WORDS]
+        # 밑줄/대소문자가 섞인 식별자는 전체 토큰도 추가 ("customer_id", "orderItems")
+        words += [
+            _identifier_token(w)
+            for w in _WORD_RE.findall(query)
+            if "_" in w.strip("_") or (not w.islower() and not w.isupper() and not w.istitle())
+        ]
+        return list(dict.fromkeys(words))
+
+    def search(self, query: str, top_k: int = 5) -> LexicalResult:
+        """질문과 식별자가 겹치는 테이블을 BM25 점수순으로 반환합니다."""
+        terms = self._query_terms(query)
+        with self._lock:
+            self._searches += 1
+            total = len(self._doc_terms)
+            if not terms or total == 0:
+                return LexicalResult([], 0.0, False)
+
+            known = [t for t in terms if t in self._postings]
+            # 절반 넘는 테이블에 있는 단어("id" 등)는 더 드문 단어가 있으면 점수 계산에서 제외
+            scored = [t for t in known if len(self._postings[t]) <= total / 2] or known
+            average_length = self._total_length / total
+            scores: dict[str, float] = {}
+            for term in scored:
+                postings = self._postings[term]
+                df = len(postings)
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                for table_name, tf in postings.items():
+                    norm = _K1 * (1 - _B + _B * self._lengths[table_name] / average_length)
+                    scores[table_name] = scores.get(table_name, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            query_terms, scored_terms = set(terms), set(scored)
+            hits = []
+            for table_name, score in best:
+                exact = _identifier_token(table_name) in query_terms
+                # 질문에 이름이 그대로 나온 테이블은 점수가 낮아도 남김
+                if score < best[0][1] * _MIN_RELATIVE_SCORE and not exact:
+                    continue
+                entry = self._entries[table_name]
+                hits.append(
+                    LexicalHit(
+                        table_name=table_name,
+                        score=score,
+                        matched_columns=[
+                            name for name, words in entry.column_terms.items() if words & scored_terms
+                        ],
+                        exact=exact,
+                    )
+                )
+
+            coverage = len(known) / len(terms)
+            confident = coverage >= self._skip_coverage and any(h.exact for h in hits)
+            if confident:
+                self._confident += 1
+            return LexicalResult(hits, coverage, confident)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tables": len(self._entries),
+                "terms": len(self._postings),
+                "searches": self._searches,
+                "embedding_skipped": self._confident,
+            }
+
+
+_lexical_index: Optional[SchemaLexicalIndex] = None
+
+
+def get_lexical_index() -> Optional[SchemaLexicalIndex]:
+    """하이브리드 검색이 꺼져 있으면 None."""
+    global _lexical_index
+    if not settings.hybrid_retrieval_enabled:
+        return None
+    if _lexical_index is None:
+        _lexical_index = SchemaLexicalIndex()
+    return _lexical_index
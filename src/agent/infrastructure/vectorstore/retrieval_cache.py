@@ -0,0 +1,93 @@
+"""In-process LRU cache for schema retrieval results."""
+
+import threading
+from collections import OrderedDict
+
+from agent.config import settings
+from agent.domain.services.schema_retriever import RetrievedSchema
+from agent.shared.text import normalize_query
+
+
+class RetrievalCache:
+    """스키마 검색 결과 LRU 캐시.
+
+    키는 (정규화된 질의, top_k, 인덱스 버전)입니다. 인덱스가 변경될 때마다
+    ``bump_version()``으로 버전을 올리므로 이전 버전의 항목은 다시 조회되지 않고
+    LRU 정책에 따라 자연스럽게 밀려납니다.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        self._max_size = max_size or settings.retrieval_cache_size
+        self._entries: OrderedDict[tuple, tuple[RetrievedSchema, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        """현재 스키마 인덱스 버전."""
+        return self._version
+
+    def bump_version(self) -> int:
+        """스키마 인덱스 버전을 올려 기존 캐시 항목을 무효화합니다."""
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def _key(self, query: str, top_k: int) -> tuple:
+        return (normalize_query(query), top_k, self._version)
+
+    def get(self, query: str, top_k: int) -> list[RetrievedSchema] | None:
+        """캐시된 검색 결과를 반환합니다. 없으면 None."""
+        with self._lock:
+            key = self._key(query, top_k)
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(cached)
+
+    def put(self, query: str, top_k: int, schemas: list[RetrievedSchema], version: int) -> None:
+        """검색 결과를 저장합니다.
+
+        ``version``은 검색을 시작할 때의 인덱스 버전입니다. 검색 도중 인덱스가
+        변경되었다면 결과가 이미 오래된 것이므로 저장하지 않습니다.
+        """
+        with self._lock:
+            if version != self._version:
+                return
+            key = self._key(query, top_k)
+            self._entries[key] = tuple(schemas)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "version": self._version,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_retrieval_cache: RetrievalCache | None = None
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    """프로세스 전역 검색 캐시를 반환합니다."""
+    global _retrieval_cache
+    if _retrieval_cache is None:
+        _retrieval_cache = RetrievalCache()
+    return _retrieval_cache
@@ -1,20 +1,315 @@
+import asyncio
+from dataclasses import replace
 from typing import Annotated
 from fastapi import Depends
 
-from agent.domain.services.schema_retriever import SchemaRetriever, RetrievedSchema
+from agent.config import settings
+from agent.domain.services.schema_retriever import SchemaRetriever, RetrievedSchema, format_join_keys
+from agent.infrastructure.database.join_graph import JoinGraph, JoinPlan, get_join_graph
 from agent.infrastructure.vectorstore.chroma_client import get_chroma_client, ChromaDBClient
+from agent.infrastructure.vectorstore.lexical_index import (
+    LexicalHit,
+    SchemaLexicalIndex,
+    get_lexical_index,
+)
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache, get_retrieval_cache
 
 
 class ChromaSchemaRetriever(SchemaRetriever):
-    """ChromaDB를 사용한 스키마 검색 구현체."""
+    """ChromaDB를 사용한 스키마 검색 구현체.
 
-    def __init__(self, chroma_client: ChromaDBClient):
+    컬럼 인덱스가 켜져 있으면 같은 질의 임베딩으로 컬럼 문서도 검색합니다. 테이블
+    점수는 테이블 문서와 가장 가까운 컬럼 문서 중 높은 쪽이므로, 문서가 길어 테이블
+    임베딩이 흐려진 넓은 테이블도 컬럼으로 찾을 수 있습니다. 넓은 테이블의 문서는
+    PK/FK와 검색된 컬럼만 남깁니다.
+
+    렉시컬 인덱스가 주어지면 식별자 BM25 결과와 벡터 검색 결과를 RRF로 합칩니다.
+    질문이 스키마 식별자로 충분히 설명되는 경우(``confident``)에는 질의 임베딩과
+    벡터 검색을 생략합니다.
+
+    FK 조인 그래프가 주어지면 검색된 테이블끼리 바로 조인되지 않을 때 최단 조인
+    경로의 중간 테이블(bridge)을 결과 끝에 붙이고, 각 테이블에 조인 조건을 채웁니다.
+    """
+
+    def __init__(
+        self,
+        chroma_client: ChromaDBClient,
+        cache: RetrievalCache | None = None,
+        lexical_index: SchemaLexicalIndex | None = None,
+        join_graph: JoinGraph | None = None,
+    ):
         self._chroma = chroma_client
+        self._cache = cache
+        self._lexical = lexical_index
+        self._join_graph = join_graph
+
+    @property
+    def schema_version(self) -> int:
+        return self._cache.version if self._cache is not None else 0
 
     def retrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
         """사용자 쿼리와 관련된 스키마를 검색합니다."""
-        results = self._chroma.search(query=query, top_k=top_k)
-        
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k)
+            if cached is not None:
+                return cached
+        return self._search(query, top_k)
+
+    async def aretrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        """캐시 적중 시 스레드 전환 없이 바로 반환하는 비동기 검색."""
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k)
+            if cached is not None:
+                return cached
+        return await asyncio.to_thread(self._search, query, top_k)
+
+    def retrieve_many(self, queries: list[str], top_k: int = 5) -> list[list[RetrievedSchema]]:
+        """캐시에 없는 질문들만 모아 한 번의 벡터 검색으로 처리합니다."""
+        results: list[list[RetrievedSchema] | None] = [None] * len(queries)
+        misses: dict[str, list[int]] = {}
+
+        for i, query in enumerate(queries):
+            cached = self._cache.get(query, top_k) if self._cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(query, []).append(i)
+
+        if misses:
+            version = self._cache.version if self._cache is not None else None
+            miss_queries = list(misses)
+            for query, schemas in zip(miss_queries, self._query_many(miss_queries, top_k)):
+                if self._cache is not None:
+                    self._cache.put(query, top_k, schemas, version=version)
+                for i in misses[query]:
+                    results[i] = schemas
+
+        return results
+
+    def _search(self, query: str, top_k: int) -> list[RetrievedSchema]:
+        """벡터 검색을 수행하고 결과를 캐시에 저장합니다."""
+        version = self._cache.version if self._cache is not None else None
+        schemas = self._query_many([query], top_k)[0]
+
+        if self._cache is not None:
+            self._cache.put(query, top_k, schemas, version=version)
+
+        return schemas
+
+    def _query_many(self, queries: list[str], top_k: int) -> list[list[RetrievedSchema]]:
+        return self._with_joins(self._ranked_many(queries, top_k))
+
+    def _ranked_many(self, queries: list[str], top_k: int) -> list[list[RetrievedSchema]]:
+        if self._lexical is None or len(self._lexical) == 0:
+            return self._vector_many(queries, top_k)
+
+        results: list[list[RetrievedSchema] | None] = [None] * len(queries)
+        lexical_hits: dict[int, list[LexicalHit]] = {}
+        for i, query in enumerate(queries):
+            found = self._lexical.search(query, top_k=top_k)
+            if found.confident:
+                best = found.hits[0].score
+                results[i] = [s for s in (self._from_lexical(h, best) for h in found.hits) if s is not None]
+            else:
+                lexical_hits[i] = found.hits
+
+        if lexical_hits:
+            pending = list(lexical_hits)
+            vector = self._vector_many([queries[i] for i in pending], top_k)
+            for i, schemas in zip(pending, vector):
+                results[i] = self._fuse(schemas, lexical_hits[i], top_k)
+        return results
+
+    def _with_joins(self, results: list[list[RetrievedSchema]]) -> list[list[RetrievedSchema]]:
+        """질문마다 조인 경로를 찾아 bridge 테이블과 조인 조건을 추가합니다."""
+        if self._join_graph is None or len(self._join_graph) == 0:
+            return results
+        plans = [self._join_graph.plan([s.table_name for s in schemas]) for schemas in results]
+
+        # 렉시컬 인덱스에 없는 bridge 문서만 한 번에 조회
+        missing = {
+            name
+            for plan in plans
+            for name in plan.bridges
+            if self._lexical is None or self._lexical.entry(name) is None
+        }
+        stored = {t["table_name"]: t for t in self._chroma.get_tables(sorted(missing))} if missing else {}
+        return [self._apply_plan(schemas, plan, stored) for schemas, plan in zip(results, plans)]
+
+    def _apply_plan(
+        self, schemas: list[RetrievedSchema], plan: JoinPlan, stored: dict[str, dict]
+    ) -> list[RetrievedSchema]:
+        if not plan.join_keys:
+            return schemas
+        joined = [
+            replace(s, join_keys=plan.join_keys[s.table_name]) if s.table_name in plan.join_keys else s
+            for s in schemas
+        ]
+        for name in plan.bridges:
+            entry = self._lexical.entry(name) if self._lexical is not None else None
+            table = (
+                {"table_name": name, "document": entry.document, "metadata": entry.metadata}
+                if entry is not None
+                else stored.get(name)
+            )
+            if table is None:  # 인덱스 갱신 중
+                continue
+            joined.append(
+                RetrievedSchema(
+                    table_name=name,
+                    document=self._key_document(table),
+                    relevance_score=0.0,
+                    metadata=table["metadata"],
+                    join_keys=plan.join_keys.get(name, []),
+                    bridge=True,
+                )
+            )
+        return joined
+
+    @staticmethod
+    def _key_document(table: dict) -> str:
+        """bridge 테이블은 조인에만 쓰이므로 넓은 테이블이면 PK/FK 컬럼만 남깁니다."""
+        metadata = table["metadata"]
+        column_count = metadata.get("column_count", 0)
+        key_columns = list(filter(None, metadata.get("key_columns", "").split(",")))
+        if column_count < settings.column_index_min_columns or not key_columns:
+            return table["document"]
+        omitted = column_count - len(key_columns)
+        return (
+            f"Table: {table['table_name']}. Columns: {metadata['key_column_fragments']}"
+            + (f" (+{omitted} more columns)" if omitted > 0 else "")
+        )
+
+    def _fuse(
+        self, schemas: list[RetrievedSchema], hits: list[LexicalHit], top_k: int
+    ) -> list[RetrievedSchema]:
+        """벡터/렉시컬 순위를 Reciprocal Rank Fusion으로 합칩니다 (점수 척도가 달라 순위만 사용)."""
+        if not hits:
+            return schemas
+        k = settings.hybrid_rrf_k
+        scores: dict[str, float] = {}
+        for rank, schema in enumerate(schemas):
+            scores[schema.table_name] = 1 / (k + rank + 1)
+        for rank, hit in enumerate(hits):
+            scores[hit.table_name] = scores.get(hit.table_name, 0.0) + 1 / (k + rank + 1)
+
+        by_name = {s.table_name: s for s in schemas}
+        by_hit = {h.table_name: h for h in hits}
+        fused = []
+        for name in sorted(scores, key=scores.get, reverse=True):
+            if len(fused) == top_k:
+                break
+            schema, hit = by_name.get(name), by_hit.get(name)
+            if schema is None:
+                schema = self._from_lexical(hit, hits[0].score)
+            elif hit is not None:
+                # 벡터로 찾은 컬럼을 앞에, 식별자가 일치한 컬럼을 뒤에
+                extra = [c for c in hit.matched_columns if c not in schema.matched_columns]
+                if extra:
+                    schema = self._narrowed(schema, schema.matched_columns + extra)
+            if schema is not None:
+                fused.append(schema)
+        return fused
+
+    def _from_lexical(self, hit: LexicalHit, best_score: float) -> RetrievedSchema | None:
+        entry = self._lexical.entry(hit.table_name)
+        if entry is None:  # 검색 직후 제거된 테이블
+            return None
+        table = {"table_name": entry.table_name, "document": entry.document, "metadata": entry.metadata}
+        matched = self._lexical_columns(entry, hit.matched_columns)
+        return RetrievedSchema(
+            table_name=entry.table_name,
+            document=self._narrow(table, matched),
+            relevance_score=hit.score / best_score if best_score else 0.0,
+            metadata=entry.metadata,
+            matched_columns=[c["column_name"] for c in matched],
+        )
+
+    def _narrowed(self, schema: RetrievedSchema, column_names: list[str]) -> RetrievedSchema:
+        entry = self._lexical.entry(schema.table_name)
+        if entry is None:
+            return schema
+        table = {"table_name": entry.table_name, "document": entry.document, "metadata": entry.metadata}
+        matched = self._lexical_columns(entry, column_names)
+        return RetrievedSchema(
+            table_name=schema.table_name,
+            document=self._narrow(table, matched),
+            relevance_score=schema.relevance_score,
+            metadata=schema.metadata,
+            matched_columns=[c["column_name"] for c in matched],
+        )
+
+    @staticmethod
+    def _lexical_columns(entry, column_names: list[str]) -> list[dict]:
+        """``_narrow``가 받는 컬럼 검색 결과 형식으로 변환합니다."""
+        limit = settings.column_index_top_k
+        return [
+            {"column_name": name, "metadata": {"fragment": entry.column_fragments[name]}}
+            for name in column_names[:limit]
+            if name in entry.column_fragments
+        ]
+
+    def _vector_many(self, queries: list[str], top_k: int) -> list[list[RetrievedSchema]]:
+        if not settings.column_index_enabled:
+            return [self._to_schemas(found) for found in self._chroma.search_many(queries, top_k=top_k)]
+        results = self._chroma.search_many_with_columns(
+            queries, top_k=top_k, column_top_k=settings.column_index_top_k
+        )
+        return [self._merge(tables, columns, top_k) for tables, columns in results]
+
+    def _merge(self, tables: list[dict], columns: list[dict], top_k: int) -> list[RetrievedSchema]:
+        """테이블 검색 결과와 컬럼 검색 결과를 합쳐 상위 ``top_k`` 테이블을 고릅니다."""
+        by_table = {t["table_name"]: t for t in tables}
+        scores = {name: 1 - t["distance"] for name, t in by_table.items()}
+        matches: dict[str, list[dict]] = {}
+        for column in columns:  # 거리순
+            matches.setdefault(column["table_name"], []).append(column)
+            scores[column["table_name"]] = max(
+                scores.get(column["table_name"], float("-inf")), 1 - column["distance"]
+            )
+
+        ranked = sorted(scores, key=scores.get, reverse=True)[:top_k]
+        missing = [name for name in ranked if name not in by_table]
+        if missing:
+            by_table.update({t["table_name"]: t for t in self._chroma.get_tables(missing)})
+
+        schemas = []
+        for name in ranked:
+            table = by_table.get(name)
+            if table is None:  # 컬럼 인덱스만 남은 테이블 (인덱스 갱신 중)
+                continue
+            matched = matches.get(name, [])
+            schemas.append(
+                RetrievedSchema(
+                    table_name=name,
+                    document=self._narrow(table, matched),
+                    relevance_score=scores[name],
+                    metadata=table["metadata"],
+                    matched_columns=[c["column_name"] for c in matched],
+                )
+            )
+        return schemas
+
+    @staticmethod
+    def _narrow(table: dict, matched: list[dict]) -> str:
+        """넓은 테이블 문서를 PK/FK 컬럼과 검색된 컬럼만으로 줄입니다."""
+        metadata = table["metadata"]
+        column_count = metadata.get("column_count", 0)
+        if not matched or column_count < settings.column_index_min_columns:
+            return table["document"]
+
+        key_columns = set(filter(None, metadata.get("key_columns", "").split(",")))
+        fragments = [metadata["key_column_fragments"]] if key_columns else []
+        extra = [c for c in matched if c["column_name"] not in key_columns]
+        fragments += [c["metadata"]["fragment"] for c in extra]
+        omitted = column_count - len(key_columns) - len(extra)
+        return (
+            f"Table: {table['table_name']}. Columns: {', '.join(fragments)}"
+            + (f" (+{omitted} more columns)" if omitted > 0 else "")
+        )
+
+    @staticmethod
+    def _to_schemas(results: list[dict]) -> list[RetrievedSchema]:
         return [
             RetrievedSchema(
                 table_name=r["table_name"],
@@ -25,22 +320,32 @@ class ChromaSchemaRetriever(SchemaRetriever):
             for r in results
         ]
 
-    def build_context(self, query: str, top_k: int = 5) -> str:
-        """검색된 스키마를 LLM 컨텍스트 문자열로 변환합니다."""
-        schemas = self.retrieve(query=query, top_k=top_k)
-        
+    def format_context(self, schemas: list[RetrievedSchema]) -> str:
+        """검색된 스키마 목록을 LLM 컨텍스트 문자열로 변환합니다."""
         if not schemas:
             return "No relevant tables found in the database."
-        
+
         context_parts = ["Relevant tables for your query:"]
         for schema in schemas:
             context_parts.append(f"\n- {schema.document}")
-        
+
+        join_keys = format_join_keys(schemas)
+        if join_keys:
+            context_parts.append(f"\n{join_keys}")
+
         return "\n".join(context_parts)
 
+    def build_context(self, query: str, top_k: int = 5) -> str:
+        """검색된 스키마를 LLM 컨텍스트 문자열로 변환합니다."""
+        return self.format_context(self.retrieve(query=query, top_k=top_k))
+
 
 def get_schema_retriever(
-    chroma_client: Annotated[ChromaDBClient, Depends(get_chroma_client)]
+    chroma_client: Annotated[ChromaDBClient, Depends(get_chroma_client)] = None
 ) -> ChromaSchemaRetriever:
-    return ChromaSchemaRetriever(chroma_client=chroma_client)
-
+    return ChromaSchemaRetriever(
+        chroma_client=chroma_client or get_chroma_client(),
+        cache=get_retrieval_cache(),
+        lexical_index=get_lexical_index(),
+        join_graph=get_join_graph(),
+    )
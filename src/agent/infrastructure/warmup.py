@@ -0,0 +1,131 @@
+"""Explicit warmup of heavy components and readiness tracking."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass
+class ComponentStatus:
+    """워밍업 대상 컴포넌트 상태."""
+
+    name: str
+    ready: bool = False
+    error: Optional[str] = None
+    duration_ms: Optional[float] = None
+
+
+@dataclass
+class ReadinessState:
+    """컴포넌트별 워밍업 진행 상태."""
+
+    components: dict[str, ComponentStatus] = field(default_factory=dict)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.components) and all(c.ready for c in self.components.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmup_finished": self.finished_at is not None,
+            "warmup_seconds": (
+                round(self.finished_at - self.started_at, 3)
+                if self.started_at is not None and self.finished_at is not None
+                else None
+            ),
+            "components": {
+                name: {"ready": c.ready, "error": c.error, "duration_ms": c.duration_ms}
+                for name, c in self.components.items()
+            },
+        }
+
+
+def _warm_database() -> None:
+    from sqlalchemy import text
+
+    from agent.infrastructure.database.connection import get_engine
+
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def _warm_embedding_model() -> None:
+    from agent.infrastructure.vectorstore.embedding_service import get_embedding_service
+
+    get_embedding_service().warmup()
+
+
+def _warm_vector_store() -> None:
+    from agent.infrastructure.vectorstore.chroma_client import get_chroma_client
+
+    get_chroma_client().count()
+
+
+def _warm_schema_index() -> None:
+    from agent.infrastructure.database.globals import sync_schema_index
+
+    result = sync_schema_index()
+    print(
+        f"[RAG] Schema index ready: {result.total} tables "
+        f"(added {len(result.added)}, updated {len(result.updated)}, "
+        f"removed {len(result.removed)}, unchanged {result.unchanged})"
+    )
+
+
+def _warm_llm_client() -> None:
+    from agent.infrastructure.llm.langchain_client import get_sql_generator
+
+    get_sql_generator()
+
+
+# 실행 순서대로 (스키마 인덱스는 임베딩 모델과 벡터 저장소에 의존)
+WARMUP_STEPS: list[tuple[str, Callable[[], None]]] = [
+    ("database", _warm_database),
+    ("embedding_model", _warm_embedding_model),
+    ("vector_store", _warm_vector_store),
+    ("schema_index", _warm_schema_index),
+    ("llm_client", _warm_llm_client),
+]
+
+_state = ReadinessState(components={name: ComponentStatus(name) for name, _ in WARMUP_STEPS})
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+
+
+def run_warmup() -> ReadinessState:
+    """모든 컴포넌트를 순서대로 로드합니다. 실패한 컴포넌트는 오류와 함께 기록됩니다."""
+    _state.started_at = time.monotonic()
+    _state.finished_at = None
+
+    for name, step in WARMUP_STEPS:
+        status = _state.components[name]
+        start = time.perf_counter()
+        try:
+            step()
+            status.ready, status.error = True, None
+        except Exception as e:
+            status.ready, status.error = False, str(e)
+            print(f"[Warmup] {name} failed: {e}")
+        status.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    _state.finished_at = time.monotonic()
+    return _state
+
+
+def start_background_warmup() -> threading.Thread:
+    """워밍업을 백그라운드 스레드에서 시작합니다 (서버는 즉시 연결을 받음)."""
+    global _thread
+    with _lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=run_warmup, name="warmup", daemon=True)
+            _thread.start()
+        return _thread
+
+
+def get_readiness() -> ReadinessState:
+    """현재 준비 상태를 반환합니다."""
+    return _state
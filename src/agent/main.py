@@ -4,8 +4,11 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from agent.config import settings
 from agent.infrastructure.database.connection import init_db, shutdown_db
-from agent.presentation.api.routes import database_routes, query_routes
+from agent.infrastructure.repositories.query_log_retention import start_retention_scheduler
+from agent.infrastructure.warmup import run_warmup, start_background_warmup
+from agent.presentation.api.routes import database_routes, query_routes, system_routes
 from agent.presentation.web.routes import router as web_router
 
 # 정적 파일 경로
@@ -17,17 +20,22 @@ STATIC_DIR = WEB_DIR / "static"
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     init_db()
-    
-    # Index schemas for RAG on startup
-    try:
-        from agent.infrastructure.database.globals import init_schema_services
-        
-        indexed_count = init_schema_services()
-        print(f"[RAG] Indexed {indexed_count} tables for schema retrieval")
-    except Exception as e:
-        print(f"[RAG] Schema indexing failed: {e}")
-    
+
+    # 임베딩 모델/벡터 저장소/스키마 인덱스/LLM 클라이언트를 명시적으로 로드.
+    # 빠른 기동 모드에서는 백그라운드에서 로드하고 /api/ready로 준비 여부를 알림
+    if settings.warmup_in_background:
+        start_background_warmup()
+    else:
+        run_warmup()
+
+    # 오래된 QueryLog 아카이브 (QUERY_LOG_RETENTION_ENABLED=true일 때만)
+    start_retention_scheduler()
+
     yield
+
+    from agent.infrastructure.database.globals import shutdown_schema_services
+
+    shutdown_schema_services()
     shutdown_db()
 
 
@@ -45,3 +53,4 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 app.include_router(web_router)
 app.include_router(query_routes.router)
 app.include_router(database_routes.router)
+app.include_router(system_routes.router)
@@ -1,9 +1,17 @@
-from typing import Annotated
+import asyncio
+import json
+from typing import Annotated, Iterator, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from agent.infrastructure.database.globals import get_global_schema_service
+from agent.config import settings
+from agent.infrastructure.database.bulk_loader import iter_csv_rows, iter_ndjson_records
+from agent.infrastructure.database.connection import get_engine
+from agent.infrastructure.database.engine_factory import get_pool_stats
+from agent.infrastructure.database.globals import get_global_index_worker, get_global_schema_service
 from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.database.table_exporter import get_table_exporter
 from agent.presentation.api.schemas import (
     AddColumnRequestDTO,
     CreateTableRequestDTO,
@@ -19,6 +27,14 @@ from agent.presentation.api.schemas import (
 router = APIRouter(prefix="/api/database", tags=["Database"])
 
 
+def _ddl_response(service: SchemaService, message: str, wait_for_index: bool) -> dict:
+    """DDL 응답을 만듭니다. 요청 시 인덱스 반영까지 기다립니다."""
+    response = {"message": message}
+    if wait_for_index:
+        response["index_ready"] = service.wait_for_index(settings.index_wait_timeout_seconds)
+    return response
+
+
 @router.get("/connection", response_model=DatabaseInfoDTO)
 def get_connection_info(
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
@@ -27,6 +43,12 @@ def get_connection_info(
     return service.get_connection_info()
 
 
+@router.get("/pool/stats")
+def get_connection_pool_stats():
+    """커넥션 풀 체크아웃/대기/오버플로 통계를 반환합니다."""
+    return get_pool_stats(get_engine())
+
+
 @router.get("/tables", response_model=TablesListDTO)
 def get_tables(
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
@@ -57,15 +79,42 @@ def get_schema_context(
     return SchemaContextDTO(context=service.get_schema_context())
 
 
+@router.post("/schema-context/refresh")
+def refresh_schema_metadata(
+    service: Annotated[SchemaService, Depends(get_global_schema_service)],
+):
+    """외부에서 변경된 스키마를 반영하도록 메타데이터 캐시를 비웁니다."""
+    version = service.refresh_metadata()
+    return {"message": "Schema metadata cache refreshed", "schema_version": version}
+
+
+@router.get("/index/status")
+def get_index_status():
+    """백그라운드 스키마 인덱스 워커 상태를 반환합니다."""
+    return get_global_index_worker().stats()
+
+
+@router.post("/index/wait")
+def wait_index_ready(
+    service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    timeout: float | None = None,
+):
+    """지금까지의 스키마 변경이 인덱스에 반영될 때까지 기다립니다."""
+    limit = settings.index_wait_timeout_seconds
+    ready = service.wait_for_index(min(timeout, limit) if timeout is not None else limit)
+    return {"index_ready": ready}
+
+
 @router.post("/tables", status_code=201)
 def create_table(
     request: CreateTableRequestDTO,
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    wait_for_index: bool = False,
 ):
     """새로운 테이블을 생성합니다."""
     try:
         service.create_table(request)
-        return {"message": f"Table '{request.table_name}' created successfully"}
+        return _ddl_response(service, f"Table '{request.table_name}' created successfully", wait_for_index)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -74,11 +123,12 @@ def create_table(
 def delete_table(
     table_name: str,
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    wait_for_index: bool = False,
 ):
     """테이블을 삭제합니다."""
     try:
         service.drop_table(table_name)
-        return {"message": f"Table '{table_name}' deleted successfully"}
+        return _ddl_response(service, f"Table '{table_name}' deleted successfully", wait_for_index)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -88,11 +138,14 @@ def rename_table(
     table_name: str,
     request: RenameTableRequestDTO,
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    wait_for_index: bool = False,
 ):
     """테이블 이름을 변경합니다."""
     try:
         service.rename_table(table_name, request.new_name)
-        return {"message": f"Table renamed from '{table_name}' to '{request.new_name}'"}
+        return _ddl_response(
+            service, f"Table renamed from '{table_name}' to '{request.new_name}'", wait_for_index
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -102,11 +155,14 @@ def add_column(
     table_name: str,
     request: AddColumnRequestDTO,
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    wait_for_index: bool = False,
 ):
     """테이블에 컬럼을 추가합니다."""
     try:
         service.add_column(table_name, request.column)
-        return {"message": f"Column '{request.column.name}' added to '{table_name}'"}
+        return _ddl_response(
+            service, f"Column '{request.column.name}' added to '{table_name}'", wait_for_index
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -116,11 +172,14 @@ def drop_column(
     table_name: str,
     column_name: str,
     service: Annotated[SchemaService, Depends(get_global_schema_service)],
+    wait_for_index: bool = False,
 ):
     """테이블에서 컬럼을 삭제합니다."""
     try:
         service.drop_column(table_name, column_name)
-        return {"message": f"Column '{column_name}' dropped from '{table_name}'"}
+        return _ddl_response(
+            service, f"Column '{column_name}' dropped from '{table_name}'", wait_for_index
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -128,17 +187,120 @@ def drop_column(
 @router.get("/tables/{table_name}/data", response_model=TableDataDTO)
 def get_table_data(
     table_name: str,
-    limit: int = 100,
-    offset: int = 0,
+    limit: int = Query(100, ge=1),
+    offset: int = Query(0, ge=0),
+    mode: Literal["offset", "cursor"] = "offset",
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Literal["asc", "desc"] = "asc",
     service: Annotated[SchemaService, Depends(get_global_schema_service)] = None,
 ):
-    """테이블의 데이터를 반환합니다."""
+    """테이블의 데이터를 반환합니다.
+
+    ``mode=cursor``(또는 ``cursor``/``sort`` 지정)이면 키셋 페이지네이션을 사용하고
+    응답의 ``next_cursor``로 다음 페이지를 조회합니다. 기본은 기존 offset 방식입니다.
+    """
     try:
+        if mode == "cursor" or cursor is not None or sort is not None:
+            return service.get_table_data_page(
+                table_name, limit, cursor=cursor, sort=sort, descending=order == "desc"
+            )
         return service.get_table_data(table_name, limit, offset)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/tables/{table_name}/export")
+def export_table(
+    table_name: str,
+    format: Literal["csv", "ndjson", "arrow"] = "csv",
+    columns: Optional[str] = Query(None, description="내보낼 컬럼 (쉼표로 구분)"),
+    gzip: bool = False,
+    service: Annotated[SchemaService, Depends(get_global_schema_service)] = None,
+):
+    """테이블 전체를 CSV/NDJSON/Arrow IPC 스트림으로 내보냅니다.
+
+    서버 측 커서로 고정 크기 청크씩 읽어 바로 전송하므로 테이블 크기와 관계없이
+    메모리 사용량이 일정합니다. ``gzip=true``이면 압축된 파일(.gz)로 내려받습니다.
+    """
+    if table_name not in service.get_tables():
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+
+    exporter = get_table_exporter()
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    try:
+        plan = exporter.prepare(table_name, format, selected, compress=gzip)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        exporter.stream(plan),
+        media_type=plan.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{plan.filename}"'},
+    )
+
+
+def _iter_body(request: Request, loop: asyncio.AbstractEventLoop) -> Iterator[bytes]:
+    """요청 본문 스트림을 워커 스레드에서 읽을 수 있는 동기 이터레이터로 바꿉니다."""
+    body = request.stream().__aiter__()
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(body.__anext__(), loop).result()
+        except StopAsyncIteration:
+            return
+
+
+@router.post("/tables/{table_name}/rows/bulk")
+async def add_rows_bulk(
+    table_name: str,
+    request: Request,
+    relax_durability: bool = False,
+    stop_on_error: bool = False,
+    chunk_size: Optional[int] = Query(None, ge=1, le=100_000),
+    service: Annotated[SchemaService, Depends(get_global_schema_service)] = None,
+):
+    """여러 행을 한 번에 적재합니다.
+
+    본문 형식은 Content-Type으로 구분합니다.
+    - ``application/json``: 객체 배열
+    - ``application/x-ndjson``: 한 줄에 객체 하나 (스트리밍)
+    - ``text/csv``: 첫 줄이 헤더인 CSV (스트리밍, 빈 값은 NULL)
+
+    청크 단위로 커밋하며, 실패한 청크는 응답의 ``errors``에 담깁니다.
+    """
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    loop = asyncio.get_running_loop()
+
+    def load():
+        body = _iter_body(request, loop)
+        columns = None
+        if content_type in ("text/csv", "application/csv"):
+            columns, rows = iter_csv_rows(body)
+        elif content_type in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+            rows = iter_ndjson_records(body)
+        elif content_type == "application/json":
+            rows = json.loads(b"".join(body))
+            if not isinstance(rows, list):
+                raise ValueError("JSON 본문은 객체 배열이어야 합니다.")
+        else:
+            raise ValueError(f"지원하지 않는 Content-Type입니다: {content_type}")
+
+        return service.add_rows_bulk(
+            table_name,
+            rows,
+            columns=columns,
+            relax_durability=relax_durability,
+            stop_on_error=stop_on_error,
+            chunk_size=chunk_size,
+        )
+
+    try:
+        result = await asyncio.to_thread(load)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result.to_dict()
+
+
 @router.post("/tables/{table_name}/rows", status_code=201)
 def add_row(
     table_name: str,
@@ -1,31 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from agent.application.use_cases.generate_sql import (
+    GenerateSQLEvent,
     GenerateSQLRequest,
     GenerateSQLUseCase,
+    get_generation_singleflight,
+)
+from agent.application.use_cases.list_query_logs import (
+    InvalidCursorError,
+    ListQueryLogsRequest,
+    ListQueryLogsUseCase,
 )
+from agent.config import settings
+from agent.domain.entities.query_log import QueryLogStatus
+from agent.infrastructure.database.connection import SessionLocal
+from agent.infrastructure.database.cost_guard import get_cost_guard
+from agent.infrastructure.database.join_graph import get_join_graph
+from agent.infrastructure.database.sql_executor import get_query_result_cache, get_sql_executor
+from agent.infrastructure.database.table_exporter import json_default
+from agent.infrastructure.llm.context_builder import get_schema_context_builder
 from agent.infrastructure.llm.langchain_client import LangChainSQLGenerator
+from agent.infrastructure.llm.semantic_cache import get_semantic_sql_cache
+from agent.infrastructure.repositories.query_log_retention import get_daily_rollups
+from agent.infrastructure.repositories.query_log_writer import get_query_log_writer
 from agent.infrastructure.repositories.sqlalchemy_query_log_repository import (
-    SQLAlchemyQueryLogRepository,
+    get_query_log_repository,
 )
+from agent.infrastructure.vectorstore.embedding_cache import get_query_embedding_cache
+from agent.infrastructure.vectorstore.lexical_index import get_lexical_index
+from agent.infrastructure.vectorstore.retrieval_cache import get_retrieval_cache
 from agent.infrastructure.vectorstore.schema_retriever import get_schema_retriever
 from agent.presentation.api.dependencies import get_db
 from agent.presentation.api.schemas import (
+    CacheStatsDTO,
+    ExecuteSQLRequestDTO,
+    GenerateSQLBatchItemDTO,
+    GenerateSQLBatchRequestDTO,
+    GenerateSQLBatchResponseDTO,
     GenerateSQLRequestDTO,
     GenerateSQLResponseDTO,
+    QueryLogDTO,
+    QueryLogPageDTO,
 )
 
 router = APIRouter(prefix="/api/query", tags=["Query"])
 
 
 @router.post("/generate", response_model=GenerateSQLResponseDTO)
-def generate_sql(
+async def generate_sql(
     request: GenerateSQLRequestDTO,
     db: Session = Depends(get_db),
 ):
     """자연어를 SQL로 변환합니다."""
-    repository = SQLAlchemyQueryLogRepository(db)
+    repository = get_query_log_repository(db)
     generator = LangChainSQLGenerator()
     schema_retriever = get_schema_retriever()
 
@@ -33,10 +68,15 @@ def generate_sql(
         query_log_repository=repository,
         sql_generator=generator,
         schema_retriever=schema_retriever,
+        sql_cache=get_semantic_sql_cache(),
+        singleflight=get_generation_singleflight() if settings.generation_coalescing_enabled else None,
+        cost_guard=get_cost_guard(),
+        retry_on_block=settings.cost_guard_retry_on_block,
+        context_builder=get_schema_context_builder(),
     )
 
     try:
-        result = use_case.execute(
+        result = await use_case.aexecute(
             GenerateSQLRequest(
                 user_query=request.user_query,
                 schema_context=request.schema_context,
@@ -47,10 +87,251 @@ def generate_sql(
             user_query=result.user_query,
             generated_sql=result.generated_sql,
             status=result.status,
+            used_tables=result.used_tables,
+            cache_hit=result.cache_hit,
+            coalesced=result.coalesced,
+            cost=result.cost,
+            regenerated=result.regenerated,
+            prompt_tokens=result.prompt_tokens,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/generate/batch", response_model=GenerateSQLBatchResponseDTO)
+async def generate_sql_batch(
+    request: GenerateSQLBatchRequestDTO,
+    db: Session = Depends(get_db),
+):
+    """여러 자연어 질문을 한 번에 SQL로 변환합니다.
+
+    개별 항목의 실패는 전체 요청을 실패시키지 않고 항목별 ``error``로 반환됩니다.
+    """
+    if len(request.queries) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many queries (max {settings.batch_max_items})",
+        )
+
+    use_case = GenerateSQLUseCase(
+        query_log_repository=get_query_log_repository(db),
+        sql_generator=LangChainSQLGenerator(),
+        schema_retriever=get_schema_retriever(),
+        sql_cache=get_semantic_sql_cache(),
+        cost_guard=get_cost_guard(),
+        context_builder=get_schema_context_builder(),
+    )
+
+    max_concurrency = min(
+        request.max_concurrency or settings.batch_max_concurrency,
+        settings.batch_max_concurrency,
+    )
+
+    try:
+        items = await use_case.aexecute_batch(
+            [
+                GenerateSQLRequest(user_query=q, schema_context=request.schema_context)
+                for q in request.queries
+            ],
+            max_concurrency=max_concurrency,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    results = [GenerateSQLBatchItemDTO(**asdict(item)) for item in items]
+    failed = sum(1 for item in items if item.error is not None)
+    return GenerateSQLBatchResponseDTO(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed,
+    )
+
+
+def _format_sse(event: GenerateSQLEvent) -> str:
+    """이벤트를 text/event-stream 프레임으로 직렬화합니다."""
+    return f"event: {event.event}\ndata: {json.dumps(event.data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/generate/stream")
+async def generate_sql_stream(request: GenerateSQLRequestDTO):
+    """자연어를 SQL로 변환하며 결과를 SSE로 스트리밍합니다.
+
+    이벤트: ``tables``(검색된 테이블), ``delta``(SQL 조각), ``retry``(비용 검사에서 차단되어
+    재생성 중), ``done``(query_log_id, 비용 검사 결과 포함), ``error``.
+    """
+
+    async def event_stream() -> AsyncIterator[str]:
+        # 세션 수명이 응답 스트림과 같아야 하므로 의존성 대신 직접 관리
+        db = SessionLocal()
+        try:
+            use_case = GenerateSQLUseCase(
+                query_log_repository=get_query_log_repository(db),
+                sql_generator=LangChainSQLGenerator(),
+                schema_retriever=get_schema_retriever(),
+                sql_cache=get_semantic_sql_cache(),
+                cost_guard=get_cost_guard(),
+                retry_on_block=settings.cost_guard_retry_on_block,
+                context_builder=get_schema_context_builder(),
+            )
+            async for event in use_case.astream(
+                GenerateSQLRequest(
+                    user_query=request.user_query,
+                    schema_context=request.schema_context,
+                )
+            ):
+                yield _format_sse(event)
+        except Exception as e:
+            yield _format_sse(GenerateSQLEvent("error", {"message": str(e)}))
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/execute")
+def execute_sql(request: ExecuteSQLRequestDTO):
+    """생성된 SQL을 읽기 전용으로 실행하고 결과를 NDJSON으로 스트리밍합니다.
+
+    각 줄은 ``columns``, ``rows``(청크), ``done``(row_count, truncated, elapsed_ms, cached)
+    또는 ``error`` 이벤트입니다. ``query_log_id``로 실행하면 실행 시간과 행 수가 해당
+    로그에 기록됩니다.
+    """
+    query_log_id = None
+    sql = request.sql
+    if request.query_log_id is not None:
+        try:
+            query_log_id = UUID(request.query_log_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 query_log_id입니다.")
+        db = SessionLocal()
+        try:
+            query_log = get_query_log_repository(db).find_by_id(query_log_id)
+        finally:
+            db.close()
+        if query_log is None:
+            raise HTTPException(status_code=404, detail="질의 로그를 찾을 수 없습니다.")
+        if not query_log.generated_sql:
+            raise HTTPException(status_code=400, detail="실행할 SQL이 없는 질의 로그입니다.")
+        sql = query_log.generated_sql
+    if not sql:
+        raise HTTPException(status_code=400, detail="sql 또는 query_log_id가 필요합니다.")
+
+    executor = get_sql_executor()
+    try:
+        plan = executor.prepare(sql, max_rows=request.max_rows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    encode = json.JSONEncoder(ensure_ascii=False, default=json_default).encode
+
+    def lines() -> Iterator[str]:
+        for event in executor.stream(plan):
+            yield encode(event) + "\n"
+            if event["event"] == "done" and query_log_id is not None and not event["cached"]:
+                _record_execution(query_log_id, event["elapsed_ms"], event["row_count"])
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _record_execution(query_log_id: UUID, elapsed_ms: float, row_count: int) -> None:
+    db = SessionLocal()
+    try:
+        repository = get_query_log_repository(db)
+        query_log = repository.find_by_id(query_log_id)
+        if query_log is not None:
+            query_log.record_execution(elapsed_ms, row_count)
+            repository.save(query_log)
+    except Exception as e:
+        print(f"[QueryLog] Failed to record execution of {query_log_id}: {e}")
+    finally:
+        db.close()
+
+
+@router.get("/logs", response_model=QueryLogPageDTO)
+def list_query_logs(
+    limit: int = Query(50, ge=1, le=settings.query_log_page_max),
+    cursor: Optional[str] = None,
+    status: Optional[QueryLogStatus] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+):
+    """질의 로그를 최신순으로 조회합니다.
+
+    응답의 ``next_cursor``를 다음 요청의 ``cursor``로 넘기면 다음 페이지를 반환합니다.
+    """
+    use_case = ListQueryLogsUseCase(get_query_log_repository(db))
+    try:
+        result = use_case.execute(
+            ListQueryLogsRequest(
+                limit=limit,
+                cursor=cursor,
+                status=status,
+                created_from=created_from,
+                created_to=created_to,
+            )
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return QueryLogPageDTO(
+        items=[
+            QueryLogDTO(
+                id=str(log.id),
+                user_query=log.user_query,
+                generated_sql=log.generated_sql,
+                status=log.status.value,
+                error_message=log.error_message,
+                created_at=log.created_at,
+                execution_time_ms=log.execution_time_ms,
+                row_count=log.row_count,
+            )
+            for log in result.items
+        ],
+        next_cursor=result.next_cursor,
+    )
+
+
+@router.get("/logs/rollups")
+def list_query_log_rollups(
+    day_from: Optional[date] = None,
+    day_to: Optional[date] = None,
+    db: Session = Depends(get_db),
+):
+    """일별 질의 로그 집계 (상태별 건수, 자주 묻는 질문). 기본은 최근 30일."""
+    day_to = day_to or date.today()
+    day_from = day_from or day_to - timedelta(days=30)
+    return {"items": get_daily_rollups(db.connection(), day_from, day_to)}
+
+
+@router.get("/cache/stats", response_model=CacheStatsDTO)
+def get_cache_stats():
+    """검색/시맨틱/질의 임베딩/실행 결과 캐시, 렉시컬 인덱스/조인 그래프 및 요청 병합 통계를 반환합니다."""
+    sql_cache = get_semantic_sql_cache()
+    result_cache = get_query_result_cache()
+    lexical_index = get_lexical_index()
+    join_graph = get_join_graph()
+    return CacheStatsDTO(
+        retrieval=get_retrieval_cache().stats(),
+        semantic_sql=sql_cache.stats() if sql_cache else None,
+        coalescing=get_generation_singleflight().stats(),
+        query_embeddings=get_query_embedding_cache().stats(),
+        query_results=result_cache.stats() if result_cache else None,
+        lexical=lexical_index.stats() if lexical_index is not None else None,
+        join_graph=join_graph.stats() if join_graph is not None else None,
+    )
+
+
+@router.get("/log-writer/stats")
+def get_log_writer_stats():
+    """QueryLog write-behind 버퍼 통계를 반환합니다."""
+    writer = get_query_log_writer()
+    return writer.stats() if writer else {"enabled": False}
+
 
 @router.get("/health")
 def health_check():
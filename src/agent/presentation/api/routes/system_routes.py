@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from agent.infrastructure.warmup import get_readiness
+
+router = APIRouter(prefix="/api", tags=["System"])
+
+
+@router.get("/ready")
+def readiness_check():
+    """워밍업 대상 컴포넌트가 모두 준비되었는지 반환합니다 (준비 전에는 503)."""
+    state = get_readiness()
+    return JSONResponse(status_code=200 if state.ready else 503, content=state.to_dict())
@@ -1,7 +1,8 @@
 import re
+from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class GenerateSQLRequestDTO(BaseModel):
@@ -14,6 +15,69 @@ class GenerateSQLResponseDTO(BaseModel):
     user_query: str
     generated_sql: str
     status: str
+    used_tables: Optional[list[str]] = None
+    cache_hit: bool = False
+    coalesced: bool = False
+    cost: Optional[dict] = None  # 실행 계획 비용 검사 결과 (verdict: ok | warn | block)
+    regenerated: bool = False
+    prompt_tokens: Optional[int] = None  # 스키마 컨텍스트 + 질문 토큰 수
+
+
+class GenerateSQLBatchRequestDTO(BaseModel):
+    queries: list[str]
+    schema_context: str = ""
+    max_concurrency: Optional[int] = None
+
+
+class GenerateSQLBatchItemDTO(BaseModel):
+    index: int
+    query_log_id: str
+    user_query: str
+    status: str
+    generated_sql: Optional[str] = None
+    used_tables: Optional[list[str]] = None
+    cache_hit: bool = False
+    cost: Optional[dict] = None
+    prompt_tokens: Optional[int] = None
+    error: Optional[str] = None
+
+
+class GenerateSQLBatchResponseDTO(BaseModel):
+    results: list[GenerateSQLBatchItemDTO]
+    succeeded: int
+    failed: int
+
+
+class ExecuteSQLRequestDTO(BaseModel):
+    sql: Optional[str] = None
+    query_log_id: Optional[str] = None  # sql 대신 저장된 생성 결과를 실행
+    max_rows: Optional[int] = Field(None, ge=1)
+
+
+class QueryLogDTO(BaseModel):
+    id: str
+    user_query: str
+    generated_sql: Optional[str] = None
+    status: str
+    error_message: Optional[str] = None
+    created_at: datetime
+    execution_time_ms: Optional[float] = None
+    row_count: Optional[int] = None
+
+
+class QueryLogPageDTO(BaseModel):
+    items: list[QueryLogDTO]
+    next_cursor: Optional[str] = None
+
+
+class CacheStatsDTO(BaseModel):
+    retrieval: dict
+    semantic_sql: Optional[dict] = None
+    coalescing: Optional[dict] = None
+    query_embeddings: Optional[dict] = None
+    query_results: Optional[dict] = None
+    lexical: Optional[dict] = None  # 렉시컬 인덱스 크기와 임베딩 생략 횟수
+    join_graph: Optional[dict] = None  # FK 조인 그래프 크기와 경로 조회 횟수
 
 
 class ColumnInfoDTO(BaseModel):
@@ -22,6 +86,8 @@ class ColumnInfoDTO(BaseModel):
     nullable: bool
     primary_key: bool
     default: Optional[str] = None
+    foreign_key: Optional[str] = None  # 참조 대상 "table.column"
+    comment: Optional[str] = None
 
 
 class TableInfoDTO(BaseModel):
@@ -102,6 +168,7 @@ class AddColumnRequestDTO(BaseModel):
 class TableDataDTO(BaseModel):
     columns: list[str]
     rows: list[dict]
+    next_cursor: Optional[str] = None  # 커서 모드에서 다음 페이지가 있을 때만 설정
 
 
 class InsertRowRequestDTO(BaseModel):
@@ -40,6 +40,62 @@ export async function generateSQL(userQuery, schemaContext) {
     return await response.json();
 }
 
+/**
+ * SQL 생성 결과를 SSE로 스트리밍합니다.
+ * handlers: { onTables, onDelta, onDone, onError }
+ */
+export async function generateSQLStream(userQuery, schemaContext, handlers = {}) {
+    const response = await fetch('/api/query/generate/stream', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+        body: JSON.stringify({
+            user_query: userQuery,
+            schema_context: schemaContext
+        })
+    });
+
+    if (!response.ok || !response.body) {
+        throw new Error('API request failed');
+    }
+
+    const callbacks = {
+        tables: handlers.onTables,
+        delta: handlers.onDelta,
+        done: handlers.onDone,
+        error: handlers.onError
+    };
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+
+        // 이벤트는 빈 줄로 구분
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const frame = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let eventName = 'message';
+            const dataLines = [];
+            frame.split('\n').forEach(line => {
+                if (line.startsWith('event:')) eventName = line.slice(6).trim();
+                else if (line.startsWith('data:')) dataLines.push(line.slice(5).trimStart());
+            });
+
+            const callback = callbacks[eventName];
+            if (callback && dataLines.length) {
+                callback(JSON.parse(dataLines.join('\n')));
+            }
+        }
+    }
+}
+
 export async function createTable(tableData) {
     const response = await fetch('/api/database/tables', {
         method: 'POST',
@@ -116,6 +172,19 @@ export async function fetchTableData(tableName, limit = 100, offset = 0) {
     return await response.json();
 }
 
+export async function fetchTableDataPage(tableName, { limit = 100, cursor = null, sort = null, order = 'asc' } = {}) {
+    const params = new URLSearchParams({ mode: 'cursor', limit, order });
+    if (cursor) params.set('cursor', cursor);
+    if (sort) params.set('sort', sort);
+
+    const response = await fetch(`/api/database/tables/${encodeURIComponent(tableName)}/data?${params}`);
+    if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'Failed to load table data');
+    }
+    return await response.json();
+}
+
 export async function insertTableRow(tableName, data) {
     const response = await fetch(`/api/database/tables/${encodeURIComponent(tableName)}/rows`, {
         method: 'POST',
@@ -130,3 +199,19 @@ export async function insertTableRow(tableName, data) {
 
     return await response.json();
 }
+
+export async function uploadTableRowsCsv(tableName, file) {
+    // 파일을 그대로 본문으로 보내 서버에서 스트리밍 파싱/청크 적재
+    const response = await fetch(`/api/database/tables/${encodeURIComponent(tableName)}/rows/bulk`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'text/csv' },
+        body: file
+    });
+
+    if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'CSV 업로드에 실패했습니다.');
+    }
+
+    return await response.json();
+}
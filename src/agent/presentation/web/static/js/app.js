@@ -9,7 +9,6 @@ import * as utils from './utils.js';
 const queryInput = document.getElementById('queryInput');
 const submitBtn = document.getElementById('submitBtn');
 
-let schemaContext = '';
 let isSubmitting = false;  // 중복 제출 방지 플래그
 let isComposingIME = false; // IME 조합 상태 추적
 
@@ -45,7 +44,6 @@ async function refreshSidebar() {
     ]);
     ui.updateDatabaseStatus(dbInfo);
     ui.renderTablesList(tablesData.tables, window.showTableInfo);
-    schemaContext = await api.fetchSchemaContext();
 }
 
 
@@ -60,9 +58,6 @@ async function init() {
         const tablesData = await api.fetchTables();
         ui.renderTablesList(tablesData.tables, window.showTableInfo);
 
-        // 스키마 컨텍스트 로드
-        schemaContext = await api.fetchSchemaContext();
-
         // 사이드바 토글 초기화
         ui.initSidebarToggle();
     } catch (error) {
@@ -88,27 +83,33 @@ async function handleSubmit() {
     ui.showLoading();
 
     try {
-        const result = await api.generateSQL(query, schemaContext);
-        // addSQLMessage internal logic calls removeLoading()
-        const codeWrapper = ui.addSQLMessage(result.generated_sql, '요청하신 쿼리를 생성했습니다.');
-
-        // 복사 버튼 이벤트 바인딩
-        const copyBtn = codeWrapper.querySelector('.copy-btn');
-        const copyBtnText = copyBtn.querySelector('span');
-
-        copyBtn.addEventListener('click', () => {
-            utils.copyToClipboard(result.generated_sql);
-            copyBtnText.textContent = 'COPIED!';
-            const icon = copyBtn.querySelector('i');
-            icon.setAttribute('data-lucide', 'check');
-            lucide.createIcons();
-
-            setTimeout(() => {
-                copyBtnText.textContent = 'COPY';
-                icon.setAttribute('data-lucide', 'copy');
-                lucide.createIcons();
-            }, 2000);
+        let message = null;
+        let streamedSQL = '';
+        let streamError = null;
+
+        // 스키마 컨텍스트는 서버가 질문에 맞게 검색/압축하므로 비워서 보냄
+        await api.generateSQLStream(query, '', {
+            onTables: (data) => {
+                // 첫 이벤트 도착 시 로딩 표시를 SQL 메시지로 교체
+                const tablesNote = data.tables.length ? ` (참고 테이블: ${data.tables.join(', ')})` : '';
+                message = ui.addStreamingSQLMessage(`요청하신 쿼리를 생성하고 있습니다...${tablesNote}`);
+                bindCopyButton(message.codeWrapper, () => streamedSQL);
+            },
+            onDelta: (data) => {
+                streamedSQL += data.text;
+                message.append(data.text);
+            },
+            onDone: (data) => {
+                streamedSQL = data.generated_sql;
+                message.finish(streamedSQL);
+                message.setExplanation(describeCost(data));
+            },
+            onError: (data) => {
+                streamError = new Error(data.message);
+            }
         });
+
+        if (streamError) throw streamError;
     } catch (error) {
         ui.removeLoading();
         ui.addMessage('SQL 생성 중 오류가 발생했습니다. 다시 시도해주세요.', 'assistant');
@@ -118,6 +119,39 @@ async function handleSubmit() {
     }
 }
 
+// 실행 계획 비용 검사 결과를 안내 문구로 변환
+function describeCost(data) {
+    const cost = data.cost;
+    let text = data.regenerated
+        ? '처음 생성한 쿼리의 실행 비용이 커서 다시 생성했습니다.'
+        : '요청하신 쿼리를 생성했습니다.';
+    if (cost && cost.verdict !== 'ok' && cost.reasons.length) {
+        const label = cost.verdict === 'block' ? '실행 차단' : '주의';
+        text += ` [${label}] ${cost.reasons.join(' / ')}`;
+    }
+    return text;
+}
+
+// 복사 버튼 이벤트 바인딩
+function bindCopyButton(codeWrapper, getSQL) {
+    const copyBtn = codeWrapper.querySelector('.copy-btn');
+    const copyBtnText = copyBtn.querySelector('span');
+
+    copyBtn.addEventListener('click', () => {
+        utils.copyToClipboard(getSQL());
+        copyBtnText.textContent = 'COPIED!';
+        const icon = copyBtn.querySelector('i');
+        icon.setAttribute('data-lucide', 'check');
+        lucide.createIcons();
+
+        setTimeout(() => {
+            copyBtnText.textContent = 'COPY';
+            icon.setAttribute('data-lucide', 'copy');
+            lucide.createIcons();
+        }, 2000);
+    });
+}
+
 // 테이블 생성 처리
 async function handleCreateTable() {
     ui.clearInputErrors(); // 기존 에러 초기화
@@ -201,9 +235,6 @@ async function handleCreateTable() {
         ui.updateDatabaseStatus(dbInfo);
         ui.renderTablesList(tablesData.tables, window.showTableInfo);
 
-        // 스키마 컨텍스트 갱신
-        schemaContext = await api.fetchSchemaContext();
-
         alert(`'${tableName}' 테이블이 생성되었습니다.`);
     } catch (error) {
         console.error('Table creation failed:', error);
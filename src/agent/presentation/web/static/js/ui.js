@@ -262,7 +262,7 @@ export function removeLoading() {
     if (loader) loader.remove();
 }
 
-export function addSQLMessage(query, explanation) {
+function buildSQLMessage(explanation) {
     hideWelcome();
     removeLoading();
 
@@ -296,10 +296,6 @@ export function addSQLMessage(query, explanation) {
     pre.className = 'language-sql'; // Prism class
     const code = document.createElement('code');
     code.className = 'language-sql';
-
-    // Format SQL for better readability
-    const formattedSQL = sqlFormatter.format(query, { language: 'sql' });
-    code.textContent = formattedSQL;
     pre.appendChild(code);
 
     codeWrapper.appendChild(codeHeader);
@@ -311,15 +307,50 @@ export function addSQLMessage(query, explanation) {
     wrapper.appendChild(container);
     messagesContainer.appendChild(wrapper);
 
+    return { codeWrapper, code, explanationBubble };
+}
+
+function renderFinalSQL(code, query) {
+    // Format SQL for better readability
+    code.textContent = sqlFormatter.format(query, { language: 'sql' });
+
     // Apply Prism highlighting
     Prism.highlightElement(code);
 
     lucide.createIcons();
     messagesContainer.scrollTop = messagesContainer.scrollHeight;
+}
+
+export function addSQLMessage(query, explanation) {
+    const { codeWrapper, code } = buildSQLMessage(explanation);
+    renderFinalSQL(code, query);
 
     return codeWrapper;
 }
 
+/**
+ * 스트리밍 SQL 메시지를 생성합니다.
+ * append()로 도착한 조각을 그대로 붙이고, finish()에서 포맷팅/하이라이팅합니다.
+ */
+export function addStreamingSQLMessage(explanation) {
+    const { codeWrapper, code, explanationBubble } = buildSQLMessage(explanation);
+    lucide.createIcons();
+
+    return {
+        codeWrapper,
+        append(delta) {
+            code.textContent += delta;
+            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        },
+        setExplanation(text) {
+            explanationBubble.innerHTML = marked.parse(text);
+        },
+        finish(query) {
+            renderFinalSQL(code, query);
+        }
+    };
+}
+
 export function updateDatabaseStatus(data) {
     const statusEl = document.getElementById('db-status');
     const typeEl = document.getElementById('db-type');
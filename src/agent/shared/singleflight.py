@@ -0,0 +1,50 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """동일 키의 동시 비동기 작업을 하나로 합치는 실행기.
+
+    같은 키로 진행 중인 작업이 있으면 새로 실행하지 않고 그 결과(또는 예외)를
+    공유합니다. 먼저 호출한 요청이 취소되어도 공유 작업은 계속 진행되므로 나중에
+    합류한 요청은 영향을 받지 않습니다.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """키에 해당하는 작업을 실행하거나 진행 중인 작업에 합류합니다.
+
+        Returns:
+            (결과, 다른 요청의 작업을 공유했는지 여부)
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self._coalesced += 1
+            return await asyncio.shield(future), True
+
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        self._executed += 1
+        future.add_done_callback(lambda f: self._forget(key, f))
+        return await asyncio.shield(future), False
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # 아무도 기다리지 않은 채 실패한 경우의 경고 방지
+            future.exception()
+
+    def stats(self) -> dict:
+        """실행/합류 통계를 반환합니다."""
+        return {
+            "in_flight": len(self._inflight),
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+        }
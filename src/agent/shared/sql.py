@@ -0,0 +1,133 @@
+import re
+from typing import Iterable
+
+# 문자열 리터럴, 따옴표 식별자, 주석
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|--[^\n]*|/\*.*?\*/", re.S)
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*")
+# FROM/JOIN 절의 "테이블 [AS] 별칭" (EXPLAIN QUERY PLAN은 별칭으로 표시)
+_TABLE_ALIAS = re.compile(
+    r"\b(?:from|join)\s+([A-Za-z_][\w.]*)(?:\s+(?:as\s+)?([A-Za-z_]\w*))?"
+    r"|,\s*([A-Za-z_][\w.]*)(?:\s+(?:as\s+)?([A-Za-z_]\w*))?",
+    re.I,
+)
+# 문장 위치(첫 단어, CTE 본문의 첫 단어, WITH 뒤 본 문장)에 오면 안 되는 키워드
+_FORBIDDEN = frozenset(
+    {
+        "insert", "update", "delete", "merge", "upsert", "replace", "create", "alter", "drop",
+        "truncate", "grant", "revoke", "attach", "detach", "pragma", "vacuum",
+        "reindex", "copy", "call", "lock",
+    }
+)
+_TOKEN = re.compile(r"[A-Za-z_][A-Za-z0-9_$]*|[(),.]")
+# SELECT ... FOR UPDATE/SHARE/NO KEY UPDATE/KEY SHARE
+_ROW_LOCKS = frozenset({"update", "share", "no", "key"})
+
+
+def scrub_sql(sql: str, keep_identifiers: bool = True) -> str:
+    """주석과 문자열 리터럴을 지웁니다. 따옴표 식별자는 이름만 남기거나 함께 지웁니다."""
+
+    def replace(match: re.Match) -> str:
+        token = match.group()
+        if keep_identifiers and token[0] in "\"`":
+            return " " + token[1:-1].replace('""', '"') + " "
+        return " "
+
+    return _LITERAL.sub(replace, sql)
+
+
+def normalize_sql(sql: str) -> str:
+    """캐시 키용 정규화: 주석 제거, 리터럴 밖 공백 축약, 끝의 세미콜론 제거."""
+    parts: list[str] = []
+    outside = ""
+    pos = 0
+    for match in _LITERAL.finditer(sql):
+        token = match.group()
+        outside += sql[pos : match.start()]
+        pos = match.end()
+        if token.startswith(("--", "/*")):
+            outside += " "
+            continue
+        parts += [re.sub(r"\s+", " ", outside), token]
+        outside = ""
+    parts.append(re.sub(r"\s+", " ", outside + sql[pos:]))
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def ensure_read_only(sql: str) -> None:
+    """단일 SELECT(또는 WITH ... SELECT) 문인지 확인합니다.
+
+    실제 실행도 읽기 전용 연결에서 이루어지므로, 이 검사는 명백히 잘못된 요청을
+    실행 전에 거르는 용도입니다.
+
+    Raises:
+        ValueError: 빈 문장, 여러 문장, SELECT가 아닌 문장
+    """
+    scrubbed = scrub_sql(sql, keep_identifiers=False).strip().rstrip(";").strip()
+    if not scrubbed:
+        raise ValueError("실행할 SQL이 없습니다.")
+    if ";" in scrubbed:
+        raise ValueError("한 번에 하나의 SQL 문만 실행할 수 있습니다.")
+
+    tokens = [t.lower() for t in _TOKEN.findall(scrubbed)]
+    if not tokens or tokens[0] not in ("select", "with"):
+        raise ValueError("SELECT 문만 실행할 수 있습니다.")
+
+    # 컬럼/테이블 이름과 겹칠 수 있으므로 키워드는 문장 위치에서만 검사
+    forbidden = {t for t in _statement_keywords(tokens) if t in _FORBIDDEN}
+    for prev, token, following in zip([""] + tokens, tokens, tokens[1:] + [""]):
+        if token == "into" and prev != ".":
+            forbidden.add("into")  # SELECT ... INTO (예약어라 이름으로 쓰려면 따옴표 필요)
+        elif token == "for" and prev != "." and following in _ROW_LOCKS:
+            forbidden.add(f"for {following}")
+    if forbidden:
+        raise ValueError(f"읽기 전용 질의에 허용되지 않는 키워드입니다: {', '.join(sorted(forbidden)).upper()}")
+
+
+def _statement_keywords(tokens: list[str]) -> list[str]:
+    """문장을 시작하는 단어들: 첫 단어, WITH 절 각 CTE 본문의 첫 단어, CTE 목록 뒤 본 문장의 첫 단어."""
+    keywords = tokens[:1]
+    if keywords != ["with"]:
+        return keywords
+
+    depth = 0
+    in_body = False
+    for prev, token, following in zip(tokens, tokens[1:], tokens[2:] + [""]):
+        if token == "(":
+            if depth == 0 and prev in ("as", "materialized"):
+                in_body = True
+                keywords.append(following)
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0 and in_body:
+                in_body = False
+                if following != ",":
+                    keywords.append(following)
+                    break
+    return keywords
+
+
+def referenced_tables(sql: str, known_tables: Iterable[str]) -> list[str]:
+    """SQL에 단어로 등장하는 알려진 테이블 이름 (캐시 무효화 범위 결정용)."""
+    words = {w.lower() for w in _WORD.findall(scrub_sql(sql))}
+    return sorted(t for t in known_tables if t.lower() in words)
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    """FROM/JOIN 절의 별칭 → 테이블 이름."""
+    aliases: dict[str, str] = {}
+    for match in _TABLE_ALIAS.finditer(scrub_sql(sql)):
+        table = match.group(1) or match.group(3)
+        alias = match.group(2) or match.group(4)
+        if alias and alias.lower() not in _NOT_ALIASES:
+            aliases[alias.lower()] = table.split(".")[-1]
+    return aliases
+
+
+_NOT_ALIASES = frozenset(
+    {
+        "where", "join", "inner", "left", "right", "full", "cross", "natural", "on", "using",
+        "group", "order", "limit", "having", "union", "except", "intersect", "window", "from",
+        "outer", "as", "offset", "fetch", "lateral",
+    }
+)
@@ -0,0 +1,63 @@
+import re
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키 등에 사용할 수 있도록 자연어 질의를 정규화합니다.
+
+    대소문자와 연속 공백, 끝의 구두점 차이만 흡수하며 의미는 바꾸지 않습니다.
+    """
+    return _WHITESPACE_RE.sub(" ", text).strip().rstrip("?.!").strip().lower()
+
+
+# snake_case/camelCase/숫자를 나눈 단어, 한글 덩어리
+_IDENTIFIER_TERM_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+|[가-힣]+")
+
+
+def stem_term(word: str) -> str:
+    """복수형 어미만 떼는 가벼운 어간 처리 (orders → order, categories → category)."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def identifier_terms(text: str) -> list[str]:
+    """식별자/자연어를 소문자 어간 단어 목록으로 나눕니다 (``customerId`` → customer, id)."""
+    return [stem_term(w.lower()) for w in _IDENTIFIER_TERM_RE.findall(text or "")]
+
+
+_QUOTED_RE = re.compile(r"'([^']*)'|\"([^\"]*)\"|“([^”]*)”|‘([^’]*)’")
+_DATE_RE = re.compile(r"\b(\d{4})[-/.](\d{1,2})(?:[-/.](\d{1,2}))?\b")
+_NUMBER_RE = re.compile(r"\d{1,3}(?:,\d{3})+(?!\d)|\d+(?:\.\d+)?")
+_WORD_RE = re.compile(r"[a-z]+")
+_NUMBER_WORDS = "zero one two three four five six seven eight nine ten eleven twelve".split()
+# "may"는 조동사와 구분할 수 없어 제외
+_MONTH_WORDS = "january february march april june july august september october november december".split()
+_LITERAL_WORDS = {
+    **{word: str(i) for i, word in enumerate(_NUMBER_WORDS)},
+    "twenty": "20",
+    "hundred": "100",
+    "thousand": "1000",
+    **{month: f"month:{month[:3]}" for month in _MONTH_WORDS},
+}
+
+
+def query_literals(text: str) -> tuple[str, ...]:
+    """질문에 들어 있는 리터럴(따옴표 문자열, 날짜, 숫자, 숫자/월 이름)을 정렬된 튜플로 반환합니다.
+
+    임베딩이 비슷해도 리터럴이 다르면 다른 SQL이 필요한 질문("top 5"/"top 10",
+    "2023년"/"2024년")을 구분하는 데 씁니다. 따옴표 문자열은 대소문자를 유지합니다.
+    """
+    literals = [next(g for g in m.groups() if g is not None) for m in _QUOTED_RE.finditer(text)]
+    rest = _QUOTED_RE.sub(" ", text).lower()
+
+    for year, month, day in _DATE_RE.findall(rest):
+        literals.append("-".join(str(int(part)) for part in (year, month, day) if part))
+    rest = _DATE_RE.sub(" ", rest)
+
+    literals += [number.replace(",", "") for number in _NUMBER_RE.findall(rest)]
+    literals += [_LITERAL_WORDS[w] for w in _WORD_RE.findall(rest) if w in _LITERAL_WORDS]
+    return tuple(sorted(literals))
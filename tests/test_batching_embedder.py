@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+
+from agent.infrastructure.vectorstore.batching_embedder import BatchingEmbedder
+
+
+def _slow_encoder(calls):
+    def encode(texts):
+        calls.append(list(texts))
+        time.sleep(0.02)
+        return [[float(len(t))] for t in texts]
+
+    return encode
+
+
+def test_concurrent_calls_share_batches():
+    calls = []
+    batcher = BatchingEmbedder(_slow_encoder(calls), max_batch_size=64, max_wait_ms=5)
+    results = {}
+
+    def worker(i):
+        results[i] = batcher.embed("q" * i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 33)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    assert results == {i: [float(i)] for i in range(1, 33)}
+    assert len(calls) < 32
+    assert sum(len(c) for c in calls) == 32
+
+
+def test_encoder_errors_propagate():
+    def failing(texts):
+        raise RuntimeError("model unavailable")
+
+    batcher = BatchingEmbedder(failing, max_wait_ms=0)
+    with pytest.raises(RuntimeError):
+        batcher.embed("hello")
+    batcher.close()
@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import create_engine
+
+from agent.infrastructure.database.bulk_loader import (
+    BulkRowLoader,
+    iter_csv_rows,
+    iter_ndjson_records,
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, note TEXT)")
+    return engine
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("SELECT COUNT(*) FROM items").scalar()
+
+
+def test_load_dicts_in_chunks():
+    engine = _engine()
+    result = BulkRowLoader(engine, chunk_size=3).load(
+        "items", ({"id": i, "name": f"n{i}"} for i in range(10))
+    )
+
+    assert (result.inserted, result.failed, result.chunks) == (10, 0, 4)
+    assert result.columns == ["id", "name"]
+    assert _count(engine) == 10
+
+
+def test_failed_chunk_is_rolled_back_and_loading_continues():
+    engine = _engine()
+    rows = [{"id": i, "name": None if i == 4 else f"n{i}"} for i in range(9)]
+    result = BulkRowLoader(engine, chunk_size=3).load("items", rows)
+
+    # 4번 행(NOT NULL 위반)이 있는 두 번째 청크만 실패
+    assert (result.inserted, result.failed) == (6, 3)
+    assert [(e.chunk, e.start_row, e.rows) for e in result.errors] == [(1, 3, 3)]
+    assert _count(engine) == 6
+
+
+def test_stop_on_error_and_unknown_columns():
+    engine = _engine()
+    rows = [{"id": 1, "name": None}, {"id": 2, "name": "b"}]
+    result = BulkRowLoader(engine, chunk_size=1).load("items", rows, stop_on_error=True)
+    assert result.stopped and result.inserted == 0
+
+    with pytest.raises(ValueError, match="missing"):
+        BulkRowLoader(engine).load("items", [{"id": 1, "missing": 1}])
+
+
+def test_relax_durability_restores_synchronous(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}", pool_size=1)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, note TEXT)")
+        before = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+
+    result = BulkRowLoader(engine).load("items", [{"id": 1, "name": "a"}], relax_durability=True)
+
+    assert result.inserted == 1
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == before
+
+
+def test_csv_stream_split_across_chunks():
+    data = 'id,name,note\n1,a,\n2,"multi\nline",x\n3,c,"q""uote"\n'.encode()
+    chunks = [data[i : i + 5] for i in range(0, len(data), 5)]
+    header, rows = iter_csv_rows(chunks)
+
+    assert header == ["id", "name", "note"]
+    assert list(rows) == [["1", "a", None], ["2", "multi\nline", "x"], ["3", "c", 'q"uote']]
+
+    engine = _engine()
+    header, rows = iter_csv_rows(chunks)
+    result = BulkRowLoader(engine, chunk_size=2).load("items", rows, columns=header)
+    assert result.inserted == 3
+
+
+def test_ndjson_records_and_short_rows():
+    records = list(iter_ndjson_records([b'{"id": 1, "name": "a"}\n\n{"id": 2,', b' "name": "b"}']))
+    assert records == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    engine = _engine()
+    result = BulkRowLoader(engine).load("items", [[1, "a", None], [2, "b"]], columns=["id", "name", "note"])
+    assert (result.inserted, result.failed) == (1, 1)
+    assert "expected 3 values" in result.errors[0].error
+
+
+def test_non_object_rows_are_reported_as_invalid():
+    engine = _engine()
+    result = BulkRowLoader(engine).load("items", [{"id": 1, "name": "a"}, 5, "ab"])
+
+    assert (result.inserted, result.failed) == (1, 2)
+    assert "row 1: expected object or array, got int" in result.errors[0].error
+    assert "row 2: expected object or array, got str" in result.errors[0].error
+
+
+def test_missing_dict_keys_fall_back_to_column_defaults():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL DEFAULT 'x', note TEXT)")
+    rows = [{"id": 1, "name": "a", "note": "n"}, {"id": 2}, {"id": 3, "note": "m"}, {}]
+    result = BulkRowLoader(engine).load("items", rows)
+
+    assert (result.inserted, result.failed) == (4, 0)
+    with engine.connect() as conn:
+        stored = conn.exec_driver_sql("SELECT id, name, note FROM items ORDER BY id").all()
+    assert [tuple(r) for r in stored] == [(1, "a", "n"), (2, "x", None), (3, "x", "m"), (4, "x", None)]
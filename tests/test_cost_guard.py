@@ -0,0 +1,131 @@
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from agent.application.use_cases.generate_sql import GenerateSQLRequest, GenerateSQLUseCase
+from agent.domain.services.sql_cost_guard import SQLCostGuard
+from agent.domain.services.sql_generator import SQLGenerator
+from agent.infrastructure.database.cost_guard import ExplainCostGuard
+
+
+def _guard() -> ExplainCostGuard:
+    # acheck는 워커 스레드에서 실행되므로 인메모리 DB를 스레드 간 공유
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE orders (id INTEGER PRIMARY KEY, customer_id INT, status TEXT)")
+        conn.exec_driver_sql("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.exec_driver_sql("CREATE INDEX ix_orders_customer ON orders (customer_id)")
+        conn.exec_driver_sql(
+            "WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s WHERE i < 2000) "
+            "INSERT INTO orders SELECT i, i % 100, 'new' FROM s"
+        )
+        conn.exec_driver_sql(
+            "WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s WHERE i < 100) "
+            "INSERT INTO customers SELECT i, 'c' || i FROM s"
+        )
+    return ExplainCostGuard(engine, warn_rows=1000, block_rows=100_000, full_scan_rows=1000)
+
+
+def test_index_lookups_are_ok():
+    guard = _guard()
+    verdict = guard.check(
+        "SELECT c.name FROM orders o JOIN customers c ON c.id = o.customer_id WHERE o.customer_id = 3"
+    )
+
+    assert verdict.verdict == "ok"
+    assert verdict.full_scans == []
+    assert verdict.plan
+
+
+def test_full_scan_of_large_table_warns():
+    verdict = _guard().check("SELECT * FROM orders WHERE status = 'new'")
+
+    assert verdict.verdict == "warn"
+    assert verdict.full_scans == ["orders"]
+    assert verdict.estimated_rows == 2000
+
+
+def test_cartesian_join_is_blocked_with_aliases():
+    verdict = _guard().check("SELECT * FROM orders AS o, customers c")
+
+    assert verdict.verdict == "block"
+    assert set(verdict.full_scans) == {"orders", "customers"}
+    assert verdict.estimated_rows == 2000 * 100
+    assert any("카티션" in reason for reason in verdict.reasons)
+
+
+def test_unplannable_sql_warns_without_raising():
+    guard = _guard()
+    assert guard.check("SELECT * FROM missing_table").verdict == "warn"
+    assert guard.check("DELETE FROM orders").verdict == "warn"
+
+
+class _ScriptedGenerator(SQLGenerator):
+    def __init__(self, outputs: list[str]):
+        self._outputs = outputs
+        self.contexts: list[str] = []
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        self.contexts.append(schema_context)
+        return self._outputs[len(self.contexts) - 1]
+
+
+class _MemoryRepository:
+    def save(self, query_log):
+        return query_log
+
+    async def asave(self, query_log):
+        return query_log
+
+
+def test_blocked_sql_is_regenerated_once_with_plan_feedback():
+    generator = _ScriptedGenerator(
+        ["SELECT * FROM orders, customers", "SELECT * FROM orders WHERE customer_id = 1"]
+    )
+    use_case = GenerateSQLUseCase(
+        query_log_repository=_MemoryRepository(),
+        sql_generator=generator,
+        cost_guard=_guard(),
+        retry_on_block=True,
+    )
+
+    result = asyncio.run(use_case.aexecute(GenerateSQLRequest(user_query="q", schema_context="schema")))
+
+    assert result.regenerated is True
+    assert result.generated_sql == "SELECT * FROM orders WHERE customer_id = 1"
+    assert result.cost["verdict"] == "ok"
+    assert "rejected" in generator.contexts[1] and "SCAN" in generator.contexts[1]
+
+
+class _CountingGuard(SQLCostGuard):
+    def __init__(self, guard: SQLCostGuard):
+        self._guard = guard
+        self.checked: list[str] = []
+
+    def check(self, sql: str):
+        self.checked.append(sql)
+        return self._guard.check(sql)
+
+
+def test_stream_retry_reuses_the_first_verdict():
+    blocked, rewritten = "SELECT * FROM orders, customers", "SELECT * FROM orders WHERE customer_id = 1"
+    guard = _CountingGuard(_guard())
+    use_case = GenerateSQLUseCase(
+        query_log_repository=_MemoryRepository(),
+        sql_generator=_ScriptedGenerator([blocked, rewritten]),
+        cost_guard=guard,
+        retry_on_block=True,
+    )
+
+    async def collect():
+        return [e async for e in use_case.astream(GenerateSQLRequest(user_query="q", schema_context="schema"))]
+
+    events = asyncio.run(collect())
+
+    assert [e.event for e in events] == ["tables", "delta", "retry", "done"]
+    assert events[-1].data["generated_sql"] == rewritten
+    # 차단된 SQL의 EXPLAIN은 한 번만
+    assert guard.checked == [blocked, rewritten]
@@ -0,0 +1,20 @@
+from agent.infrastructure.vectorstore.embedding_cache import QueryEmbeddingCache
+
+
+def test_normalized_variants_share_entry():
+    cache = QueryEmbeddingCache(max_size=2)
+    cache.put(cache.key("Top  customers?"), [0.1, 0.2])
+
+    assert cache.get(cache.key("top customers")) == [0.1, 0.2]
+    assert cache.stats()["hits"] == 1
+
+
+def test_lru_eviction():
+    cache = QueryEmbeddingCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    cache.get("a")
+    cache.put("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
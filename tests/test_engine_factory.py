@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from agent.config import Settings
+from agent.infrastructure.database.engine_factory import (
+    create_engine_from_settings,
+    get_pool_stats,
+    resolve_profile,
+)
+
+
+def _engine(tmp_path, **overrides):
+    config = Settings(database_url=f"sqlite:///{tmp_path / 'test.db'}", **overrides)
+    return create_engine_from_settings(config)
+
+
+def test_sqlite_pragmas_applied_per_connection(tmp_path):
+    engine = _engine(tmp_path, database_profile="low_memory")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -8 * 1024
+    engine.dispose()
+
+
+def test_pool_stats_track_checkouts_and_overflow(tmp_path):
+    engine = _engine(tmp_path, database_pool_size=1, database_max_overflow=1)
+    first = engine.connect()
+    second = engine.connect()
+
+    stats = get_pool_stats(engine)
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["peak_checked_out"] == 2
+
+    released = threading.Timer(0.05, first.close)
+    released.start()
+    with engine.connect():
+        pass
+    released.join()
+    second.close()
+
+    stats = get_pool_stats(engine)
+    assert stats["checkouts"] == 3
+    assert stats["waits"] == 1
+    engine.dispose()
+
+
+def test_unlimited_overflow_never_counts_as_waiting(tmp_path):
+    engine = _engine(tmp_path, database_pool_size=1, database_max_overflow=-1)
+    connections = [engine.connect() for _ in range(3)]
+    for conn in connections:
+        conn.close()
+
+    stats = get_pool_stats(engine)
+    assert stats["peak_checked_out"] == 3
+    assert stats["waits"] == 0
+    engine.dispose()
+
+
+def test_unknown_profile_rejected():
+    with pytest.raises(ValueError):
+        resolve_profile(Settings(database_profile="nope"))
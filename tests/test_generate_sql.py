@@ -0,0 +1,261 @@
+import asyncio
+
+from agent.application.use_cases.generate_sql import GenerateSQLRequest, GenerateSQLUseCase
+from agent.domain.entities.query_log import QueryLogStatus
+from agent.domain.services.schema_retriever import RetrievedSchema, SchemaRetriever
+from agent.domain.services.sql_generator import SQLGenerator
+
+
+class _StreamingGenerator(SQLGenerator):
+    def __init__(self, deltas: list[str], fail_after: int | None = None, hang_after: int | None = None):
+        self._deltas = deltas
+        self._fail_after = fail_after
+        self._hang_after = hang_after
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        raise AssertionError("동기 경로를 사용하면 안 됨")
+
+    async def astream(self, user_query: str, schema_context: str):
+        for i, delta in enumerate(self._deltas):
+            if i == self._fail_after:
+                raise RuntimeError("LLM unavailable")
+            if i == self._hang_after:
+                await asyncio.Event().wait()
+            yield delta
+
+
+class _StaticRetriever(SchemaRetriever):
+    def retrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        return [RetrievedSchema("orders", "Table: orders.", 1.0, {})]
+
+    def format_context(self, schemas: list[RetrievedSchema]) -> str:
+        return "Table: orders."
+
+    def build_context(self, query: str, top_k: int = 5) -> str:
+        return "Table: orders."
+
+
+class _RecordingRepository:
+    """저장 시점마다 QueryLog 상태를 기록."""
+
+    def __init__(self):
+        self.saved: list[tuple[str, QueryLogStatus]] = []
+        self.logs = {}
+
+    def save(self, query_log):
+        raise AssertionError("이벤트 루프에서 블로킹 save를 호출하면 안 됨")
+
+    async def asave(self, query_log):
+        self.saved.append((str(query_log.id), query_log.status))
+        self.logs[str(query_log.id)] = query_log
+        return query_log
+
+
+def _use_case(generator: SQLGenerator, repository: _RecordingRepository) -> GenerateSQLUseCase:
+    return GenerateSQLUseCase(
+        query_log_repository=repository,
+        sql_generator=generator,
+        schema_retriever=_StaticRetriever(),
+    )
+
+
+async def _collect(use_case: GenerateSQLUseCase) -> list:
+    return [e async for e in use_case.astream(GenerateSQLRequest(user_query="orders per day"))]
+
+
+def test_stream_emits_tables_deltas_then_done_and_completes_the_log():
+    repository = _RecordingRepository()
+    events = asyncio.run(_collect(_use_case(_StreamingGenerator(["SELECT ", "* ", "FROM orders"]), repository)))
+
+    assert [e.event for e in events] == ["tables", "delta", "delta", "delta", "done"]
+    assert events[0].data["tables"] == ["orders"]
+    query_log_id = events[0].data["query_log_id"]
+    assert events[-1].data["query_log_id"] == query_log_id
+    assert events[-1].data["generated_sql"] == "SELECT * FROM orders"
+    # 시작 시 PROCESSING으로 저장해 id를 먼저 확정하고, 끝나면 COMPLETED로 갱신
+    assert repository.saved == [
+        (query_log_id, QueryLogStatus.PROCESSING),
+        (query_log_id, QueryLogStatus.COMPLETED),
+    ]
+
+
+def test_stream_failure_ends_with_error_event_and_failed_log():
+    repository = _RecordingRepository()
+    events = asyncio.run(
+        _collect(_use_case(_StreamingGenerator(["SELECT ", "1"], fail_after=1), repository))
+    )
+
+    assert [e.event for e in events] == ["tables", "delta", "error"]
+    assert events[-1].data["message"] == "LLM unavailable"
+    assert repository.saved[-1] == (events[0].data["query_log_id"], QueryLogStatus.FAILED)
+
+
+def test_cancelled_stream_marks_the_log_failed():
+    repository = _RecordingRepository()
+    use_case = _use_case(_StreamingGenerator(["SELECT ", "1"], hang_after=1), repository)
+    received = []
+
+    async def consume():
+        async for event in use_case.astream(GenerateSQLRequest(user_query="orders per day")):
+            received.append(event.event)
+
+    async def main():
+        task = asyncio.create_task(consume())
+        while received != ["tables", "delta"]:
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+
+    assert received == ["tables", "delta"]
+    query_log = next(iter(repository.logs.values()))
+    assert query_log.status == QueryLogStatus.FAILED
+    assert query_log.error_message == "Stream cancelled by client"
+    assert [status for _, status in repository.saved] == [QueryLogStatus.PROCESSING, QueryLogStatus.FAILED]
+
+
+class _BatchGenerator(SQLGenerator):
+    """동시에 실행 중인 agenerate 수의 최댓값을 기록."""
+
+    def __init__(self, failing: set[str] = frozenset()):
+        self._failing = failing
+        self.active = 0
+        self.peak = 0
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        raise AssertionError("동기 경로를 사용하면 안 됨")
+
+    async def agenerate(self, user_query: str, schema_context: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if user_query in self._failing:
+                raise RuntimeError(f"cannot answer {user_query}")
+            return f"SELECT '{user_query}'"
+        finally:
+            self.active -= 1
+
+
+class _CountingRetriever(_StaticRetriever):
+    def __init__(self):
+        self.retrieve_calls = 0
+        self.retrieve_many_calls: list[list[str]] = []
+
+    def retrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        self.retrieve_calls += 1
+        return super().retrieve(query, top_k)
+
+    def retrieve_many(self, queries: list[str], top_k: int = 5) -> list[list[RetrievedSchema]]:
+        self.retrieve_many_calls.append(list(queries))
+        return [_StaticRetriever.retrieve(self, q, top_k) for q in queries]
+
+
+class _BatchRepository(_RecordingRepository):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list] = []
+
+    async def asave_all(self, query_logs):
+        self.batches.append(list(query_logs))
+        return query_logs
+
+
+def test_batch_reports_item_errors_without_failing_the_batch():
+    repository = _BatchRepository()
+    retriever = _CountingRetriever()
+    use_case = GenerateSQLUseCase(
+        query_log_repository=repository,
+        sql_generator=_BatchGenerator(failing={"q1"}),
+        schema_retriever=retriever,
+    )
+    queries = ["q0", "q1", "q2"]
+
+    items = asyncio.run(use_case.aexecute_batch([GenerateSQLRequest(user_query=q) for q in queries], 4))
+
+    assert [item.index for item in items] == [0, 1, 2]
+    assert [item.status for item in items] == ["completed", "failed", "completed"]
+    assert items[0].generated_sql == "SELECT 'q0'" and items[0].used_tables == ["orders"]
+    assert items[1].error == "cannot answer q1" and items[1].generated_sql is None
+    # 검색은 한 번의 일괄 호출, QueryLog는 마지막에 한 번에 저장
+    assert retriever.retrieve_many_calls == [queries]
+    assert retriever.retrieve_calls == 0
+    assert len(repository.batches) == 1
+    assert [log.status for log in repository.batches[0]] == [
+        QueryLogStatus.COMPLETED,
+        QueryLogStatus.FAILED,
+        QueryLogStatus.COMPLETED,
+    ]
+
+
+def test_batch_caps_llm_concurrency():
+    generator = _BatchGenerator()
+    use_case = GenerateSQLUseCase(
+        query_log_repository=_BatchRepository(),
+        sql_generator=generator,
+        schema_retriever=_CountingRetriever(),
+    )
+
+    items = asyncio.run(
+        use_case.aexecute_batch([GenerateSQLRequest(user_query=f"q{i}") for i in range(10)], max_concurrency=3)
+    )
+
+    assert all(item.error is None for item in items)
+    assert generator.peak == 3
+
+
+def test_batch_route_rejects_too_many_queries(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from agent.config import settings
+    from agent.presentation.api.routes.query_routes import router
+
+    app = FastAPI()
+    app.include_router(router)
+    monkeypatch.setattr(settings, "batch_max_items", 2)
+
+    response = TestClient(app).post("/api/query/generate/batch", json={"queries": ["a", "b", "c"]})
+
+    assert response.status_code == 413
+    assert "max 2" in response.json()["detail"]
+
+
+class _AsyncGenerator(SQLGenerator):
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        raise AssertionError("동기 경로를 사용하면 안 됨")
+
+    async def agenerate(self, user_query: str, schema_context: str) -> str:
+        self.calls.append(schema_context)
+        return "SELECT COUNT(*) FROM orders"
+
+
+class _AsyncRetriever(_StaticRetriever):
+    def retrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        raise AssertionError("동기 경로를 사용하면 안 됨")
+
+    async def aretrieve(self, query: str, top_k: int = 5) -> list[RetrievedSchema]:
+        return _StaticRetriever.retrieve(self, query, top_k)
+
+
+def test_aexecute_uses_async_ports_and_persists_completed_log():
+    repository = _RecordingRepository()
+    generator = _AsyncGenerator()
+    use_case = GenerateSQLUseCase(
+        query_log_repository=repository,
+        sql_generator=generator,
+        schema_retriever=_AsyncRetriever(),
+    )
+
+    result = asyncio.run(use_case.aexecute(GenerateSQLRequest(user_query="how many orders")))
+
+    assert result.generated_sql == "SELECT COUNT(*) FROM orders"
+    assert result.status == "completed"
+    assert result.used_tables == ["orders"]
+    assert generator.calls == ["Table: orders."]
+    assert repository.saved == [(result.query_log_id, QueryLogStatus.COMPLETED)]
+    assert repository.logs[result.query_log_id].generated_sql == result.generated_sql
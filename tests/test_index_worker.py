@@ -0,0 +1,108 @@
+import time
+
+from agent.application.services.index_worker import IndexWorker
+from agent.config import settings
+
+
+class _RecordingIndexer:
+    def __init__(self):
+        self.batches = []
+
+    def apply_changes(self, index_names, remove_names):
+        self.batches.append((sorted(index_names), sorted(remove_names)))
+        return len(index_names)
+
+
+def test_repeated_changes_collapse_into_one_batch():
+    indexer = _RecordingIndexer()
+    worker = IndexWorker(indexer, debounce_seconds=60)
+    worker.start()
+    try:
+        for _ in range(50):
+            worker.index_table("users")
+        worker.index_table("orders")
+        worker.remove_table("legacy")
+
+        assert indexer.batches == []
+        assert worker.wait(timeout=5)
+    finally:
+        worker.stop(timeout=5)
+
+    assert indexer.batches == [(["orders", "users"], ["legacy"])]
+    assert worker.stats()["coalesced"] == 49
+
+
+def test_latest_action_wins_and_stop_drains_queue():
+    indexer = _RecordingIndexer()
+    worker = IndexWorker(indexer, debounce_seconds=60)
+    worker.start()
+    worker.index_table("users")
+    worker.remove_table("users")
+    worker.stop(timeout=5)
+
+    assert indexer.batches == [([], ["users"])]
+
+
+class _FlakyIndexer(_RecordingIndexer):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def apply_changes(self, index_names, remove_names):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("chroma unavailable")
+        return super().apply_changes(index_names, remove_names)
+
+
+def test_failed_update_is_reported_and_retried_with_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "index_retry_backoff_seconds", 0.05)
+    indexer = _FlakyIndexer(failures=2)
+    worker = IndexWorker(indexer, debounce_seconds=60)
+    worker.start()
+    try:
+        worker.index_table("users")
+        # 실패한 변경은 반영된 것으로 보고하지 않음
+        assert worker.wait(timeout=5) is False
+        assert worker.stats()["failed_tables"] == ["users"]
+
+        deadline = time.monotonic() + 5
+        while worker.stats()["failed_tables"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert worker.wait(timeout=5) is True
+    finally:
+        worker.stop(timeout=5)
+
+    assert indexer.batches == [(["users"], [])]
+    stats = worker.stats()
+    assert (stats["failures"], stats["retries"], stats["applied"]) == (2, 2, 1)
+
+
+def test_retry_does_not_overwrite_a_newer_submit():
+    indexer = _FlakyIndexer(failures=1)
+    worker = IndexWorker(indexer, debounce_seconds=60)
+    worker.start()
+    try:
+        worker.index_table("users")
+        assert worker.wait(timeout=5) is False
+        worker.remove_table("users")
+        assert worker.wait(timeout=5) is True
+    finally:
+        worker.stop(timeout=5)
+
+    assert indexer.batches == [([], ["users"])]
+
+
+def test_continuous_changes_are_applied_within_max_delay():
+    indexer = _RecordingIndexer()
+    worker = IndexWorker(indexer, debounce_seconds=0.2, max_delay_seconds=0.3)
+    worker.start()
+    try:
+        # 디바운스보다 자주 바뀌어도 첫 변경 후 max_delay 안에 적용
+        deadline = time.monotonic() + 1.0
+        while not indexer.batches and time.monotonic() < deadline:
+            worker.index_table("users")
+            time.sleep(0.05)
+        assert indexer.batches == [(["users"], [])]
+    finally:
+        worker.stop(timeout=5)
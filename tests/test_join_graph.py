@@ -0,0 +1,129 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from agent.application.services.index_worker import IndexWorker
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.infrastructure.database.join_graph import JoinGraph
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache
+from agent.infrastructure.vectorstore.schema_retriever import ChromaSchemaRetriever
+from tests.test_schema_indexer import _FakeChroma, _SearchChroma
+
+
+def _indexed(graph: JoinGraph):
+    # 인덱스 워커 스레드와 인메모리 DB를 공유
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("CREATE TABLE orders (id INTEGER PRIMARY KEY, customer_id INTEGER REFERENCES customers(id))")
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE order_items (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), "
+                "product_id INTEGER REFERENCES products)"
+            )
+        )
+        conn.execute(text("CREATE TABLE audit_log (id INTEGER PRIMARY KEY, payload TEXT)"))
+    service = SchemaService(engine)
+    chroma = _FakeChroma()
+    indexer = SchemaIndexer(
+        service, chroma_client=chroma, retrieval_cache=RetrievalCache(), lexical_index=None, join_graph=graph
+    )
+    indexer.sync_all_tables()
+    return indexer, service, chroma
+
+
+def test_plan_adds_bridge_tables_on_shortest_join_path():
+    graph = JoinGraph(max_hops=4, max_bridges=3)
+    _indexed(graph)
+
+    plan = graph.plan(["customers", "products"])
+
+    assert plan.bridges == ["orders", "order_items"]
+    # 참조 컬럼이 생략된 FK는 참조 테이블의 PK로 채움
+    assert [str(k) for k in plan.join_keys["products"]] == ["order_items.product_id = products.id"]
+    assert {str(k) for keys in plan.join_keys.values() for k in keys} == {
+        "orders.customer_id = customers.id",
+        "order_items.order_id = orders.id",
+        "order_items.product_id = products.id",
+    }
+
+    direct = graph.plan(["orders", "customers"])
+    assert direct.bridges == []
+    assert [str(k) for k in direct.join_keys["customers"]] == ["orders.customer_id = customers.id"]
+
+    assert graph.plan(["customers", "audit_log"]).unreachable == ["audit_log"]
+    assert JoinGraph(max_hops=2, max_bridges=3).plan(["customers", "products"]).bridges == []
+
+
+def test_graph_follows_ddl_through_indexer():
+    graph = JoinGraph(max_hops=4, max_bridges=3)
+    indexer, service, chroma = _indexed(graph)
+
+    with service._engine.begin() as conn:
+        conn.execute(text("DROP TABLE order_items"))
+        conn.execute(
+            text(
+                "CREATE TABLE reviews (id INTEGER PRIMARY KEY, customer_id INTEGER REFERENCES customers(id), "
+                "product_id INTEGER REFERENCES products(id))"
+            )
+        )
+    service.refresh_metadata()
+    indexer.apply_changes(["reviews"], ["order_items"])
+
+    assert graph.plan(["orders", "products"]).bridges == ["customers", "reviews"]
+    assert graph.neighbors("orders") == ["customers"]
+
+    # 이름 변경은 참조하는 테이블의 FK도 바꿈 (SQLite)
+    with service._engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE payments (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id))")
+        )
+    service.refresh_metadata()
+    indexer.apply_changes(["payments"], [])
+    worker = IndexWorker(indexer, debounce_seconds=60)
+    worker.start()
+    service.set_indexer(worker)
+    chroma.upserted.clear()
+    try:
+        service.rename_table("orders", "purchases")
+        assert service.wait_for_index(timeout=5)
+    finally:
+        worker.stop(timeout=5)
+
+    assert graph.plan(["customers", "payments"]).bridges == ["purchases"]
+    assert "orders" not in graph.table_names()
+    column = {c.name: c for c in service.get_table_info("payments").columns}["order_id"]
+    assert column.foreign_key == "purchases.id"
+    assert sorted(chroma.upserted) == ["payments", "purchases"]
+
+
+def test_retriever_appends_bridges_and_join_keys_to_context():
+    graph = JoinGraph(max_hops=4, max_bridges=3)
+    _, _, indexed = _indexed(graph)
+    chroma = _SearchChroma(
+        [
+            {"table_name": "customers", "document": "Table: customers.", "metadata": {}, "distance": 0.2},
+            {"table_name": "products", "document": "Table: products.", "metadata": {}, "distance": 0.3},
+        ],
+        stored={
+            name: {"table_name": name, "document": f"Table: {name}.", "metadata": metadata}
+            for name, metadata in indexed.metadatas.items()
+        },
+    )
+    retriever = ChromaSchemaRetriever(chroma, join_graph=graph)
+
+    schemas = retriever.retrieve("which customers bought which products", top_k=2)
+
+    assert [(s.table_name, s.bridge) for s in schemas] == [
+        ("customers", False),
+        ("products", False),
+        ("orders", True),
+        ("order_items", True),
+    ]
+    assert retriever.format_context(schemas).endswith(
+        "Join keys: order_items.product_id = products.id; orders.customer_id = customers.id; "
+        "order_items.order_id = orders.id"
+    )
@@ -0,0 +1,93 @@
+from sqlalchemy import create_engine, text
+
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.vectorstore.lexical_index import SchemaLexicalIndex
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache
+from agent.infrastructure.vectorstore.schema_retriever import ChromaSchemaRetriever
+from tests.test_schema_indexer import _FakeChroma, _SearchChroma
+
+
+def _indexed(lexical: SchemaLexicalIndex):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, city TEXT)"))
+        conn.execute(text("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price NUMERIC)"))
+        conn.execute(
+            text(
+                "CREATE TABLE orders (id INTEGER PRIMARY KEY, "
+                "customer_id INTEGER REFERENCES customers(id), shipping_city TEXT, ordered_at DATETIME)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE order_items (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), "
+                "product_id INTEGER REFERENCES products(id), quantity INTEGER)"
+            )
+        )
+    service = SchemaService(engine)
+    indexer = SchemaIndexer(
+        service, chroma_client=_FakeChroma(), retrieval_cache=RetrievalCache(), lexical_index=lexical
+    )
+    indexer.sync_all_tables()
+    return indexer, service
+
+
+def test_bm25_ranks_tables_by_identifier_overlap():
+    lexical = SchemaLexicalIndex(skip_coverage=0.8)
+    _indexed(lexical)
+
+    result = lexical.search("total quantity of order_items per product", top_k=3)
+
+    assert result.hits[0].table_name == "order_items"
+    assert result.hits[0].exact
+    assert "quantity" in result.hits[0].matched_columns
+    assert result.confident
+
+
+def test_indexer_keeps_lexical_index_in_sync():
+    lexical = SchemaLexicalIndex()
+    indexer, service = _indexed(lexical)
+    assert len(lexical) == 4
+
+    with service._engine.begin() as conn:
+        conn.execute(text("DROP TABLE order_items"))
+        conn.execute(text("ALTER TABLE products ADD COLUMN supplier TEXT"))
+    service.refresh_metadata()
+    indexer.apply_changes(["products"], ["order_items"])
+
+    assert lexical.entry("order_items") is None
+    assert "supplier" in lexical.entry("products").column_fragments
+    assert lexical.search("supplier").hits[0].table_name == "products"
+
+
+def test_confident_lexical_match_skips_vector_search():
+    lexical = SchemaLexicalIndex(skip_coverage=0.8)
+    _indexed(lexical)
+    chroma = _SearchChroma([])
+
+    schemas = ChromaSchemaRetriever(chroma, lexical_index=lexical).retrieve("customers city", top_k=2)
+
+    assert chroma.queries == []
+    assert schemas[0].table_name == "customers"
+    assert schemas[0].document.startswith("Table: customers. Columns: id (INTEGER PK)")
+
+
+def test_hybrid_fuses_vector_and_lexical_rankings_with_rrf():
+    lexical = SchemaLexicalIndex(skip_coverage=0.8)
+    _indexed(lexical)
+    # 벡터 검색은 의미로 customers를, 렉시컬 검색은 "shipping" 식별자로 orders를 찾음
+    chroma = _SearchChroma(
+        [
+            {"table_name": "customers", "document": "Table: customers.", "metadata": {}, "distance": 0.3},
+            {"table_name": "orders", "document": "Table: orders.", "metadata": {}, "distance": 0.6},
+        ]
+    )
+
+    schemas = ChromaSchemaRetriever(chroma, lexical_index=lexical).retrieve(
+        "which buyers had purchases delivered abroad by shipping", top_k=2
+    )
+
+    assert len(chroma.queries) == 1
+    assert [s.table_name for s in schemas] == ["orders", "customers"]
+    assert schemas[0].matched_columns == ["shipping_city"]
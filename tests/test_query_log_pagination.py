@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from agent.application.use_cases.list_query_logs import ListQueryLogsRequest, ListQueryLogsUseCase
+from agent.domain.entities.query_log import QueryLog, QueryLogStatus
+from agent.infrastructure.database.connection import Base
+from agent.infrastructure.repositories.sqlalchemy_query_log_repository import (
+    SQLAlchemyQueryLogRepository,
+)
+
+START = datetime(2026, 1, 1)
+
+
+def _repository(count: int) -> SQLAlchemyQueryLogRepository:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    repository = SQLAlchemyQueryLogRepository(Session(engine))
+    logs = []
+    for i in range(count):
+        # 같은 created_at을 가진 로그가 섞이도록 3개씩 묶음
+        log = QueryLog(user_query=f"q{i}", created_at=START + timedelta(minutes=i // 3))
+        log.complete("SELECT 1") if i % 2 else log.fail("boom")
+        logs.append(log)
+    repository.save_all(logs)
+    return repository
+
+
+def test_keyset_pages_cover_every_log_once_in_order():
+    repository = _repository(25)
+    use_case = ListQueryLogsUseCase(repository)
+
+    seen, cursor = [], None
+    while True:
+        page = use_case.execute(ListQueryLogsRequest(limit=10, cursor=cursor))
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len({log.id for log in seen}) == 25
+    keys = [(log.created_at, str(log.id)) for log in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_status_and_time_filters():
+    repository = _repository(30)
+    page = ListQueryLogsUseCase(repository).execute(
+        ListQueryLogsRequest(
+            limit=100,
+            status=QueryLogStatus.COMPLETED,
+            created_from=START + timedelta(minutes=5),
+        )
+    )
+
+    assert page.next_cursor is None
+    assert page.items
+    assert all(log.status is QueryLogStatus.COMPLETED for log in page.items)
+    assert all(log.created_at >= START + timedelta(minutes=5) for log in page.items)
+
+
+def test_iter_logs_streams_in_batches():
+    repository = _repository(23)
+    assert len(list(repository.iter_logs(batch_size=5))) == 23
@@ -0,0 +1,84 @@
+import gzip
+import json
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+
+from agent.domain.entities.query_log import QueryLog
+from agent.infrastructure.database.connection import Base
+from agent.infrastructure.database.models import QueryLogModel
+from agent.infrastructure.repositories.query_log_retention import (
+    QueryLogRetention,
+    get_daily_rollups,
+)
+from agent.infrastructure.repositories.query_log_writer import QueryLogWriter
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'logs.db'}")
+    Base.metadata.create_all(engine)
+
+    writer = QueryLogWriter(engine, flush_interval_ms=60_000)
+    # 3월 1일 7건, 3월 2일 3건 (보존 대상), 3월 9일 2건 (유지)
+    for i in range(7):
+        log = QueryLog(user_query="top" if i < 4 else f"q{i}", created_at=datetime(2026, 3, 1, 9, i))
+        log.complete("SELECT 1") if i % 3 else log.fail("boom")
+        writer.submit(log)
+    for i in range(3):
+        writer.submit(QueryLog(user_query=f"d2-{i}", created_at=datetime(2026, 3, 2, 23, 59, i)))
+    for i in range(2):
+        writer.submit(QueryLog(user_query=f"recent{i}", created_at=datetime(2026, 3, 9, 8, i)))
+    writer.flush()
+    return engine
+
+
+def _remaining(engine):
+    with engine.connect() as conn:
+        return conn.scalar(select(func.count()).select_from(QueryLogModel))
+
+
+def test_archives_old_days_in_chunks_and_keeps_rollups(tmp_path):
+    engine = _engine(tmp_path)
+    retention = QueryLogRetention(
+        engine, retention_days=7, archive_dir=tmp_path / "archive", chunk_size=3, pause_ms=0
+    )
+
+    result = retention.run(now=NOW)
+
+    assert result.days == [date(2026, 3, 1), date(2026, 3, 2)]
+    assert result.archived == result.deleted == 10
+    assert _remaining(engine) == 2
+
+    with gzip.open(retention.archive_path(date(2026, 3, 1)), "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 7
+    assert [line["created_at"] for line in lines] == sorted(line["created_at"] for line in lines)
+
+    with engine.connect() as conn:
+        rollups = get_daily_rollups(conn, date(2026, 3, 1), date(2026, 3, 9))
+    first = rollups[0]
+    assert (first["total"], first["completed"], first["failed"], first["archived_rows"]) == (7, 4, 3, 7)
+    assert first["top_questions"][0] == {"question": "top", "count": 4}
+    assert rollups[1]["pending"] == 3
+
+
+def test_rerun_is_noop_and_dry_run_writes_nothing(tmp_path):
+    engine = _engine(tmp_path)
+    archive_dir = tmp_path / "archive"
+
+    dry = QueryLogRetention(engine, retention_days=7, archive_dir=archive_dir).run(now=NOW, dry_run=True)
+    assert dry.archived == 10 and dry.deleted == 0
+    assert _remaining(engine) == 12
+    assert not archive_dir.exists()
+
+    retention = QueryLogRetention(engine, retention_days=7, archive_dir=archive_dir, pause_ms=0)
+    retention.run(now=NOW)
+    again = retention.run(now=NOW)
+    assert again.days == [] and again.archived == 0
+
+
+def test_cutoff_rounds_down_to_day_boundary():
+    retention = QueryLogRetention(None, retention_days=30)
+    assert retention.cutoff(NOW) == datetime(2026, 3, 10) - timedelta(days=30)
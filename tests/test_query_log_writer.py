@@ -0,0 +1,86 @@
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import StaticPool
+
+from agent.domain.entities.query_log import QueryLog, QueryLogStatus
+from agent.infrastructure.database.connection import Base
+from agent.infrastructure.database.models import QueryLogModel  # noqa: F401
+from agent.infrastructure.repositories.query_log_writer import QueryLogWriter
+
+
+def _engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, executemany: statements.append(statement),
+    )
+    return engine, statements
+
+
+def _rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT user_query, status FROM query_logs ORDER BY user_query")).all()
+
+
+def test_processing_then_completed_collapses_into_one_insert():
+    engine, statements = _engine()
+    writer = QueryLogWriter(engine, flush_interval_ms=60_000)
+
+    logs = [QueryLog(user_query=f"q{i}") for i in range(3)]
+    for log in logs:
+        log.mark_processing()
+        writer.submit(log)
+        log.complete("SELECT 1")
+        writer.submit(log)
+
+    assert writer.flush() == 3
+    assert len([s for s in statements if s.startswith("INSERT")]) == 1
+    assert _rows(engine) == [("q0", "completed"), ("q1", "completed"), ("q2", "completed")]
+    assert writer.stats()["collapsed"] == 3
+
+
+def test_update_after_flush_upserts():
+    engine, _ = _engine()
+    writer = QueryLogWriter(engine, flush_interval_ms=60_000)
+
+    log = QueryLog(user_query="q")
+    log.mark_processing()
+    writer.submit(log)
+    writer.flush()
+    log.fail("boom")
+    writer.submit(log)
+    writer.flush()
+
+    assert _rows(engine) == [("q", "failed")]
+
+
+def test_full_buffer_falls_back_to_direct_write():
+    engine, _ = _engine()
+    writer = QueryLogWriter(engine, flush_interval_ms=60_000, max_pending=1, enqueue_timeout_seconds=0.01)
+
+    writer.submit(QueryLog(user_query="a"))
+    writer.submit(QueryLog(user_query="b"))
+
+    stats = writer.stats()
+    assert stats["backpressure_waits"] == 1
+    assert stats["direct_writes"] == 1
+    assert writer.pending_rows()[0]["user_query"] == "a"
+    writer.close()
+    assert [r[0] for r in _rows(engine)] == ["a", "b"]
+
+
+def test_close_flushes_pending_logs():
+    engine, _ = _engine()
+    writer = QueryLogWriter(engine, flush_interval_ms=60_000)
+    writer.start()
+    log = QueryLog(user_query="q")
+    log.complete("SELECT 1")
+    writer.submit(log)
+
+    writer.close()
+
+    assert _rows(engine) == [("q", QueryLogStatus.COMPLETED.value)]
@@ -0,0 +1,43 @@
+from agent.domain.services.schema_retriever import RetrievedSchema
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache
+
+
+def _schema(name: str) -> RetrievedSchema:
+    return RetrievedSchema(table_name=name, document=f"Table: {name}", relevance_score=1.0, metadata={})
+
+
+def test_hit_uses_normalized_query():
+    cache = RetrievalCache(max_size=4)
+    cache.put("Total sales?", 5, [_schema("sales")], version=cache.version)
+
+    cached = cache.get("  total   SALES ", 5)
+    assert [s.table_name for s in cached] == ["sales"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_version_bump_invalidates():
+    cache = RetrievalCache(max_size=4)
+    cache.put("orders", 5, [_schema("orders")], version=cache.version)
+    cache.bump_version()
+
+    assert cache.get("orders", 5) is None
+
+
+def test_stale_put_is_dropped():
+    cache = RetrievalCache(max_size=4)
+    version = cache.version
+    cache.bump_version()
+    cache.put("orders", 5, [_schema("orders")], version=version)
+
+    assert cache.get("orders", 5) is None
+
+
+def test_lru_eviction():
+    cache = RetrievalCache(max_size=2)
+    for name in ("a", "b"):
+        cache.put(name, 5, [_schema(name)], version=cache.version)
+    cache.get("a", 5)
+    cache.put("c", 5, [_schema("c")], version=cache.version)
+
+    assert cache.get("b", 5) is None
+    assert cache.get("a", 5) is not None
@@ -0,0 +1,98 @@
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from agent.application.use_cases.generate_sql import GenerateSQLRequest, GenerateSQLUseCase
+from agent.domain.services.schema_retriever import JoinKey, RetrievedSchema
+from agent.domain.services.sql_generator import SQLGenerator
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.llm.context_builder import TokenBudgetContextBuilder
+from agent.infrastructure.llm.tokenizer import TokenCounter
+from tests.test_cost_guard import _MemoryRepository
+from tests.test_generate_sql import _StaticRetriever
+
+
+def _service() -> SchemaService:
+    # 컨텍스트 구성은 워커 스레드에서 실행되므로 인메모리 DB를 스레드 간 공유
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    filler = ", ".join(f"attr_{i:02d} TEXT" for i in range(60))
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.exec_driver_sql(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, "
+            "customer_id INTEGER REFERENCES customers(id), "
+            f"{filler}, shipping_city TEXT, ordered_at DATETIME)"
+        )
+    return SchemaService(engine)
+
+
+def _schemas(*names: str) -> list[RetrievedSchema]:
+    return [RetrievedSchema(name, f"Table: {name}.", 1.0, {}) for name in names]
+
+
+def test_foreign_keys_are_reflected():
+    column = {c.name: c for c in _service().get_table_info("orders").columns}["customer_id"]
+
+    assert column.foreign_key == "customers.id"
+
+
+def test_small_schema_is_rendered_in_full():
+    builder = TokenBudgetContextBuilder(_service(), max_tokens=10_000, token_counter=TokenCounter())
+    context = builder.build("orders per city", _schemas("orders"))
+
+    assert context.columns_included == context.columns_total == 64
+    assert "attr_59 TEXT" in context.text
+
+
+def test_wide_table_is_trimmed_to_budget_keeping_keys_and_relevant_columns():
+    counter = TokenCounter()
+    builder = TokenBudgetContextBuilder(_service(), max_tokens=120, token_counter=counter)
+    context = builder.build("How many orders shipped to each city last month?", _schemas("orders", "customers"))
+
+    assert counter.count(context.text) <= 120
+    assert context.tables == ["orders", "customers"]
+    assert "id INTEGER PK" in context.text
+    assert "customer_id INTEGER FK->customers.id" in context.text
+    assert "shipping_city TEXT" in context.text
+    assert "ordered_at DATETIME" in context.text  # 기간 표현 → 날짜 컬럼
+    assert "more" in context.text or "also:" in context.text
+    assert context.columns_included < context.columns_total
+    assert context.prompt_tokens > counter.count(context.text)
+
+
+def test_join_keys_are_rendered_for_included_tables():
+    schemas = _schemas("orders", "customers")
+    schemas[1].join_keys = [JoinKey("orders", "customer_id", "customers", "id")]
+    builder = TokenBudgetContextBuilder(_service(), max_tokens=120, token_counter=TokenCounter())
+
+    context = builder.build("orders per customer", schemas)
+
+    assert context.text.endswith("Join keys: orders.customer_id = customers.id")
+
+
+class _RecordingGenerator(SQLGenerator):
+    def __init__(self):
+        self.contexts: list[str] = []
+
+    def generate(self, user_query: str, schema_context: str) -> str:
+        self.contexts.append(schema_context)
+        return "SELECT 1"
+
+
+def test_use_case_reports_prompt_tokens_of_budgeted_context():
+    generator = _RecordingGenerator()
+    use_case = GenerateSQLUseCase(
+        query_log_repository=_MemoryRepository(),
+        sql_generator=generator,
+        schema_retriever=_StaticRetriever(),
+        context_builder=TokenBudgetContextBuilder(_service(), max_tokens=80, token_counter=TokenCounter()),
+    )
+
+    result = asyncio.run(use_case.aexecute(GenerateSQLRequest(user_query="orders by city")))
+
+    assert result.used_tables == ["orders"]
+    assert result.prompt_tokens is not None and result.prompt_tokens <= 80 + 10
+    assert "shipping_city" in generator.contexts[0]
@@ -0,0 +1,178 @@
+from sqlalchemy import create_engine, text
+
+from agent.application.services.schema_indexer import SchemaIndexer
+from agent.config import settings
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.vectorstore.retrieval_cache import RetrievalCache
+from agent.infrastructure.vectorstore.schema_retriever import ChromaSchemaRetriever
+
+
+class _FakeChroma:
+    """임베딩 없이 업서트/삭제만 기록하는 벡터 저장소."""
+
+    def __init__(self):
+        self.metadatas: dict[str, dict] = {}
+        self.upserted: list[str] = []
+        self.columns: dict[str, dict] = {}
+        self.upserted_columns: list[str] = []
+
+    def upsert_tables(self, table_names, documents, metadatas, batch_size=256):
+        self.upserted.extend(table_names)
+        self.metadatas.update(zip(table_names, metadatas))
+
+    def delete_tables(self, table_names):
+        for name in table_names:
+            self.metadatas.pop(name, None)
+
+    def get_fingerprints(self):
+        return {name: m.get("fingerprint") for name, m in self.metadatas.items()}
+
+    def upsert_columns(self, column_ids, documents, metadatas, batch_size=256):
+        self.upserted_columns.extend(column_ids)
+        self.columns.update(zip(column_ids, metadatas))
+
+    def delete_columns(self, column_ids):
+        for column_id in column_ids:
+            self.columns.pop(column_id, None)
+
+    def delete_table_columns(self, table_names):
+        self.columns = {k: m for k, m in self.columns.items() if m["table_name"] not in table_names}
+
+    def get_column_fingerprints(self, table_names=None):
+        return {
+            k: m["fingerprint"]
+            for k, m in self.columns.items()
+            if table_names is None or m["table_name"] in table_names
+        }
+
+
+def _indexer():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("CREATE TABLE orders (id INTEGER PRIMARY KEY)"))
+    service = SchemaService(engine)
+    chroma = _FakeChroma()
+    return SchemaIndexer(service, chroma_client=chroma, retrieval_cache=RetrievalCache()), service, chroma
+
+
+def test_sync_skips_unchanged_tables():
+    indexer, _, chroma = _indexer()
+    first = indexer.sync_all_tables()
+    assert sorted(first.added) == ["orders", "users"]
+
+    chroma.upserted.clear()
+    second = indexer.sync_all_tables()
+    assert second.embedded == 0
+    assert second.unchanged == 2
+    assert chroma.upserted == []
+
+
+def test_sync_embeds_changed_and_removes_dropped_tables():
+    indexer, service, chroma = _indexer()
+    indexer.sync_all_tables()
+    chroma.upserted.clear()
+
+    with service._engine.begin() as conn:
+        conn.execute(text("ALTER TABLE users ADD COLUMN email TEXT"))
+        conn.execute(text("DROP TABLE orders"))
+    service.refresh_metadata()
+
+    result = indexer.sync_all_tables()
+    assert result.updated == ["users"]
+    assert result.removed == ["orders"]
+    assert chroma.upserted == ["users"]
+    assert set(chroma.metadatas) == {"users"}
+
+
+def test_sync_reembeds_everything_when_embedding_model_changes(monkeypatch):
+    indexer, _, chroma = _indexer()
+    indexer.sync_all_tables()
+    chroma.upserted.clear()
+
+    monkeypatch.setattr(settings, "embedding_model", "paraphrase-multilingual-MiniLM-L12-v2")
+    result = indexer.sync_all_tables()
+
+    assert sorted(result.updated) == ["orders", "users"]
+    assert sorted(chroma.upserted) == ["orders", "users"]
+
+
+def _wide_indexer(monkeypatch):
+    monkeypatch.setattr(settings, "column_index_min_columns", 10)
+    engine = create_engine("sqlite://")
+    filler = ", ".join(f"attr_{i} TEXT" for i in range(12))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text(f"CREATE TABLE events (id INTEGER PRIMARY KEY, user_id INTEGER REFERENCES users(id), {filler})")
+        )
+    service = SchemaService(engine)
+    chroma = _FakeChroma()
+    return SchemaIndexer(service, chroma_client=chroma, retrieval_cache=RetrievalCache()), service, chroma
+
+
+def test_column_index_covers_wide_tables_and_updates_per_column(monkeypatch):
+    indexer, service, chroma = _wide_indexer(monkeypatch)
+    result = indexer.sync_all_tables()
+    assert result.columns_embedded == 14
+    assert {m["table_name"] for m in chroma.columns.values()} == {"events"}
+
+    chroma.upserted_columns.clear()
+    with service._engine.begin() as conn:
+        conn.execute(text("ALTER TABLE events ADD COLUMN country TEXT"))
+        conn.execute(text("ALTER TABLE events DROP COLUMN attr_0"))
+    service.refresh_metadata()
+
+    indexer.apply_changes(["events"], [])
+    assert chroma.upserted_columns == ["events.country"]
+    assert "events.attr_0" not in chroma.columns
+
+    indexer.apply_changes([], ["events"])
+    assert chroma.columns == {}
+
+
+class _SearchChroma:
+    """검색 결과를 고정해 두고 검색 질의를 기록하는 가짜 ChromaDB 클라이언트."""
+
+    def __init__(self, tables, columns=(), stored=None):
+        self.tables, self.columns = tables, list(columns)
+        self.stored = stored if stored is not None else {}
+        self.queries: list[str] = []
+
+    def search_many_with_columns(self, queries, top_k=5, column_top_k=40):
+        self.queries.extend(queries)
+        return [(self.tables, self.columns) for _ in queries]
+
+    def get_tables(self, table_names):
+        return [self.stored[name] for name in table_names if name in self.stored]
+
+
+def test_retriever_promotes_tables_matched_by_column_and_narrows_document(monkeypatch):
+    monkeypatch.setattr(settings, "column_index_min_columns", 10)
+    events = {
+        "table_name": "events",
+        "document": "Table: events. Columns: (full)",
+        "metadata": {
+            "column_count": 40,
+            "key_columns": "id,user_id",
+            "key_column_fragments": "id (INTEGER PK), user_id (INTEGER FK->users.id)",
+        },
+    }
+    chroma = _SearchChroma(
+        tables=[{"table_name": "users", "document": "Table: users.", "metadata": {}, "distance": 0.6}],
+        columns=[
+            {"table_name": "events", "column_name": name, "metadata": {"fragment": fragment}, "distance": d}
+            for name, fragment, d in [("country", "country (TEXT)", 0.2), ("user_id", "user_id (INTEGER)", 0.5)]
+        ],
+        stored={"events": events},
+    )
+
+    schemas = ChromaSchemaRetriever(chroma).retrieve("events by country", top_k=2)
+
+    assert [s.table_name for s in schemas] == ["events", "users"]
+    assert schemas[0].matched_columns == ["country", "user_id"]
+    assert schemas[0].document == (
+        "Table: events. Columns: id (INTEGER PK), user_id (INTEGER FK->users.id), country (TEXT) "
+        "(+37 more columns)"
+    )
+    assert schemas[1].document == "Table: users."
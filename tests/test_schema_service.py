@@ -0,0 +1,146 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from agent.infrastructure.database.schema_service import (
+    SchemaService,
+    _decode_table_cursor,
+    _encode_table_cursor,
+)
+from agent.presentation.api.schemas import ColumnDefinitionDTO, CreateTableRequestDTO
+
+
+def _service():
+    engine = create_engine("sqlite://")
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return SchemaService(engine), statements
+
+
+def _create(service: SchemaService, name: str) -> None:
+    service.create_table(
+        CreateTableRequestDTO(
+            table_name=name,
+            columns=[ColumnDefinitionDTO(name="id", type="INTEGER", is_primary_key=True)],
+        )
+    )
+
+
+def test_metadata_served_from_cache():
+    service, statements = _service()
+    _create(service, "users")
+    service.get_schema_context()
+
+    statements.clear()
+    assert service.get_schema_context() == "Tables:\n- users: id (INTEGER*)"
+    assert service.get_tables() == ["users"]
+    assert statements == []
+
+
+def test_ddl_invalidates_only_touched_table():
+    service, _ = _service()
+    _create(service, "users")
+    _create(service, "orders")
+    orders_info = service.get_table_info("orders")
+    service.get_table_info("users")
+
+    service.add_column("users", ColumnDefinitionDTO(name="email", type="TEXT"))
+
+    assert [c.name for c in service.get_table_info("users").columns] == ["id", "email"]
+    assert service.get_table_info("orders") is orders_info
+    assert service.metadata_cache.table_version("users") > service.metadata_cache.table_version("orders")
+
+
+def test_rename_updates_table_list():
+    service, _ = _service()
+    _create(service, "users")
+    service.get_tables()
+
+    service.rename_table("users", "members")
+
+    assert service.get_tables() == ["members"]
+    assert service.get_table_info("users") is None
+
+
+def _pages(service: SchemaService, table: str, **kwargs) -> list[dict]:
+    rows, cursor = [], None
+    for _ in range(20):  # 커서가 전진하지 않으면 무한 반복 대신 실패
+        page = service.get_table_data_page(table, limit=3, cursor=cursor, **kwargs)
+        rows.extend(page.rows)
+        cursor = page.next_cursor
+        if cursor is None:
+            return rows
+    raise AssertionError("cursor pagination did not terminate")
+
+
+def test_cursor_pagination_by_pk_rowid_and_indexed_column():
+    service, _ = _service()
+    with service._engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, score INTEGER NOT NULL, note TEXT)")
+        conn.exec_driver_sql("CREATE INDEX ix_items_score ON items (score)")
+        conn.exec_driver_sql("CREATE TABLE events (name TEXT)")
+        for i in range(10):
+            conn.exec_driver_sql(f"INSERT INTO items VALUES ({i}, {i % 4}, 'n{i}')")
+            conn.exec_driver_sql(f"INSERT INTO events VALUES ('e{i}')")
+
+    assert [r["id"] for r in _pages(service, "items")] == list(range(10))
+
+    by_score = _pages(service, "items", sort="score", descending=True)
+    assert [(r["score"], r["id"]) for r in by_score] == sorted(
+        ((i % 4, i) for i in range(10)), reverse=True
+    )
+
+    events = _pages(service, "events")
+    assert [r["name"] for r in events] == [f"e{i}" for i in range(10)]
+    assert "__rowid__" not in events[0]
+
+
+def test_cursor_pagination_rejects_unindexed_sort_and_foreign_cursor():
+    service, _ = _service()
+    with service._engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, note TEXT)")
+        for i in range(5):
+            conn.exec_driver_sql(f"INSERT INTO items VALUES ({i}, 'n{i}')")
+
+    with pytest.raises(ValueError):
+        service.get_table_data_page("items", sort="note")
+
+    cursor = service.get_table_data_page("items", limit=2).next_cursor
+    with pytest.raises(ValueError):
+        service.get_table_data_page("items", limit=2, cursor=cursor, descending=True)
+    with pytest.raises(ValueError):
+        service.get_table_data_page("items", cursor="not-a-cursor")
+
+
+
+def test_cursor_keeps_the_type_of_non_json_keys():
+    service, _ = _service()
+    with service._engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE blobs (id BLOB PRIMARY KEY, note TEXT)")
+        for i in range(7):
+            conn.exec_driver_sql(f"INSERT INTO blobs VALUES (x'00{i:02x}ff', 'n{i}')")
+
+    # BLOB 키가 "b'...'" 문자열로 바뀌면 두 번째 페이지부터 비교가 어긋남
+    assert [r["note"] for r in _pages(service, "blobs")] == [f"n{i}" for i in range(7)]
+
+    values = [b"\x00\xff", datetime.datetime(2024, 1, 2, 3, 4, 5), datetime.date(2024, 1, 2), Decimal("1.50"), 3]
+    cursor = _encode_table_cursor(values, ["a", "b", "c", "d", "e"], False)
+    assert _decode_table_cursor(cursor, ["a", "b", "c", "d", "e"], False) == values
+
+def test_sqlite_reflection_of_a_subset_matches_the_inspector():
+    service, statements = _service()
+    with service._engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE a (id INTEGER PRIMARY KEY, name VARCHAR(20) NOT NULL, v DOUBLE)")
+        conn.exec_driver_sql("CREATE TABLE b (id INTEGER PRIMARY KEY, a_id INT REFERENCES a(id), blob)")
+        conn.exec_driver_sql("CREATE TABLE c (id INTEGER PRIMARY KEY, flag BOOLEAN DEFAULT 0)")
+
+    statements.clear()
+    fast = service._reflect_table_infos(["b", "c"])
+    assert sorted(fast) == ["b", "c"]
+    # 하위 집합도 테이블 수와 무관하게 컬럼/FK 쿼리 두 번
+    assert len(statements) == 2 and all(" IN (" in s for s in statements)
+
+    # 공개 멀티 리플렉션(타입 해석 폴백 경로)과 같은 결과
+    assert service._reflect_multi_table_infos(["b", "c"]) == fast
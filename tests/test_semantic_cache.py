@@ -0,0 +1,66 @@
+from agent.infrastructure.llm.semantic_cache import SemanticSQLCache
+
+
+def _fake_embed(text: str) -> list[float]:
+    # 단어 집합 기반의 결정적 임베딩 (어순 무관)
+    vocab = ["total", "sales", "last", "month", "month's", "users", "count"]
+    words = set(text.replace("'s", "").split())
+    return [1.0 if w.replace("'s", "") in words else 0.0 for w in vocab]
+
+
+def test_similar_question_hits():
+    cache = SemanticSQLCache(embed_fn=_fake_embed, max_size=8, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store("total sales last month", ["sales"], "SELECT SUM(amount) FROM sales")
+
+    assert cache.lookup("last month's total sales", ["sales"]) == "SELECT SUM(amount) FROM sales"
+    assert cache.stats()["hits"] == 1
+
+
+def test_different_table_set_misses():
+    cache = SemanticSQLCache(embed_fn=_fake_embed, max_size=8, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store("total sales last month", ["sales"], "SELECT 1")
+
+    assert cache.lookup("total sales last month", ["sales", "users"]) is None
+
+
+def test_ddl_invalidation_and_ttl():
+    cache = SemanticSQLCache(embed_fn=_fake_embed, max_size=8, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store("count users", ["users"], "SELECT COUNT(*) FROM users")
+    cache.store("total sales", ["sales"], "SELECT SUM(amount) FROM sales")
+
+    assert cache.invalidate_tables(["USERS"]) == 1
+    assert cache.lookup("count users", ["users"]) is None
+
+    expired = SemanticSQLCache(embed_fn=_fake_embed, max_size=8, ttl_seconds=0, similarity_threshold=0.9)
+    expired.store("total sales", ["sales"], "SELECT 1")
+    assert expired.lookup("total sales", ["sales"]) is None
+
+
+def test_questions_differing_only_in_literals_miss():
+    # 리터럴을 무시하는 임베딩: 숫자/날짜만 다른 질문은 유사도 1.0
+    def embed(text):
+        return _fake_embed("".join(c for c in text if not c.isdigit()))
+
+    cache = SemanticSQLCache(embed_fn=embed, max_size=8, ttl_seconds=60, similarity_threshold=0.9)
+    cache.store("top 5 users by sales count", ["sales", "users"], "SELECT ... LIMIT 5")
+    cache.store("total sales in 2023", ["sales"], "SELECT ... WHERE year = 2023")
+
+    assert cache.lookup("top 10 users by sales count", ["sales", "users"]) is None
+    assert cache.lookup("top five users by sales count", ["sales", "users"]) == "SELECT ... LIMIT 5"
+    assert cache.lookup("total sales in 2024", ["sales"]) is None
+    assert cache.lookup("2023 total sales", ["sales"]) == "SELECT ... WHERE year = 2023"
+
+
+def test_store_is_skipped_when_tables_were_invalidated_during_generation():
+    cache = SemanticSQLCache(embed_fn=_fake_embed, max_size=8, ttl_seconds=60, similarity_threshold=0.9)
+    epoch = cache.epoch(["users"])
+    cache.invalidate_tables(["users"])  # LLM 호출 중 DDL
+    cache.store("count users", ["users"], "SELECT COUNT(*) FROM users", epoch)
+
+    assert cache.lookup("count users", ["users"]) is None
+    assert cache.stats()["stale_skips"] == 1
+
+    epoch = cache.epoch(["users"])
+    cache.invalidate_tables(["sales"])  # 다른 테이블의 DDL은 영향 없음
+    cache.store("count users", ["users"], "SELECT COUNT(*) FROM users", epoch)
+    assert cache.lookup("count users", ["users"]) == "SELECT COUNT(*) FROM users"
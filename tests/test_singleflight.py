@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from agent.shared.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "SELECT 1"
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("q", work) for _ in range(10)))
+        return flight, results
+
+    flight, results = asyncio.run(main())
+
+    assert calls == 1
+    assert [r for r, _ in results] == ["SELECT 1"] * 10
+    assert sum(shared for _, shared in results) == 9
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "coalesced": 9}
+
+
+def test_error_propagates_and_key_is_released():
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("llm down")
+
+    async def ok():
+        return "ok"
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("q", fail), flight.do("q", fail), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        return await flight.do("q", ok)
+
+    assert asyncio.run(main()) == ("ok", False)
+
+
+def test_leader_cancellation_does_not_cancel_followers():
+    async def work():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def main():
+        flight = SingleFlight()
+        leader = asyncio.ensure_future(flight.do("q", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("q", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == (42, True)
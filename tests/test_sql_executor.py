@@ -0,0 +1,131 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from agent.infrastructure.database.schema_service import SchemaService
+from agent.infrastructure.database.sql_executor import (
+    QueryResultCache,
+    SQLExecutor,
+    ensure_read_only,
+    normalize_sql,
+)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT * FROM items",
+        "  with t as (select 1) select * from t; ",
+        "SELECT 'DROP TABLE items' AS note -- delete\n",
+        'SELECT "update" FROM items',
+        # 키워드와 같은 이름의 컬럼/테이블
+        "SELECT lock, copy, call FROM items",
+        "SELECT i.merge, max(i.lock) FROM merge AS i JOIN copy c ON c.call = i.id GROUP BY i.merge",
+        "WITH t AS (SELECT lock FROM items), u AS (SELECT * FROM t) SELECT update_count, lock FROM u",
+        "WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s WHERE i < 3) SELECT i AS delete FROM s",
+    ],
+)
+def test_read_only_guard_accepts_selects(sql):
+    ensure_read_only(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "DELETE FROM items",
+        "SELECT 1; DROP TABLE items",
+        "WITH d AS (DELETE FROM items RETURNING *) SELECT * FROM d",
+        "SELECT * INTO backup FROM items",
+        "PRAGMA table_info(items)",
+        "WITH a AS (SELECT 1), b AS MATERIALIZED (UPDATE items SET lock = 1 RETURNING *) SELECT * FROM b",
+        "WITH t AS (SELECT id FROM items) DELETE FROM items WHERE id IN (SELECT id FROM t)",
+        "WITH t(id) AS (SELECT 1) INSERT INTO items SELECT id FROM t",
+        "SELECT * FROM items FOR UPDATE",
+    ],
+)
+def test_read_only_guard_rejects_writes(sql):
+    with pytest.raises(ValueError):
+        ensure_read_only(sql)
+
+
+def test_normalize_sql_keeps_literals():
+    assert normalize_sql("SELECT  *\n FROM t -- c\n WHERE a = 'x  y';") == "SELECT * FROM t WHERE a = 'x  y'"
+
+
+def _executor(rows: int = 10, **kwargs):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        for i in range(rows):
+            conn.exec_driver_sql(f"INSERT INTO items VALUES ({i}, 'n{i}')")
+    service = SchemaService(engine)
+    return service, SQLExecutor(engine, service, chunk_rows=3, **kwargs)
+
+
+def test_streams_chunks_and_truncates():
+    _, executor = _executor()
+    events = list(executor.stream(executor.prepare("SELECT id, name FROM items ORDER BY id", max_rows=7)))
+
+    assert events[0] == {"event": "columns", "columns": ["id", "name"]}
+    assert [len(e["rows"]) for e in events[1:-1]] == [3, 3, 1]
+    assert events[1]["rows"][0] == [0, "n0"]
+    assert events[-1]["event"] == "done"
+    assert (events[-1]["row_count"], events[-1]["truncated"]) == (7, True)
+
+
+def test_writes_are_blocked_by_connection():
+    service, executor = _executor()
+    # 키워드 검사를 우회해도 query_only 연결에서는 실패해야 함
+    plan = executor.prepare("SELECT 1")
+    plan.sql = "INSERT INTO items VALUES (100, 'x')"
+    events = list(executor.stream(plan))
+
+    assert events[-1]["event"] == "error"
+    assert service.get_table_data("items").rows.__len__() == 10
+    # 연결은 다시 쓰기 가능한 상태로 반환됨
+    service.add_row("items", {"id": 100, "name": "x"})
+
+
+def test_timeout_interrupts_long_query():
+    _, executor = _executor(timeout_seconds=0.05)
+    sql = "WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s) SELECT COUNT(*) FROM s"
+    events = list(executor.stream(executor.prepare(sql)))
+
+    assert events[-1]["event"] == "error"
+    assert "interrupt" in events[-1]["message"]
+
+
+def test_result_cache_invalidated_by_data_version():
+    service, executor = _executor(cache=QueryResultCache(max_size=8, ttl_seconds=60))
+    sql = "SELECT COUNT(*) FROM items"
+
+    first = list(executor.stream(executor.prepare(sql)))
+    second = list(executor.stream(executor.prepare(sql + " ;")))
+    assert (first[-1]["cached"], second[-1]["cached"]) == (False, True)
+    assert second[1]["rows"] == [[10]]
+
+    service.add_row("items", {"id": 100, "name": "x"})
+    third = list(executor.stream(executor.prepare(sql)))
+    assert third[-1]["cached"] is False
+    assert third[1]["rows"] == [[11]]
+
+
+def test_timeout_ignores_time_spent_by_a_slow_reader():
+    _, executor = _executor(timeout_seconds=0.05)
+    with executor._engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE big (n INTEGER)")
+        conn.exec_driver_sql(
+            "INSERT INTO big WITH RECURSIVE s(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM s WHERE n < 5000) "
+            "SELECT n FROM s"
+        )
+    # 행마다 big 전체를 훑어 진행 핸들러가 매 fetch마다 호출되도록 함
+    sql = "SELECT id, (SELECT count(*) FROM big WHERE big.n > items.id) FROM items ORDER BY id"
+    events = []
+    for event in executor.stream(executor.prepare(sql)):
+        events.append(event)
+        time.sleep(0.03)  # 클라이언트가 느리게 읽는 동안은 제한 시간에 포함하지 않음
+
+    assert [e["event"] for e in events] == ["columns", "rows", "rows", "rows", "rows", "done"]
+    assert events[-1]["row_count"] == 10
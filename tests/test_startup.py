@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ["chromadb", "langchain_openai", "langchain_core", "sentence_transformers", "torch"]
+
+# 첫 연결 수락까지 허용하는 시간 (무거운 의존성이 다시 임포트 경로에 들어오면 초과)
+FIRST_CONNECTION_BUDGET_S = 10.0
+
+
+def _load_bench_startup():
+    spec = importlib.util.spec_from_file_location("bench_startup", ROOT / "benchmarks" / "bench_startup.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_importing_main_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, agent.main; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=str(ROOT / "src")),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_fast_startup_accepts_connections_before_warmup():
+    result = _load_bench_startup().measure_startup(background=True)
+
+    assert result["first_connection_s"] < FIRST_CONNECTION_BUDGET_S
+    assert result["first_connection_s"] <= result["ready_s"]
+    assert set(result["components"]) == {
+        "database", "embedding_model", "vector_store", "schema_index", "llm_client"
+    }
+
+
+def test_schema_warmup_reuses_services_created_by_an_earlier_request(monkeypatch):
+    from agent.application.services.schema_indexer import IndexSyncResult
+    from agent.infrastructure import warmup
+    from agent.infrastructure.database import globals as schema_globals
+
+    class _Indexer:
+        syncs = 0
+
+        def sync_all_tables(self):
+            self.syncs += 1
+            return IndexSyncResult()
+
+    service, worker, indexer = object(), object(), _Indexer()
+    monkeypatch.setattr(schema_globals, "_schema_service", service)
+    monkeypatch.setattr(schema_globals, "_index_worker", worker)
+    monkeypatch.setattr(schema_globals, "_schema_indexer", indexer)
+
+    warmup._warm_schema_index()
+
+    # 첫 요청이 만든 SchemaService/IndexWorker를 그대로 두고 동기화만 수행
+    assert schema_globals.get_global_schema_service() is service
+    assert schema_globals.get_global_index_worker() is worker
+    assert indexer.syncs == 1
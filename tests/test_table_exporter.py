@@ -0,0 +1,68 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy import create_engine
+
+from agent.infrastructure.database.table_exporter import TableExporter
+
+
+def _exporter(rows: int = 10) -> TableExporter:
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price NUMERIC, created_at DATETIME)"
+        )
+        for i in range(rows):
+            conn.exec_driver_sql(
+                f"INSERT INTO items VALUES ({i}, 'item,{i}', {i}.5, '2026-01-0{i % 9 + 1} 10:00:00.000000')"
+            )
+    return TableExporter(engine, chunk_rows=3)
+
+
+def test_csv_streams_in_chunks_with_projection():
+    exporter = _exporter()
+    chunks = list(exporter.stream(exporter.prepare("items", "csv", ["id", "name"])))
+
+    assert len(chunks) == 4  # 10행 / 청크 3행
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == ["id", "name"]
+    assert rows[1:3] == [["0", "item,0"], ["1", "item,1"]]
+    assert len(rows) == 11
+
+
+def test_ndjson_gzip_round_trip():
+    exporter = _exporter()
+    plan = exporter.prepare("items", "ndjson", compress=True)
+    lines = gzip.decompress(b"".join(exporter.stream(plan))).decode().splitlines()
+
+    assert plan.filename == "items.ndjson.gz"
+    assert json.loads(lines[1]) == {
+        "id": 1,
+        "name": "item,1",
+        "price": 1.5,
+        "created_at": "2026-01-02 10:00:00.000000",  # 저장된 값 그대로
+    }
+    assert len(lines) == 10
+
+
+def test_empty_table_csv_has_header_only():
+    exporter = _exporter(rows=0)
+    assert b"".join(exporter.stream(exporter.prepare("items", "csv"))) == b"id,name,price,created_at\r\n"
+
+
+def test_unknown_column_is_rejected():
+    with pytest.raises(ValueError):
+        _exporter().prepare("items", "csv", ["missing"])
+
+
+def test_arrow_stream():
+    pa = pytest.importorskip("pyarrow")
+    exporter = _exporter()
+    data = b"".join(exporter.stream(exporter.prepare("items", "arrow")))
+
+    table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 10
+    assert table.schema.field("id").type == pa.int64()